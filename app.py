@@ -5,77 +5,691 @@ Supports multiple games from the 2024 season
 """
 
 import os
+import sys
 import json
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
-from flask import Flask, render_template, jsonify, request
+import gzip
+import time
+import queue
+import random
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from flask import (
+    Flask, Response, abort, g, has_request_context, render_template, jsonify, request, send_from_directory,
+    stream_with_context
+)
+from urllib.parse import urlencode
+from game_series import GameSeries, category_code, category_name, game_slug
+from season_bundle import SeasonBundle, build_bundle
+from season_snapshot import CURRENT_NAME, SeasonSnapshot, snapshot_key, bundle_name, current_generation, write_snapshot
+from sparkline import render_sparkline
+from downsample import downsample_indices
+from seasons import DEFAULT_SEASON, is_season, list_seasons, season_dir
+import drive_store
+import metrics
+import profiling
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; responses fall back to gzip
+    brotli = None
 
 app = Flask(__name__)
 
-def load_games_index():
+# Directory holding the game data: seasons/<season>/ partitions and/or a
+# top-level games_index.json and games_data/ for the default season (see
+# seasons.py). Defaults to this directory; relative paths are resolved
+# against it.
+DATA_DIR = os.environ.get('DATA_DIR', '')
+
+# Process-wide LRU cache of parsed game files, keyed by season and the
+# game's file slug. Entries are revalidated against the file's mtime/size on
+# every lookup.
+GAME_CACHE_SIZE = int(os.environ.get('GAME_CACHE_SIZE', 64))
+_game_cache = OrderedDict()
+_game_cache_lock = threading.Lock()
+_game_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+# Optional binary season bundle built by `python season_bundle.py build`.
+# When set, games of the default season are read from the memory-mapped
+# bundle instead of the per-game JSON files. Relative paths are resolved
+# against this directory. The drive store and season snapshot below also
+# cover the default season only.
+SEASON_BUNDLE = os.environ.get('SEASON_BUNDLE', '')
+_bundle_state = {}
+_bundle_lock = threading.Lock()
+
+# Optional SQLite drive store built by `python drive_store.py build`. Setting
+# DRIVE_STORE enables /api/drives/query; DRIVE_STORE_READS=1 also serves
+# per-game reads from the store instead of the JSON files.
+DRIVE_STORE = os.environ.get('DRIVE_STORE', '')
+DRIVE_STORE_READS = os.environ.get('DRIVE_STORE_READS', '').lower() in ('1', 'true', 'yes')
+_drive_store_local = threading.local()
+
+# Optional shared season snapshot built by `python season_snapshot.py build`.
+# Workers map its bundle and pre-rendered figures read-only instead of
+# caching their own copies, and follow new generations as they are published.
+SEASON_SNAPSHOT = os.environ.get('SEASON_SNAPSHOT', '')
+_snapshot_state = {}
+_snapshot_lock = threading.Lock()
+
+# Rendered figure responses, keyed by route plus the content hashes of the
+# game files they were built from. Values hold the pre-encoded JSON body.
+FIGURE_CACHE_SIZE = int(os.environ.get('FIGURE_CACHE_SIZE', 128))
+_figure_cache = OrderedDict()
+_figure_cache_lock = threading.Lock()
+_figure_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'snapshot_hits': 0}
+
+# Per-game comparison subplot fragments, keyed by (opponent, content hash),
+# and comparison layouts keyed by grid shape, subplot titles and y-range
+_comparison_fragments = OrderedDict()
+_comparison_layouts = OrderedDict()
+_comparison_lock = threading.Lock()
+COMPARISON_LAYOUT_CACHE_SIZE = 8
+
+# Comparison grid sparklines, keyed by (opponent, content hash). Each entry
+# holds the game's plot points and its SVG at the last shared y-range used.
+_sparklines = OrderedDict()
+_sparkline_lock = threading.Lock()
+
+# Live game feeds poll each game file at this interval (seconds) while
+# someone is subscribed, and send a keepalive comment when idle this long
+LIVE_POLL_INTERVAL = float(os.environ.get('LIVE_POLL_INTERVAL', 2))
+LIVE_HEARTBEAT = float(os.environ.get('LIVE_HEARTBEAT', 15))
+_live_feeds = {}
+_live_feeds_lock = threading.Lock()
+
+# Season indexes are read on first request and kept in a small LRU cache,
+# revalidated like game files, so memory doesn't grow with the seasons kept
+SEASON_CACHE_SIZE = int(os.environ.get('SEASON_CACHE_SIZE', 4))
+_games_index_cache = OrderedDict()
+_games_index_lock = threading.Lock()
+_games_index_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+# Browsers and proxies may reuse an API response for this many seconds
+# before revalidating it with If-None-Match / If-Modified-Since.
+API_CACHE_MAX_AGE = int(os.environ.get('API_CACHE_MAX_AGE', 0))
+PLOT_TEMPLATE_MAX_AGE = int(os.environ.get('PLOT_TEMPLATE_MAX_AGE', 86400))
+
+# Prometheus-style instrumentation, served at /metrics when METRICS=1.
+# Each worker process keeps and reports its own counters.
+METRICS = os.environ.get('METRICS', '').lower() in ('1', 'true', 'yes')
+REQUEST_SECONDS = metrics.REGISTRY.register(metrics.Histogram(
+    'drive_api_request_duration_seconds',
+    'Time until the response is returned, by route',
+    ('route',)
+))
+REQUESTS = metrics.REGISTRY.register(metrics.Counter(
+    'drive_api_requests_total',
+    'Requests served, by route and HTTP status',
+    ('route', 'status')
+))
+REQUEST_ERRORS = metrics.REGISTRY.register(metrics.Counter(
+    'drive_api_request_errors_total',
+    'Failed requests by route; reason is the HTTP status, or "failed" or "exception" for success: false',
+    ('route', 'reason')
+))
+RESPONSE_BYTES = metrics.REGISTRY.register(metrics.Counter(
+    'drive_api_response_bytes_total',
+    'Response body bytes, by route and content coding (streamed bodies excluded)',
+    ('route', 'encoding')
+))
+LOAD_ERRORS = metrics.REGISTRY.register(metrics.Counter(
+    'drive_api_load_errors_total',
+    'Failures reading the games index or game data, by source',
+    ('source',)
+))
+
+# Opt-in request profiling. With PROFILE_SECRET set, a request carrying a
+# valid ?profile= token (from `python profiling.py sign PATH`) is profiled;
+# PROFILE_SAMPLE_RATE=N also profiles about one request in N. Profiles are
+# written to PROFILE_DIR as .prof (cProfile) or .collapsed (stack samples).
+PROFILE_SECRET = os.environ.get('PROFILE_SECRET', '')
+PROFILE_SAMPLE_RATE = int(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+PROFILE_DIR = os.environ.get('PROFILE_DIR', 'profiles')
+PROFILE_FORMAT = os.environ.get('PROFILE_FORMAT', 'prof')
+PROFILE_KEEP = int(os.environ.get('PROFILE_KEEP', 200))
+PROFILING = bool(PROFILE_SECRET or PROFILE_SAMPLE_RATE)
+
+# Game files for batch requests are read and parsed on this shared pool
+BATCH_LOAD_WORKERS = int(os.environ.get('BATCH_LOAD_WORKERS', 8))
+_batch_executor = ThreadPoolExecutor(max_workers=BATCH_LOAD_WORKERS, thread_name_prefix='game-load')
+
+def data_dir():
+    """
+    Return the directory holding the game data for every season
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, DATA_DIR)
+
+def season_data_dir(season=None):
+    """
+    Return the directory holding one season's games_index.json and games_data/
+    """
+    return season_dir(data_dir(), season or DEFAULT_SEASON)
+
+def available_seasons():
+    """
+    Return every season with a games index, newest first
+    """
+    return list_seasons(data_dir())
+
+@metrics.timed('load')
+def load_games_index_record(season=None):
     """
-    Load the index of all available games
+    Load a season's games index with its content hash and mtime, or None if missing
     """
+    season = season or DEFAULT_SEASON
     try:
-        # Get the current directory of the script
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        games_index_path = os.path.join(base_dir, 'games_index.json')
+        if not is_season(season):
+            raise ValueError(f"invalid season {season!r}")
+        games_index_path = os.path.join(season_data_dir(season), 'games_index.json')
+        
+        file_stat = os.stat(games_index_path)
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        
+        with _games_index_lock:
+            entry = _games_index_cache.get(season)
+            if entry is not None and entry['stamp'] == stamp:
+                _games_index_cache.move_to_end(season)
+                _games_index_stats['hits'] += 1
+                return entry
+        
+        with open(games_index_path, 'rb') as f:
+            raw = f.read()
+        games_index = json.loads(raw)
+        entry = {
+            'stamp': stamp,
+            'version': hashlib.sha1(raw).hexdigest(),
+            'data': games_index,
+            'registry': build_game_registry(games_index)
+        }
+        
+        with _games_index_lock:
+            _games_index_stats['misses'] += 1
+            _games_index_cache[season] = entry
+            _games_index_cache.move_to_end(season)
+            while len(_games_index_cache) > SEASON_CACHE_SIZE:
+                _games_index_cache.popitem(last=False)
+                _games_index_stats['evictions'] += 1
         
-        with open(games_index_path, 'r') as f:
-            return json.load(f)
+        return entry
     except FileNotFoundError:
-        print("Games index file not found. Please run scrape_all_games.py first.")
-        return {}
+        print(f"Games index file not found for the {season} season. Please run scrape_all_games.py first.")
+        LOAD_ERRORS.inc('index')
+        return None
     except Exception as e:
         print(f"Error loading games index: {e}")
-        return {}
+        LOAD_ERRORS.inc('index')
+        return None
+
+def load_games_index(season=None):
+    """
+    Load the index of all available games in a season
+    """
+    record = load_games_index_record(season)
+    return record['data'] if record else {}
+
+def get_season_cache_stats():
+    """
+    Return hit/miss/eviction counters and current size of the season index cache
+    """
+    with _games_index_lock:
+        stats = dict(_games_index_stats)
+        stats['size'] = len(_games_index_cache)
+    stats['max_size'] = SEASON_CACHE_SIZE
+    return stats
+
+def default_opponent(season=None):
+    """
+    Return the game a request without an opponent gets: the season's first
+    """
+    games = load_games_index(season).get('games', [])
+    return games[0]['opponent'] if games else 'Wheeling University'
+
+def build_game_registry(games_index):
+    """
+    Map every accepted spelling of each indexed game to its game handle
+
+    Keys are lower-cased and cover the canonical opponent name, the display
+    name, the file slug, the URL slug, the boxscore ID and any "aliases"
+    listed in the index entry.
+    """
+    registry = {}
+    for game in games_index.get('games', []):
+        opponent_name = game['opponent']
+        slug = game_slug(opponent_name)
+        
+        # URLs look like .../stats/2024/wheeling-university/boxscore/14044
+        url_parts = game.get('url', '').rstrip('/').split('/')
+        url_slug = boxscore_id = None
+        if len(url_parts) >= 3 and url_parts[-2] == 'boxscore':
+            url_slug, boxscore_id = url_parts[-3], url_parts[-1]
+        
+        handle = {
+            'opponent': opponent_name,
+            'slug': slug,
+            'filename': f"game_{slug}.json",
+            'url_slug': url_slug,
+            'boxscore_id': boxscore_id
+        }
+        names = [opponent_name, game.get('display_name'), slug, url_slug, boxscore_id]
+        names.extend(game.get('aliases', []))
+        for name in names:
+            if name:
+                registry.setdefault(name.strip().lower(), handle)
+    return registry
+
+def resolve_game(name, season=None):
+    """
+    Look up the game handle for an opponent name, alias, slug or boxscore ID
+
+    Returns None for names that are not in the season's games_index.json,
+    without touching the filesystem beyond the (cached) index itself.
+    """
+    if not name:
+        return None
+    index_record = load_games_index_record(season)
+    if not index_record:
+        return None
+    return index_record['registry'].get(name.strip().lower())
+
+def canonical_opponent(name, season=None):
+    """
+    Return the index's opponent name for a request parameter, or the
+    parameter unchanged if it does not match any game
+    """
+    game = resolve_game(name, season)
+    return game['opponent'] if game else name
+
+def load_season_bundle():
+    """
+    Return the memory-mapped season bundle, reopening it if the file changed
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    bundle_path = os.path.join(base_dir, SEASON_BUNDLE)
+    
+    file_stat = os.stat(bundle_path)
+    stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    
+    with _bundle_lock:
+        if _bundle_state.get('stamp') == stamp:
+            return _bundle_state
+    
+    bundle = SeasonBundle(bundle_path)
+    with _bundle_lock:
+        # The previous mapping is released once no GameSeries references it
+        _bundle_state.update(stamp=stamp, bundle=bundle, records={})
+        return _bundle_state
+
+def season_bundle_current():
+    """
+    Return False if games_index.json is newer than the season bundle
+
+    The scraper writes games_index.json last, so a newer index means games
+    were re-scraped without rebuilding the bundle. The JSON files are served
+    until the bundle is rebuilt.
+    """
+    index_record = load_games_index_record()
+    try:
+        state = load_season_bundle()
+    except OSError:
+        return True  # load_bundle_record() reports the missing bundle
+    if index_record is None or index_record['stamp'][0] <= state['stamp'][0]:
+        return True
+    with _bundle_lock:
+        if state.get('stale_index') != index_record['stamp']:
+            state['stale_index'] = index_record['stamp']
+            print(f"Season bundle {SEASON_BUNDLE} is older than games_index.json; "
+                  f"serving the JSON files until it is rebuilt")
+    return False
+
+def load_season_snapshot():
+    """
+    Return the current season snapshot, switching when a new generation is published
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    snapshot_dir = os.path.join(base_dir, SEASON_SNAPSHOT)
+    
+    # CURRENT is replaced atomically, so a new inode means a new generation
+    file_stat = os.stat(os.path.join(snapshot_dir, CURRENT_NAME))
+    stamp = (file_stat.st_ino, file_stat.st_mtime_ns)
+    
+    with _snapshot_lock:
+        state = _snapshot_state.get('current')
+        if state is not None and state['stamp'] == stamp:
+            return state
+    
+    snapshot = SeasonSnapshot(snapshot_dir)
+    with _snapshot_lock:
+        # Requests already holding the previous state finish against it
+        state = _snapshot_state['current'] = {
+            'stamp': stamp,
+            'generation': snapshot.generation,
+            'snapshot': snapshot,
+            'bundle': snapshot.bundle,
+            'records': {}
+        }
+        return state
+
+def snapshot_figure(key):
+    """
+    Return a figure cache entry from the season snapshot, or None if absent
+    """
+    try:
+        entry = load_season_snapshot()['snapshot'].figure(snapshot_key(key))
+    except Exception as e:
+        print(f"Error reading season snapshot: {e}")
+        LOAD_ERRORS.inc('snapshot')
+        return None
+    if entry is None or (brotli is not None and 'br' not in entry['encoded']):
+        return None
+    return entry
 
-def load_game_data(opponent_name):
+def load_bundle_record(opponent_name):
     """
-    Load drive data for a specific game
+    Load a game record from the season bundle, returning None if absent
     """
     try:
-        # Get the current directory of the script
+        state = load_season_snapshot() if SEASON_SNAPSHOT else load_season_bundle()
+        key = game_slug(opponent_name)
+        record = state['records'].get(key)
+        if record is None:
+            record = state['bundle'].game_record(opponent_name)
+            if record is None:
+                print(f"Game {opponent_name} not found in season bundle")
+                return None
+            state['records'][key] = record
+        return record
+    except Exception as e:
+        print(f"Error loading {opponent_name} from season bundle: {e}")
+        LOAD_ERRORS.inc('bundle')
+        return None
+
+def get_drive_store():
+    """
+    Return this thread's read-only connection to the SQLite drive store
+    """
+    conn = getattr(_drive_store_local, 'conn', None)
+    if conn is None:
         base_dir = os.path.dirname(os.path.abspath(__file__))
+        conn = drive_store.connect(os.path.join(base_dir, DRIVE_STORE), readonly=True)
+        _drive_store_local.conn = conn
+    return conn
+
+def get_cached_game(game_key, stamp):
+    """
+    Return the cached record for a game if it is still at the given stamp
+    """
+    with _game_cache_lock:
+        entry = _game_cache.get(game_key)
+        if entry is not None and entry['stamp'] == stamp:
+            _game_cache.move_to_end(game_key)
+            _game_cache_stats['hits'] += 1
+            return entry
+    return None
+
+def cache_game(game_key, entry, store=True):
+    """
+    Insert a freshly loaded game record, evicting the least recently used
+
+    With store=False the miss is counted but the record is not kept.
+    """
+    with _game_cache_lock:
+        _game_cache_stats['misses'] += 1
+        if not store:
+            return entry
+        _game_cache[game_key] = entry
+        _game_cache.move_to_end(game_key)
+        while len(_game_cache) > GAME_CACHE_SIZE:
+            _game_cache.popitem(last=False)
+            _game_cache_stats['evictions'] += 1
+    return entry
+
+def load_store_record(opponent_name, cache=True):
+    """
+    Load a game record from the SQLite drive store, returning None if absent
+    """
+    try:
+        conn = get_drive_store()
+        game_key = game_slug(opponent_name)
+        
+        meta = drive_store.game_version(conn, opponent_name)
+        if meta is None:
+            print(f"Game {opponent_name} not found in drive store")
+            return None
+        version, mtime_ns = meta
+        stamp = (mtime_ns, version)
+        
+        entry = get_cached_game(game_key, stamp)
+        if entry is not None:
+            return entry
+        
+        loaded = drive_store.load_game(conn, opponent_name)
+        if loaded is None:
+            return None
+        version, mtime_ns, drives = loaded
+        return cache_game(game_key, {
+            'stamp': (mtime_ns, version),
+            'version': version,
+            'data': GameSeries.from_records(drives)
+        }, store=cache)
+    except Exception as e:
+        print(f"Error loading {opponent_name} from drive store: {e}")
+        LOAD_ERRORS.inc('store')
+        return None
+
+@metrics.timed('load')
+def load_game_record(opponent_name, cache=True, season=None):
+    """
+    Load a game and its content hash, returning None if it is unavailable
+
+    Parsed games are kept in a bounded in-process cache and only re-read
+    when the file's mtime or size changes. The returned record is shared
+    between requests and must be treated as read-only. cache=False still
+    uses a cached copy if present but does not add new games to the cache,
+    for one-off scans over many games.
+    """
+    season = season or DEFAULT_SEASON
+    game = resolve_game(opponent_name, season)
+    if game is None:
+        print(f"Unknown opponent {opponent_name!r} in the {season} season")
+        return None
+    
+    if season == DEFAULT_SEASON:
+        if SEASON_SNAPSHOT or (SEASON_BUNDLE and season_bundle_current()):
+            return load_bundle_record(game['opponent'])
+        if DRIVE_STORE and DRIVE_STORE_READS:
+            return load_store_record(game['opponent'], cache)
+    
+    try:
+        # Only paths from the registry ever reach the filesystem
+        game_key = (season, game['slug'])
+        filepath = os.path.join(season_data_dir(season), 'games_data', game['filename'])
         
-        # Convert opponent name to filename format
-        filename = f"game_{opponent_name.lower().replace(' ', '_')}.json"
-        filepath = os.path.join(base_dir, 'games_data', filename)
+        file_stat = os.stat(filepath)
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
         
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        entry = get_cached_game(game_key, stamp)
+        if entry is not None:
+            return entry
+        
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        return cache_game(game_key, {
+            'stamp': stamp,
+            'version': hashlib.sha1(raw).hexdigest(),
+            'data': GameSeries.from_records(json.loads(raw))
+        }, store=cache)
     except FileNotFoundError:
         print(f"Game data file not found for {opponent_name}")
-        return []
+        LOAD_ERRORS.inc('json')
+        return None
     except Exception as e:
         print(f"Error loading game data for {opponent_name}: {e}")
-        return []
+        LOAD_ERRORS.inc('json')
+        return None
 
-def create_score_differential_plot(drive_data, opponent_name):
+def load_game_data(opponent_name, season=None):
     """
-    Create a Plotly graph showing score differential over time
+    Load drive data for a specific game as a GameSeries ([] if unavailable)
     """
-    if not drive_data:
+    record = load_game_record(opponent_name, season=season)
+    return record['data'] if record else []
+
+def get_game_cache_stats():
+    """
+    Return hit/miss/eviction counters and current size of the game data cache
+    """
+    with _game_cache_lock:
+        stats = dict(_game_cache_stats)
+        stats['size'] = len(_game_cache)
+    stats['max_size'] = GAME_CACHE_SIZE
+    return stats
+
+def clear_game_cache():
+    """
+    Drop every cached game and reset the cache counters
+    """
+    with _game_cache_lock:
+        _game_cache.clear()
+        for key in _game_cache_stats:
+            _game_cache_stats[key] = 0
+
+def clear_figure_cache():
+    """
+    Drop every rendered figure, comparison fragment and sparkline, and reset
+    the figure cache counters
+    """
+    with _figure_cache_lock:
+        _figure_cache.clear()
+        for key in _figure_cache_stats:
+            _figure_cache_stats[key] = 0
+    with _comparison_lock:
+        _comparison_fragments.clear()
+        _comparison_layouts.clear()
+    with _sparkline_lock:
+        _sparklines.clear()
+
+def figure_caches_bypassed():
+    """
+    True during a signed profiled request, which builds every figure,
+    fragment and sparkline afresh so its profile shows the work
+    """
+    return has_request_context() and g.get('bypass_figure_caches', False)
+
+def get_cached_figure(key, build):
+    """
+    Return the cached response body for key, calling build() on a miss
+
+    build() returns the JSON-serializable response payload, or None if no
+    figure could be made (in which case nothing is cached). Figures held
+    by the season snapshot are served from it and never cached per process.
+    """
+    bypass = figure_caches_bypassed()
+    if SEASON_SNAPSHOT and not bypass:
+        entry = snapshot_figure(key)
+        if entry is not None:
+            with _figure_cache_lock:
+                _figure_cache_stats['snapshot_hits'] += 1
+            return entry
+    
+    with _figure_cache_lock:
+        entry = None if bypass else _figure_cache.get(key)
+        if entry is not None:
+            _figure_cache.move_to_end(key)
+            _figure_cache_stats['hits'] += 1
+            return entry
+    
+    with metrics.phase('figure_build'):
+        payload = build()
+    if payload is None:
         return None
+    with metrics.phase('encode'):
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        entry = {'body': body, 'encoded': compress_body(body)}
+    if bypass:
+        return entry
+    
+    with _figure_cache_lock:
+        _figure_cache_stats['misses'] += 1
+        _figure_cache[key] = entry
+        _figure_cache.move_to_end(key)
+        while len(_figure_cache) > FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+            _figure_cache_stats['evictions'] += 1
     
-    # Extract data for plotting and ensure proper sorting, filtering out problematic entries
+    return entry
+
+def compress_body(body):
+    """
+    Precompress a response body with every supported content coding
+    """
+    encoded = {'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded['br'] = brotli.compress(body, quality=11)
+    return encoded
+
+def choose_encoding():
+    """
+    Pick the best precompressed content coding the client accepts, if any
+    """
+    offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+    encoding = request.accept_encodings.best_match(offered)
+    return encoding if encoding in offered else None
+
+def get_figure_cache_stats():
+    """
+    Return hit/miss/eviction counters and current size of the figure cache
+    """
+    with _figure_cache_lock:
+        stats = dict(_figure_cache_stats)
+        stats['size'] = len(_figure_cache)
+    stats['max_size'] = FIGURE_CACHE_SIZE
+    return stats
+
+def extract_plot_points(drive_data):
+    """
+    Extract sorted (minutes, differential, MU score, opponent score, team, result)
+    points for plotting, bracketed by game start and game end points
+
+    Accepts a GameSeries or a list of drive dicts.
+    """
     plot_data = []
-    for drive in drive_data:
-        # Skip entries that are not valid drives (Game Start, Game End, or incomplete entries)
-        if (drive['team'] in ['Game Start', 'Game End'] or 
-            drive['result'] in ['Game Start', 'Game End'] or
-            not drive.get('play_description', '').strip()):
-            continue
-            
-        plot_data.append((
-            drive['elapsed_seconds'] / 60,  # Convert to minutes
-            drive['score_differential'], 
-            drive['mercyhurst_score'], 
-            drive['opponent_score'], 
-            drive['team'], 
-            drive['result']
-        ))
+    if isinstance(drive_data, GameSeries):
+        elapsed = drive_data.elapsed_seconds
+        differentials = drive_data.score_differential
+        mercyhurst_scores = drive_data.mercyhurst_score
+        opponent_scores = drive_data.opponent_score
+        team_codes = drive_data.team_codes
+        result_codes = drive_data.result_codes
+        for i in drive_data.plot_indices():
+            plot_data.append((
+                elapsed[i] / 60,  # Convert to minutes
+                differentials[i],
+                mercyhurst_scores[i],
+                opponent_scores[i],
+                category_name(team_codes[i]),
+                category_name(result_codes[i])
+            ))
+    else:
+        for drive in drive_data:
+            # Skip entries that are not valid drives (Game Start, Game End, or incomplete entries)
+            if (drive['team'] in ['Game Start', 'Game End'] or 
+                drive['result'] in ['Game Start', 'Game End'] or
+                not drive.get('play_description', '').strip()):
+                continue
+                
+            plot_data.append((
+                drive['elapsed_seconds'] / 60,  # Convert to minutes
+                drive['score_differential'], 
+                drive['mercyhurst_score'], 
+                drive['opponent_score'], 
+                drive['team'], 
+                drive['result']
+            ))
     
     # Sort by elapsed time to ensure proper ordering
     plot_data.sort(key=lambda x: x[0])
@@ -92,20 +706,56 @@ def create_score_differential_plot(drive_data, opponent_name):
         # Add game end point at the end
         plot_data.append((60, final_differential, final_merc_score, final_opp_score, 'Game End', 'Game End'))
     
-    elapsed_times = [item[0] for item in plot_data]
-    differentials = [item[1] for item in plot_data]
-    mercyhurst_scores = [item[2] for item in plot_data]
-    opponent_scores = [item[3] for item in plot_data]
-    teams = [item[4] for item in plot_data]
-    results = [item[5] for item in plot_data]
+    return plot_data
+
+# Smallest max_points budget a plot request may ask for
+MIN_PLOT_POINTS = 3
+
+def plot_budget(record, max_points):
+    """
+    Normalize a requested max_points for one game
+
+    Returns None when the game already fits the budget (or none was given),
+    so those requests share the full-resolution cache entry.
+    """
+    if max_points is None:
+        return None
+    max_points = max(MIN_PLOT_POINTS, max_points)
+    point_count = len(record['data'].plot_indices()) + 2  # plus start/end markers
+    return max_points if max_points < point_count else None
+
+def downsample_plot_points(plot_data, max_points):
+    """
+    Reduce plot points to about max_points with LTTB, keeping every score change
+
+    A point where either score changes, and the point just before it, are
+    always kept, so the chart never misplaces a score. This can exceed the
+    budget when a game has more scoring changes than max_points.
+    """
+    if not max_points or len(plot_data) <= max_points:
+        return plot_data
     
-    # Create the plot
-    fig = go.Figure()
+    must_include = set()
+    for i in range(1, len(plot_data)):
+        if plot_data[i][2:4] != plot_data[i - 1][2:4]:
+            must_include.update((i - 1, i))
     
-    # Add the main line with explicit control
-    fig.add_trace(go.Scatter(
-        x=elapsed_times,
-        y=differentials,
+    indices = downsample_indices(
+        [item[0] for item in plot_data],
+        [item[1] for item in plot_data],
+        max_points,
+        must_include
+    )
+    return [plot_data[i] for i in indices]
+
+# Quarter boundaries (in minutes) and labels drawn on the single game plot
+QUARTER_MARKERS = [(0, 'Start'), (15, 'Q2'), (30, 'Q3'), (45, 'Q4'), (60, 'End')]
+
+def single_game_trace_style():
+    """
+    Styling shared by the server-built and client-assembled single game trace
+    """
+    return dict(
         mode='lines+markers',
         name='Score Differential',
         line=dict(color='#003366', width=3, shape='linear'),  # Mercyhurst blue
@@ -115,17 +765,16 @@ def create_score_differential_plot(drive_data, opponent_name):
         hovertemplate='<b>Time:</b> %{x:.1f} minutes<br>' +
                      '<b>Differential:</b> %{y}<br>' +
                      '<b>Score:</b> MU %{customdata[0]} - %{customdata[1]}<br>' +
-                     '<b>Drive:</b> %{customdata[2]} %{customdata[3]}<extra></extra>',
-        customdata=list(zip(mercyhurst_scores, opponent_scores, teams, results))
-    ))
-    
-    # Add horizontal line at y=0
-    fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
-    
-    # Update layout
-    fig.update_layout(
+                     '<b>Drive:</b> %{customdata[2]} %{customdata[3]}<extra></extra>'
+    )
+
+def single_game_layout(opponent_name, season=None):
+    """
+    Layout settings for the single game score differential plot
+    """
+    return dict(
         title={
-            'text': f'Mercyhurst vs {opponent_name} - Score Differential Over Time<br>2024 Season',
+            'text': f'Mercyhurst vs {opponent_name} - Score Differential Over Time<br>{season or DEFAULT_SEASON} Season',
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 20, 'color': '#003366'}
@@ -139,12 +788,46 @@ def create_score_differential_plot(drive_data, opponent_name):
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)'
     )
+
+def create_score_differential_plot(drive_data, opponent_name, max_points=None, season=None):
+    """
+    Create a Plotly graph showing score differential over time
+
+    max_points optionally downsamples the series (see downsample_plot_points).
+    """
+    import plotly.graph_objects as go
     
-    # Add quarter markers
-    quarter_times = [0, 15, 30, 45, 60]  # 15 minutes per quarter
-    quarter_labels = ['Start', 'Q2', 'Q3', 'Q4', 'End']
+    if not drive_data:
+        return None
+    
+    plot_data = downsample_plot_points(extract_plot_points(drive_data), max_points)
+    
+    elapsed_times = [item[0] for item in plot_data]
+    differentials = [item[1] for item in plot_data]
+    mercyhurst_scores = [item[2] for item in plot_data]
+    opponent_scores = [item[3] for item in plot_data]
+    teams = [item[4] for item in plot_data]
+    results = [item[5] for item in plot_data]
+    
+    # Create the plot
+    fig = go.Figure()
+    
+    # Add the main line with explicit control
+    fig.add_trace(go.Scatter(
+        x=elapsed_times,
+        y=differentials,
+        customdata=list(zip(mercyhurst_scores, opponent_scores, teams, results)),
+        **single_game_trace_style()
+    ))
     
-    for i, (time, label) in enumerate(zip(quarter_times, quarter_labels)):
+    # Add horizontal line at y=0
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
+    
+    # Update layout
+    fig.update_layout(**single_game_layout(opponent_name, season))
+    
+    # Add quarter markers
+    for i, (time, label) in enumerate(QUARTER_MARKERS):
         if time <= max(elapsed_times) and i > 0:
             fig.add_vline(x=time, line_dash="dot", line_color="red", opacity=0.3)
             fig.add_annotation(
@@ -157,29 +840,122 @@ def create_score_differential_plot(drive_data, opponent_name):
     
     return fig
 
-def get_game_summary(drive_data, opponent_name):
+def create_plot_template(season=None):
     """
-    Generate a summary of the game from drive data
+    Build the game-independent parts of the single game plot
+
+    The client fills in the opponent name, the per-game series from
+    /api/plot?format=columnar, and keeps only the quarter markers that fall
+    inside the game, placing their labels 2 points above the highest
+    differential (as create_score_differential_plot does).
     """
-    if not drive_data:
-        return {}
-    
-    final_drive = drive_data[-1]
+    import plotly.graph_objects as go
     
-    # Count drives by team
-    mercyhurst_drives = len([d for d in drive_data if d['team'] == 'Mercyhurst'])
-    opponent_drives = len([d for d in drive_data if d['team'] == opponent_name])
+    placeholder = '{opponent}'
+    fig = go.Figure()
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.update_layout(**single_game_layout(placeholder, season))
     
-    # Count scoring types
-    mercyhurst_tds = len([d for d in drive_data if d['team'] == 'Mercyhurst' and d['result'] == 'Touchdown'])
-    mercyhurst_fgs = len([d for d in drive_data if d['team'] == 'Mercyhurst' and d['result'] == 'Field Goal'])
-    opponent_tds = len([d for d in drive_data if d['team'] == opponent_name and d['result'] == 'Touchdown'])
-    opponent_fgs = len([d for d in drive_data if d['team'] == opponent_name and d['result'] == 'Field Goal'])
+    quarter_times = []
+    for i, (time, label) in enumerate(QUARTER_MARKERS):
+        if i > 0:
+            quarter_times.append(time)
+            fig.add_vline(x=time, line_dash="dot", line_color="red", opacity=0.3)
+            fig.add_annotation(
+                x=time,
+                y=0,
+                text=label,
+                showarrow=False,
+                font=dict(size=12, color="red")
+            )
     
     return {
-        'opponent_name': opponent_name,
-        'final_score': {
-            'mercyhurst': final_drive['mercyhurst_score'],
+        'layout': json.loads(encode_figure(fig))['layout'],
+        'trace': go.Scatter(**single_game_trace_style()).to_plotly_json(),
+        'quarter_times': quarter_times,
+        'opponent_placeholder': placeholder
+    }
+
+def create_plot_series(drive_data, max_points=None):
+    """
+    Extract the per-game arrays for a client-assembled score differential plot
+
+    Team and result strings are sent as indices into a per-game category
+    list, and times as elapsed seconds (the client divides by 60).
+    max_points optionally downsamples the series.
+    """
+    plot_data = downsample_plot_points(extract_plot_points(drive_data), max_points)
+    if not plot_data:
+        return None
+    
+    categories = []
+    category_index = {}
+    
+    def code(value):
+        if value not in category_index:
+            category_index[value] = len(categories)
+            categories.append(value)
+        return category_index[value]
+    
+    return {
+        'elapsed_seconds': [round(item[0] * 60) for item in plot_data],
+        'differential': [item[1] for item in plot_data],
+        'mercyhurst_score': [item[2] for item in plot_data],
+        'opponent_score': [item[3] for item in plot_data],
+        'team': [code(item[4]) for item in plot_data],
+        'result': [code(item[5]) for item in plot_data],
+        'categories': categories
+    }
+
+@metrics.timed('summarize')
+def get_game_summary(drive_data, opponent_name):
+    """
+    Generate a summary of the game from drive data
+    """
+    if not drive_data:
+        return {}
+    
+    if isinstance(drive_data, GameSeries):
+        # Single pass over the interned team/result codes
+        mercyhurst = category_code('Mercyhurst')
+        opponent = category_code(opponent_name)
+        touchdown = category_code('Touchdown')
+        field_goal = category_code('Field Goal')
+        mercyhurst_drives = opponent_drives = 0
+        mercyhurst_tds = mercyhurst_fgs = opponent_tds = opponent_fgs = 0
+        for team, result in zip(drive_data.team_codes, drive_data.result_codes):
+            if team == mercyhurst:
+                mercyhurst_drives += 1
+                mercyhurst_tds += result == touchdown
+                mercyhurst_fgs += result == field_goal
+            if team == opponent:
+                opponent_drives += 1
+                opponent_tds += result == touchdown
+                opponent_fgs += result == field_goal
+        
+        last = len(drive_data) - 1
+        final_drive = {
+            'mercyhurst_score': drive_data.mercyhurst_score[last],
+            'opponent_score': drive_data.opponent_score[last],
+            'score_differential': drive_data.score_differential[last]
+        }
+    else:
+        final_drive = drive_data[-1]
+        
+        # Count drives by team
+        mercyhurst_drives = len([d for d in drive_data if d['team'] == 'Mercyhurst'])
+        opponent_drives = len([d for d in drive_data if d['team'] == opponent_name])
+        
+        # Count scoring types
+        mercyhurst_tds = len([d for d in drive_data if d['team'] == 'Mercyhurst' and d['result'] == 'Touchdown'])
+        mercyhurst_fgs = len([d for d in drive_data if d['team'] == 'Mercyhurst' and d['result'] == 'Field Goal'])
+        opponent_tds = len([d for d in drive_data if d['team'] == opponent_name and d['result'] == 'Touchdown'])
+        opponent_fgs = len([d for d in drive_data if d['team'] == opponent_name and d['result'] == 'Field Goal'])
+    
+    return {
+        'opponent_name': opponent_name,
+        'final_score': {
+            'mercyhurst': final_drive['mercyhurst_score'],
             'opponent': final_drive['opponent_score']
         },
         'final_differential': final_drive['score_differential'],
@@ -192,18 +968,92 @@ def get_game_summary(drive_data, opponent_name):
         }
     }
 
-def create_comparison_plots(games_data):
+# Number of subplot columns in the comparison grid
+COMPARISON_COLS = 3
+
+def comparison_trace_style(opponent_name):
     """
-    Create smaller plots for all games to display in a comparison view
+    Styling for one game's trace in the comparison grid
+    """
+    return dict(
+        mode='lines+markers',
+        name=f'vs {opponent_name}',
+        line=dict(color='#003366', width=2),
+        marker=dict(size=4, color='#003366'),
+        showlegend=False,
+        hovertemplate=f'<b>{opponent_name}</b><br>' +
+                     '<b>Time:</b> %{x:.1f} min<br>' +
+                     '<b>Differential:</b> %{y}<br>' +
+                     f'<b>Score:</b> MU %{{customdata[0]}} - %{{customdata[1]}}<extra></extra>'
+    )
+
+def comparison_y_range(global_min, global_max):
+    """
+    Shared y-axis range for the comparison grid, padded around the extrema
+    """
+    if global_min is None:
+        return [-10, 10]  # Default range if no data
+    padding = max(2, (global_max - global_min) * 0.1)  # 10% padding, minimum 2 points
+    return [global_min - padding, global_max + padding]
+
+def create_comparison_skeleton(rows, subplot_titles, season=None):
+    """
+    Create the comparison figure without traces or y-axis ranges
     """
     from plotly.subplots import make_subplots
     
+    cols = COMPARISON_COLS
+    fig = make_subplots(
+        rows=rows, 
+        cols=cols,
+        subplot_titles=list(subplot_titles),
+        # About 96px between rows; a fixed 0.08 of the height is too much
+        # for make_subplots once there are more than 13 rows
+        vertical_spacing=min(0.08, 0.32 / rows),
+        horizontal_spacing=0.05
+    )
+    
+    # Add horizontal line at y=0 for each subplot that has a game
+    for i in range(len(subplot_titles)):
+        fig.add_hline(
+            y=0, line_dash="dash", line_color="gray", opacity=0.3,
+            row=i // cols + 1, col=i % cols + 1, exclude_empty_subplots=False
+        )
+    
+    # Update layout
+    fig.update_layout(
+        title={
+            'text': f'Mercyhurst Football {season or DEFAULT_SEASON} Season - All Games Comparison<br>Score Differential Over Time',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18, 'color': '#003366'}
+        },
+        template='plotly_white',
+        height=300 * rows,  # Adjust height based on number of rows
+        width=1400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    # Update x and y axes for all subplots with fixed ranges
+    for i in range(1, rows * cols + 1):
+        fig.update_xaxes(title_text="Time (min)", range=[0, 60], row=(i-1)//cols + 1, col=(i-1)%cols + 1)
+        fig.update_yaxes(title_text="Score Diff", row=(i-1)//cols + 1, col=(i-1)%cols + 1)
+    
+    return fig
+
+def create_comparison_plots(games_data, season=None):
+    """
+    Create smaller plots for all games to display in a comparison view
+    """
+    import plotly.graph_objects as go
+    
     if not games_data:
         return None
     
     # Calculate grid dimensions
     num_games = len(games_data)
-    cols = 3  # 3 columns
+    cols = COMPARISON_COLS
     rows = (num_games + cols - 1) // cols  # Calculate rows needed
     
     # First pass: calculate global min and max differentials across all games
@@ -218,35 +1068,10 @@ def create_comparison_plots(games_data):
             continue
             
         # Extract and filter data (same logic as main plot)
-        plot_data = []
-        for drive in drive_data:
-            if (drive['team'] in ['Game Start', 'Game End'] or 
-                drive['result'] in ['Game Start', 'Game End'] or
-                not drive.get('play_description', '').strip()):
-                continue
-                
-            plot_data.append((
-                drive['elapsed_seconds'] / 60,
-                drive['score_differential'], 
-                drive['mercyhurst_score'], 
-                drive['opponent_score'], 
-                drive['team'], 
-                drive['result']
-            ))
+        plot_data = extract_plot_points(drive_data)
         
         if not plot_data:
             continue
-            
-        # Sort by elapsed time
-        plot_data.sort(key=lambda x: x[0])
-        
-        # Add game start and end points
-        final_differential = plot_data[-1][1]
-        final_merc_score = plot_data[-1][2]
-        final_opp_score = plot_data[-1][3]
-        
-        plot_data.insert(0, (0, 0, 0, 0, 'Game Start', 'Game Start'))
-        plot_data.append((60, final_differential, final_merc_score, final_opp_score, 'Game End', 'Game End'))
         
         # Collect all differentials for global scale calculation
         differentials = [item[1] for item in plot_data]
@@ -260,21 +1085,12 @@ def create_comparison_plots(games_data):
     
     # Calculate global y-axis range with some padding
     if all_differentials:
-        global_min = min(all_differentials)
-        global_max = max(all_differentials)
-        padding = max(2, (global_max - global_min) * 0.1)  # 10% padding, minimum 2 points
-        y_range = [global_min - padding, global_max + padding]
+        y_range = comparison_y_range(min(all_differentials), max(all_differentials))
     else:
-        y_range = [-10, 10]  # Default range if no data
+        y_range = comparison_y_range(None, None)
     
     # Create subplots
-    fig = make_subplots(
-        rows=rows, 
-        cols=cols,
-        subplot_titles=[f"vs {game['opponent']}" for game in processed_games_data],
-        vertical_spacing=0.08,
-        horizontal_spacing=0.05
-    )
+    fig = create_comparison_skeleton(rows, [f"vs {game['opponent']}" for game in processed_games_data], season)
     
     # Second pass: create plots with processed data
     for i, game_data in enumerate(processed_games_data):
@@ -294,163 +1110,1339 @@ def create_comparison_plots(games_data):
             go.Scatter(
                 x=elapsed_times,
                 y=differentials,
-                mode='lines+markers',
-                name=f'vs {opponent_name}',
-                line=dict(color='#003366', width=2),
-                marker=dict(size=4, color='#003366'),
-                showlegend=False,
-                hovertemplate=f'<b>{opponent_name}</b><br>' +
-                             '<b>Time:</b> %{x:.1f} min<br>' +
-                             '<b>Differential:</b> %{y}<br>' +
-                             f'<b>Score:</b> MU %{{customdata[0]}} - %{{customdata[1]}}<extra></extra>',
-                customdata=list(zip(mercyhurst_scores, opponent_scores))
+                customdata=list(zip(mercyhurst_scores, opponent_scores)),
+                **comparison_trace_style(opponent_name)
             ),
             row=row, col=col
         )
+    
+    fig.update_yaxes(range=y_range)
+    
+    return fig
+
+def comparison_fragment(opponent_name, record):
+    """
+    Return the cached comparison subplot fragment for one game version
+
+    A fragment holds the game's trace already encoded as JSON (without its
+    axis references, which depend on grid position) and the game's own
+    differential extrema. It is None-valued if the game has no scoring plays.
+    """
+    import plotly.graph_objects as go
+    
+    key = (opponent_name, record['version'])
+    bypass = figure_caches_bypassed()
+    with _comparison_lock:
+        fragment = None if bypass else _comparison_fragments.get(key)
+        if fragment is not None:
+            _comparison_fragments.move_to_end(key)
+            return fragment
+    
+    plot_data = extract_plot_points(record['data'])
+    if plot_data:
+        differentials = [item[1] for item in plot_data]
+        trace = go.Scatter(
+            x=[item[0] for item in plot_data],
+            y=differentials,
+            customdata=[(item[2], item[3]) for item in plot_data],
+            **comparison_trace_style(opponent_name)
+        )
+        fragment = {
+            'trace_json': encode_figure(trace),
+            'min': min(differentials),
+            'max': max(differentials)
+        }
+    else:
+        fragment = {'trace_json': None, 'min': None, 'max': None}
+    if bypass:
+        return fragment
+    
+    with _comparison_lock:
+        _comparison_fragments[key] = fragment
+        while len(_comparison_fragments) > FIGURE_CACHE_SIZE:
+            _comparison_fragments.popitem(last=False)
+    
+    return fragment
+
+def comparison_layout_json(rows, subplot_titles, y_range, season=None):
+    """
+    Return the encoded comparison layout for a grid and shared y-range
+
+    The expensive make_subplots skeleton is cached per grid shape and set of
+    titles; applying a new y-range only re-encodes the layout.
+    """
+    key = (rows, subplot_titles, season or DEFAULT_SEASON)
+    bypass = figure_caches_bypassed()
+    with _comparison_lock:
+        cached = None if bypass else _comparison_layouts.get(key)
+        if cached is not None:
+            _comparison_layouts.move_to_end(key)
+            if cached['y_range'] == y_range:
+                return cached['layout_json']
+    
+    if cached is None:
+        skeleton = json.loads(encode_figure(create_comparison_skeleton(rows, subplot_titles, season)))['layout']
+    else:
+        skeleton = cached['skeleton']
+    
+    layout = dict(skeleton)
+    for name, axis in skeleton.items():
+        if name.startswith('yaxis'):
+            layout[name] = dict(axis, range=y_range)
+    layout_json = json.dumps(layout)
+    if bypass:
+        return layout_json
+    
+    with _comparison_lock:
+        _comparison_layouts[key] = {'skeleton': skeleton, 'y_range': y_range, 'layout_json': layout_json}
+        while len(_comparison_layouts) > COMPARISON_LAYOUT_CACHE_SIZE:
+            _comparison_layouts.popitem(last=False)
+    
+    return layout_json
+
+def create_comparison_plot_json(season_records, season=None):
+    """
+    Assemble the comparison figure JSON from cached per-game fragments
+
+    Equivalent to encoding create_comparison_plots(), but a changed or added
+    game only rebuilds its own trace; the season extrema are folded from the
+    per-game extrema, and the layout is rebuilt only if the grid or the
+    shared y-range changed.
+    """
+    if not season_records:
+        return None
+    
+    cols = COMPARISON_COLS
+    rows = (len(season_records) + cols - 1) // cols
+    
+    games = []
+    global_min = global_max = None
+    for opponent_name, record in season_records:
+        if not record['data']:
+            continue
+        fragment = comparison_fragment(opponent_name, record)
+        if fragment['trace_json'] is None:
+            continue
+        games.append((opponent_name, fragment))
+        if global_min is None or fragment['min'] < global_min:
+            global_min = fragment['min']
+        if global_max is None or fragment['max'] > global_max:
+            global_max = fragment['max']
+    
+    traces = []
+    for i, (_, fragment) in enumerate(games):
+        suffix = '' if i == 0 else str(i + 1)
+        traces.append(f'{{"xaxis": "x{suffix}", "yaxis": "y{suffix}", ' + fragment['trace_json'][1:])
+    
+    subplot_titles = tuple(f"vs {opponent_name}" for opponent_name, _ in games)
+    layout_json = comparison_layout_json(rows, subplot_titles, comparison_y_range(global_min, global_max), season)
+    
+    return '{"data": [' + ', '.join(traces) + '], "layout": ' + layout_json + '}'
+
+def sparkline_entry(opponent_name, record):
+    """
+    Return the cached sparkline points and extrema for one game version
+
+    Built from the same points as the Plotly figures, without importing Plotly.
+    """
+    key = (opponent_name, record['version'])
+    bypass = figure_caches_bypassed()
+    with _sparkline_lock:
+        entry = None if bypass else _sparklines.get(key)
+        if entry is not None:
+            _sparklines.move_to_end(key)
+            return entry
+    
+    points = [(item[0], item[1]) for item in extract_plot_points(record['data'])]
+    differentials = [item[1] for item in points]
+    entry = {
+        'points': points,
+        'min': min(differentials) if points else None,
+        'max': max(differentials) if points else None,
+        'svgs': {}
+    }
+    if bypass:
+        return entry
+    
+    with _sparkline_lock:
+        _sparklines[key] = entry
+        while len(_sparklines) > FIGURE_CACHE_SIZE:
+            _sparklines.popitem(last=False)
+    
+    return entry
+
+def game_sparkline(opponent_name, entry, y_range):
+    """
+    Return a game's SVG sparkline drawn at the shared y-range
+    """
+    key = tuple(y_range)
+    svg = entry['svgs'].get(key)
+    if svg is None:
+        svg = render_sparkline(entry['points'], y_range, f"vs {opponent_name}")
+        # Only the current season range is worth keeping
+        entry['svgs'] = {key: svg}
+    return svg
+
+def create_comparison_grid(season_records):
+    """
+    Build the comparison grid: one SVG sparkline per game on a shared y-range
+
+    Uses the same season-wide y-range as the Plotly comparison figure, so
+    thumbnails are directly comparable.
+    """
+    games = []
+    global_min = global_max = None
+    for opponent_name, record in season_records:
+        if not record['data']:
+            continue
+        entry = sparkline_entry(opponent_name, record)
+        if not entry['points']:
+            continue
+        games.append((opponent_name, entry))
+        if global_min is None or entry['min'] < global_min:
+            global_min = entry['min']
+        if global_max is None or entry['max'] > global_max:
+            global_max = entry['max']
+    
+    if not games:
+        return None
+    
+    y_range = comparison_y_range(global_min, global_max)
+    return {
+        'y_range': y_range,
+        'games': [
+            {
+                'opponent': opponent_name,
+                'final_differential': entry['points'][-1][1],
+                'svg': game_sparkline(opponent_name, entry, y_range)
+            }
+            for opponent_name, entry in games
+        ]
+    }
+
+def encode_figure(fig):
+    """
+    Serialize a Plotly figure to its JSON string
+    """
+    import plotly.utils
+    return plotly.utils.PlotlyJSONEncoder().encode(fig)
+
+def budget_key(max_points):
+    """
+    Figure cache key suffix for a plot budget (empty at full resolution)
+    """
+    return (max_points,) if max_points else ()
+
+def render_plot(opponent, record=None, max_points=None, season=None):
+    """
+    Return the cached /api/plot response for a game, or None if unavailable
+
+    max_points should already be normalized with plot_budget(); each budget
+    is cached separately.
+    """
+    season = season or DEFAULT_SEASON
+    if record is None:
+        record = load_game_record(opponent, season=season)
+    if not record or not record['data']:
+        return None
+    
+    def build():
+        fig = create_score_differential_plot(record['data'], opponent, max_points, season)
+        if not fig:
+            return None
+        return {
+            'success': True,
+            'plot': encode_figure(fig),
+            'opponent': opponent
+        }
+    
+    return get_cached_figure(('plot', season, opponent, record['version']) + budget_key(max_points), build)
+
+def render_plot_series(opponent, record, max_points=None):
+    """
+    Return the cached /api/plot?format=columnar response for a game
+    """
+    def build():
+        series = create_plot_series(record['data'], max_points)
+        if not series:
+            return None
+        return {
+            'success': True,
+            'format': 'columnar',
+            'series': series,
+            'opponent': opponent
+        }
+    
+    return get_cached_figure(('plot-columnar', opponent, record['version']) + budget_key(max_points), build)
+
+def render_plot_template(season=None):
+    """
+    Return the cached /api/plot-template response for a season
+    """
+    season = season or DEFAULT_SEASON
+    return get_cached_figure(('plot-template', season), lambda: {
+        'success': True,
+        'template': create_plot_template(season)
+    })
+
+@metrics.timed('load')
+def load_season_records(season=None):
+    """
+    Load the (opponent, record) pairs for every indexed game that has data
+    """
+    games_index = load_games_index(season)
+    season_records = []
+    for game in games_index.get('games', []):
+        opponent_name = game['opponent']
+        record = load_game_record(opponent_name, season=season)
+        if record and record['data']:  # Only include games with data
+            season_records.append((opponent_name, record))
+    return season_records
+
+def render_comparison_plot(season_records, season=None):
+    """
+    Return the cached /api/comparison-plot response for a season
+    """
+    season = season or DEFAULT_SEASON
+    
+    def build():
+        plot_json = create_comparison_plot_json(season_records, season)
+        if not plot_json:
+            return None
+        return {
+            'success': True,
+            'plot': plot_json,
+            'games_count': len(season_records)
+        }
+    
+    return get_cached_figure(comparison_key(season_records, season), build)
+
+def render_comparison_grid(season_records):
+    """
+    Return the cached /api/comparison-grid response for a season
+    """
+    def build():
+        grid = create_comparison_grid(season_records)
+        if not grid:
+            return None
+        return {
+            'success': True,
+            'y_range': grid['y_range'],
+            'games': grid['games'],
+            'games_count': len(grid['games'])
+        }
+    
+    return get_cached_figure(comparison_grid_key(season_records), build)
+
+def comparison_grid_key(season_records):
+    """
+    Figure cache key for the comparison grid of a season
+    """
+    return ('comparison-grid', tuple((name, record['version']) for name, record in season_records))
+
+def comparison_key(season_records, season=None):
+    """
+    Figure cache key for the comparison figure of a season
+    """
+    return ('comparison', season or DEFAULT_SEASON, tuple((name, record['version']) for name, record in season_records))
+
+@metrics.timed('load')
+def load_game_records(opponents, season=None):
+    """
+    Load several games of a season concurrently, returning records in the
+    given order
+
+    Missing games map to None.
+    """
+    return list(_batch_executor.map(lambda opponent_name: load_game_record(opponent_name, season=season), opponents))
+
+def render_batch(games, max_points=None):
+    """
+    Return the cached /api/games/batch response for (opponent, record) pairs
+
+    max_points is the requested plot budget; it is normalized per game.
+    """
+    def build():
+        return {
+            'success': True,
+            'games': [
+                {
+                    'opponent': opponent_name,
+                    'version': record['version'],
+                    'data': record['data'].to_records(),
+                    'summary': get_game_summary(record['data'], opponent_name),
+                    'total_drives': len(record['data']),
+                    'series': create_plot_series(record['data'], plot_budget(record, max_points))
+                }
+                for opponent_name, record in games if record
+            ],
+            'missing': [opponent_name for opponent_name, record in games if not record]
+        }
+    
+    return get_cached_figure(batch_key(games) + budget_key(max_points), build)
+
+def batch_key(games):
+    """
+    Figure cache key for a batch of (opponent, record) pairs
+    """
+    return ('batch', tuple((name, record['version'] if record else None) for name, record in games))
+
+def warm_figure_cache():
+    """
+    Build every per-game figure and the season comparison figure up front
+    """
+    season_records = load_season_records()
+    for opponent_name, _ in season_records:
+        render_plot(opponent_name)
+    if season_records:
+        render_comparison_plot(season_records)
+    print(f"Warmed figure cache for {len(season_records)} games")
+
+def build_season_snapshot(snapshot_dir):
+    """
+    Build and publish the next season snapshot generation
+
+    Packs the default season into a new bundle, renders every per-game
+    figure and one-game batch, the plot template, the comparison figure and
+    the all-games batch from that bundle, and publishes them together.
+    Returns (generation, figure count).
+    """
+    generation = current_generation(snapshot_dir) + 1
+    bundle_path = os.path.join(snapshot_dir, bundle_name(generation))
+    build_bundle(season_data_dir(DEFAULT_SEASON), bundle_path)
+    bundle = SeasonBundle(bundle_path)
+    
+    games_list = load_games_index().get('games', [])
+    games = [(game['opponent'], bundle.game_record(game['opponent'])) for game in games_list]
+    season_records = [(name, record) for name, record in games if record and record['data']]
+    
+    figures = {}
+    
+    def add(key, entry):
+        if entry:
+            figures[snapshot_key(key)] = entry
+    
+    add(('plot-template', DEFAULT_SEASON), render_plot_template())
+    for opponent_name, record in season_records:
+        add(('plot', DEFAULT_SEASON, opponent_name, record['version']), render_plot(opponent_name, record))
+        add(('plot-columnar', opponent_name, record['version']), render_plot_series(opponent_name, record))
+    if season_records:
+        add(comparison_key(season_records), render_comparison_plot(season_records))
+        add(comparison_grid_key(season_records), render_comparison_grid(season_records))
+    if games:
+        add(batch_key(games), render_batch(games))
+    # The dashboard loads each game as a one-opponent batch
+    for opponent_name, record in games:
+        if record:
+            add(batch_key([(opponent_name, record)]), render_batch([(opponent_name, record)]))
+    
+    write_snapshot(snapshot_dir, generation, figures)
+    return generation, len(figures)
+
+def figure_response(entry, encoding=None):
+    """
+    Wrap a cached figure entry in a JSON response without re-encoding it
+    """
+    # Snapshot entries are views of a shared mapping; only the variant
+    # being sent is copied out
+    if encoding:
+        response = app.response_class(bytes(entry['encoded'][encoding]), mimetype='application/json')
+        response.headers['Content-Encoding'] = encoding
+    else:
+        response = app.response_class(bytes(entry['body']), mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
+
+def make_etag(*parts):
+    """
+    Build a strong ETag value from the content versions a response depends on
+    """
+    return hashlib.sha1('\0'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+def last_modified_from(*records):
+    """
+    Return the newest mtime of the given cache records as an HTTP date
+    """
+    newest = max(record['stamp'][0] for record in records)
+    return datetime.fromtimestamp(newest // 1_000_000_000, tz=timezone.utc)
+
+def index_version(index_record):
+    """
+    Return the games index's last_updated stamp, falling back to its hash
+    """
+    return index_record['data'].get('last_updated') or index_record['version']
+
+def variant_etag(etag, encoding):
+    """
+    Give each content coding of a response its own strong ETag
+    """
+    return f"{etag}-{encoding}" if encoding else etag
+
+def not_modified(etag, last_modified):
+    """
+    Return a 304 response if the request's validators are still current
+    """
+    if request.if_none_match:
+        # If-None-Match takes precedence over If-Modified-Since
+        if not request.if_none_match.contains(etag):
+            return None
+    elif not (request.if_modified_since and last_modified and last_modified <= request.if_modified_since):
+        return None
+    
+    response = app.response_class(status=304)
+    return add_cache_headers(response, etag, last_modified)
+
+def add_cache_headers(response, etag, last_modified, max_age=None):
+    """
+    Attach ETag, Last-Modified and Cache-Control to a successful API response
+    """
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = API_CACHE_MAX_AGE if max_age is None else max_age
+    response.cache_control.must_revalidate = True
+    return response
+
+def format_sse(event, data):
+    """
+    Format one Server-Sent Events message
+    """
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+class LiveGameFeed:
+    """
+    Shared change feed for one game, fanned out to every SSE subscriber
+
+    A single poller thread per game checks the game's record while anyone is
+    subscribed. When the content changes it computes one diff and pushes the
+    same pre-formatted messages to every subscriber queue, so N viewers cost
+    one file read and one diff.
+    """
+    
+    def __init__(self, opponent_name, season=None):
+        self.opponent_name = opponent_name
+        self.season = season
+        self.subscribers = set()
+        self.lock = threading.Lock()
+        self.record = None
+        self.thread = None
+    
+    def subscribe(self):
+        """
+        Register a subscriber and return its queue, primed with a snapshot
+        """
+        subscriber = queue.Queue(maxsize=100)
+        with self.lock:
+            if self.thread is None:
+                # Nobody was polling, so the last record seen may be stale;
+                # diffs must start from what new subscribers are told
+                self.record = load_game_record(self.opponent_name, season=self.season)
+                self.thread = threading.Thread(target=self.poll, name=f'live-{self.opponent_name}', daemon=True)
+                self.thread.start()
+            record = self.record
+            self.subscribers.add(subscriber)
+        subscriber.put(format_sse('snapshot', {
+            'opponent': self.opponent_name,
+            'version': record['version'] if record else None,
+            'total_drives': len(record['data']) if record else 0
+        }))
+        return subscriber
+    
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+    
+    def publish(self, messages):
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            for message in messages:
+                try:
+                    subscriber.put_nowait(message)
+                except queue.Full:
+                    # A stalled client gets dropped and will reconnect
+                    self.unsubscribe(subscriber)
+                    break
+    
+    def poll(self):
+        """
+        Poll the game for changes until the last subscriber leaves
+        """
+        while True:
+            time.sleep(LIVE_POLL_INTERVAL)
+            with self.lock:
+                if not self.subscribers:
+                    self.thread = None
+                    return
+                previous = self.record
+            
+            record = load_game_record(self.opponent_name, season=self.season)
+            if not record or (previous and record['version'] == previous['version']):
+                continue
+            
+            with self.lock:
+                self.record = record
+            try:
+                self.publish(self.diff(previous, record))
+            except Exception as e:
+                print(f"Error publishing live update for {self.opponent_name}: {e}")
+    
+    def diff(self, previous, record):
+        """
+        Build the SSE messages describing how a game changed
+
+        Only scoring drives are compared: the scraper rewrites the Game End
+        row with the new final score on every update, so it is sent
+        separately as end_drive and end_point.
+        """
+        series = record['data']
+        new_drives = series.to_records()
+        new_scoring = [new_drives[i] for i in series.plot_indices()]
+        if previous:
+            old_drives = previous['data'].to_records()
+            old_scoring = [old_drives[i] for i in previous['data'].plot_indices()]
+        else:
+            old_scoring = []
+        
+        if new_scoring[:len(old_scoring)] != old_scoring:
+            # Earlier drives were edited, not just appended to
+            return [format_sse('reset', {'version': record['version']})]
         
-        # Add horizontal line at y=0 for each subplot
-        fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.3, row=row, col=col)
+        appended = new_scoring[len(old_scoring):]
+        points = extract_plot_points(appended)[1:-1]  # without start/end markers
+        end_point = extract_plot_points(series)[-1:]
+        end_drive = new_drives[-1] if new_drives and new_drives[-1]['team'] == 'Game End' else None
+        return [
+            format_sse('drives', {
+                'version': record['version'],
+                'base_version': previous['version'] if previous else None,
+                'drives': appended,
+                'end_drive': end_drive,
+                'points': {
+                    'elapsed_seconds': [round(item[0] * 60) for item in points],
+                    'differential': [item[1] for item in points],
+                    'mercyhurst_score': [item[2] for item in points],
+                    'opponent_score': [item[3] for item in points],
+                    'team': [item[4] for item in points],
+                    'result': [item[5] for item in points]
+                },
+                'end_point': {
+                    'elapsed_seconds': round(end_point[0][0] * 60),
+                    'differential': end_point[0][1],
+                    'mercyhurst_score': end_point[0][2],
+                    'opponent_score': end_point[0][3]
+                } if end_point else None
+            }),
+            format_sse('summary', get_game_summary(series, self.opponent_name))
+        ]
+
+def get_live_feed(opponent_name, season=None):
+    """
+    Return the shared live feed for a game, creating it on first use
+    """
+    key = (season or DEFAULT_SEASON, opponent_name)
+    with _live_feeds_lock:
+        feed = _live_feeds.get(key)
+        if feed is None:
+            feed = _live_feeds[key] = LiveGameFeed(opponent_name, season)
+        return feed
+
+def cache_metrics():
+    """
+    Expose the game, figure and season index cache counters as Prometheus counters
+    """
+    caches = {
+        'game': get_game_cache_stats(),
+        'figure': get_figure_cache_stats(),
+        'season_index': get_season_cache_stats()
+    }
+    hits = metrics.Counter('drive_api_cache_hits_total', 'Cache hits, by cache', ('cache',))
+    misses = metrics.Counter('drive_api_cache_misses_total', 'Cache misses, by cache', ('cache',))
+    evictions = metrics.Counter('drive_api_cache_evictions_total', 'Cache evictions, by cache', ('cache',))
+    for name, stats in caches.items():
+        hits.inc(name, amount=stats['hits'])
+        misses.inc(name, amount=stats['misses'])
+        evictions.inc(name, amount=stats['evictions'])
+    hits.inc('snapshot', amount=caches['figure']['snapshot_hits'])
+    return [hits, misses, evictions]
+
+def start_request_metrics():
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    g.metrics = (route, time.perf_counter(), metrics.start_request(route))
+
+def error_response(message, reason='failed', **fields):
+    """
+    Return the API's success: false response and count it as an error
+
+    reason is "failed" for requests the route rejects and "exception" for
+    exceptions the route caught. fields are added to the response body.
+    """
+    if 'metrics' in g:
+        REQUEST_ERRORS.inc(g.metrics[0], reason)
+    return jsonify({
+        'success': False,
+        'error': message,
+        **fields
+    })
+
+def record_request_metrics(response):
+    """
+    Record latency, status, errors and response size for the finished request
+    """
+    route, start, _ = g.metrics
+    REQUEST_SECONDS.observe(time.perf_counter() - start, route)
+    REQUESTS.inc(route, str(response.status_code))
     
-    # Update layout
-    fig.update_layout(
-        title={
-            'text': 'Mercyhurst Football 2024 Season - All Games Comparison<br>Score Differential Over Time',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18, 'color': '#003366'}
-        },
-        template='plotly_white',
-        height=300 * rows,  # Adjust height based on number of rows
-        width=1400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)'
+    # success: false responses are counted by error_response()
+    if response.status_code >= 400:
+        REQUEST_ERRORS.inc(route, str(response.status_code))
+    
+    if response.content_length is not None and not response.is_streamed:
+        RESPONSE_BYTES.inc(route, response.headers.get('Content-Encoding', 'identity'), amount=response.content_length)
+    return response
+
+def end_request_metrics(exc):
+    if 'metrics' in g:
+        metrics.end_request(g.metrics[2])
+
+def metrics_endpoint():
+    """Prometheus scrape endpoint"""
+    return Response(metrics.REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+if METRICS:
+    metrics.REGISTRY.register_collector(cache_metrics)
+    app.before_request(start_request_metrics)
+    app.after_request(record_request_metrics)
+    app.teardown_request(end_request_metrics)
+    app.add_url_rule('/metrics', 'metrics', metrics_endpoint)
+
+def profile_dir():
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, PROFILE_DIR)
+
+def start_request_profile():
+    """
+    Start profiling this request if it carries a valid token or is sampled
+    """
+    if request.endpoint in ('profiles', 'profile_file'):
+        return
+    token = request.args.get('profile')
+    if token and PROFILE_SECRET and profiling.verify(PROFILE_SECRET, request.path, token):
+        trigger = 'signed'
+        profile_format = request.args.get('profile_format', PROFILE_FORMAT)
+    elif PROFILE_SAMPLE_RATE and random.randrange(PROFILE_SAMPLE_RATE) == 0:
+        trigger = 'sampled'
+        profile_format = PROFILE_FORMAT
+    else:
+        return
+    if profile_format not in profiling.FORMATS:
+        profile_format = PROFILE_FORMAT
+    profiler = profiling.RequestProfiler(profile_format).start()
+    if profiler is None:
+        return  # Another request in this process is being profiled
+    g.profile = (profiler, trigger)
+    # A signed request is asking where a route's time goes, so it renders
+    # its figures instead of serving them from the caches
+    g.bypass_figure_caches = trigger == 'signed'
+
+def finish_request_profile(response):
+    """
+    Write the profile for a profiled request, naming it in X-Profile if signed
+    """
+    if 'profile' not in g:
+        return response
+    profiler, trigger = g.pop('profile')
+    
+    query = urlencode([
+        (key, value) for key, value in request.args.items(multi=True)
+        if key not in ('profile', 'profile_format')
+    ])
+    entry = profiler.finish(
+        profile_dir(),
+        route=request.url_rule.rule if request.url_rule else 'unmatched',
+        path=f"{request.path}?{query}" if query else request.path,
+        status=response.status_code,
+        trigger=trigger
     )
+    profiling.prune_profiles(profile_dir(), PROFILE_KEEP)
+    # Sampled requests come from ordinary clients, who never see the profile
+    if trigger == 'signed':
+        response.headers['X-Profile'] = entry['file']
+    return response
+
+def discard_request_profile(exc):
+    """
+    Stop the profiler of a request that never reached finish_request_profile
+    """
+    if 'profile' in g:
+        profiler, _ = g.pop('profile')
+        profiler.cancel()
+
+def require_profile_token():
+    """
+    Guard the profile endpoints with a token signed for /api/profiles
+
+    Without PROFILE_SECRET (sampling only) they are always denied.
+    """
+    if not PROFILE_SECRET or not profiling.verify(PROFILE_SECRET, '/api/profiles', request.args.get('profile')):
+        abort(403)
+
+def profiles():
+    """API endpoint listing recent request profiles, with wall time per route"""
+    require_profile_token()
+    recent = profiling.recent_profiles(profile_dir(), request.args.get('limit', 50, type=int))
     
-    # Update x and y axes for all subplots with fixed ranges
-    for i in range(1, rows * cols + 1):
-        fig.update_xaxes(title_text="Time (min)", range=[0, 60], row=(i-1)//cols + 1, col=(i-1)%cols + 1)
-        fig.update_yaxes(title_text="Score Diff", range=y_range, row=(i-1)//cols + 1, col=(i-1)%cols + 1)
+    routes = {}
+    for entry in recent:
+        stats = routes.setdefault(entry['route'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        stats['count'] += 1
+        stats['total_ms'] += entry['wall_ms']
+        stats['max_ms'] = max(stats['max_ms'], entry['wall_ms'])
+    for stats in routes.values():
+        stats['mean_ms'] = round(stats.pop('total_ms') / stats['count'], 3)
     
-    return fig
+    return jsonify({
+        'success': True,
+        'profiles': recent,
+        'routes': routes
+    })
+
+def profile_file(filename):
+    """Download one profile file"""
+    require_profile_token()
+    return send_from_directory(profile_dir(), filename, as_attachment=True)
+
+if PROFILING:
+    app.before_request(start_request_profile)
+    app.after_request(finish_request_profile)
+    app.teardown_request(discard_request_profile)
+    app.add_url_rule('/api/profiles', 'profiles', profiles)
+    app.add_url_rule('/api/profiles/<path:filename>', 'profile_file', profile_file)
+
+def resolve_season(value):
+    """
+    Return the season a season parameter names, the default season if empty
+
+    Raises ValueError for a season that has no games index, which routes
+    report like other errors.
+    """
+    season = (value or '').strip() or DEFAULT_SEASON
+    if season != DEFAULT_SEASON and (
+        not is_season(season)
+        or not os.path.isfile(os.path.join(season_data_dir(season), 'games_index.json'))
+    ):
+        raise ValueError(f"Unknown season {season}")
+    return season
+
+def request_season():
+    """
+    Return the season the current request asks for
+    """
+    return resolve_season(request.args.get('season'))
+
+def request_int(name, default=None):
+    """
+    Return an integer query parameter, or default if it is absent
+
+    Raises ValueError if the value is not an integer, rather than dropping
+    the filter it belongs to.
+    """
+    value = request.args.get(name, '').strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, not {value!r}") from None
 
 @app.route('/')
 def index():
     """Main page"""
     return render_template('index.html')
 
-@app.route('/api/games')
-def get_games():
-    """API endpoint to get list of all available games"""
+@app.route('/api/seasons')
+def get_seasons():
+    """API endpoint to list the seasons with game data, newest first"""
     try:
-        games_index = load_games_index()
         return jsonify({
             'success': True,
-            'games': games_index.get('games', [])
+            'seasons': available_seasons(),
+            'default': DEFAULT_SEASON
         })
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        })
+        return error_response(str(e), 'exception')
+
+@app.route('/api/games')
+def get_games():
+    """API endpoint to get list of all available games in a season"""
+    try:
+        season = request_season()
+        index_record = load_games_index_record(season)
+        games_index = index_record['data'] if index_record else {}
+        
+        if index_record:
+            etag = make_etag('games', season, index_version(index_record))
+            last_modified = last_modified_from(index_record)
+            cached = not_modified(etag, last_modified)
+            if cached:
+                return cached
+        
+        with metrics.phase('encode'):
+            response = jsonify({
+                'success': True,
+                'games': games_index.get('games', [])
+            })
+        if index_record:
+            add_cache_headers(response, etag, last_modified)
+        return response
+    except Exception as e:
+        return error_response(str(e), 'exception')
 
 @app.route('/api/drive-data')
 def drive_data():
     """API endpoint to get drive data for a specific game"""
     try:
-        opponent = request.args.get('opponent', 'Wheeling University')  # Default to Wheeling
-        data = load_game_data(opponent)
+        season = request_season()
+        # Defaults to the season's first game (Wheeling University in 2024)
+        opponent = canonical_opponent(request.args.get('opponent') or default_opponent(season), season)
+        record = load_game_record(opponent, season=season)
+        data = record['data'] if record else []
+        
+        if record:
+            etag = make_etag('drive-data', season, opponent, record['version'])
+            last_modified = last_modified_from(record)
+            cached = not_modified(etag, last_modified)
+            if cached:
+                return cached
+        
         summary = get_game_summary(data, opponent)
         
-        return jsonify({
-            'success': True,
-            'data': data,
-            'summary': summary,
-            'total_drives': len(data),
-            'opponent': opponent
-        })
+        with metrics.phase('encode'):
+            response = jsonify({
+                'success': True,
+                'data': data.to_records() if record else [],
+                'summary': summary,
+                'total_drives': len(data),
+                'opponent': opponent
+            })
+        if record:
+            add_cache_headers(response, etag, last_modified)
+        return response
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'data': []
-        })
+        return error_response(str(e), 'exception', data=[])
 
 @app.route('/api/plot')
 def plot():
-    """API endpoint to get the plot data for a specific game"""
+    """API endpoint to get the plot data for a specific game
+
+    With format=columnar only the per-game arrays are returned; the client
+    combines them with the static layout from /api/plot-template.
+    max_points caps the number of plotted points (scoring changes are
+    always kept).
+    """
     try:
-        opponent = request.args.get('opponent', 'Wheeling University')  # Default to Wheeling
-        data = load_game_data(opponent)
-        fig = create_score_differential_plot(data, opponent)
+        season = request_season()
+        # Defaults to the season's first game (Wheeling University in 2024)
+        opponent = canonical_opponent(request.args.get('opponent') or default_opponent(season), season)
+        columnar = request.args.get('format') == 'columnar'
+        record = load_game_record(opponent, season=season)
+        encoding = choose_encoding()
         
-        if fig:
-            graph_json = plotly.utils.PlotlyJSONEncoder().encode(fig)
-            return jsonify({
-                'success': True,
-                'plot': graph_json,
-                'opponent': opponent
-            })
+        if record and record['data']:
+            max_points = plot_budget(record, request.args.get('max_points', type=int))
+            variant = 'plot-columnar' if columnar else 'plot'
+            etag = variant_etag(make_etag(variant, season, opponent, record['version'], *budget_key(max_points)), encoding)
+            last_modified = last_modified_from(record)
+            cached = not_modified(etag, last_modified)
+            if cached:
+                cached.vary.add('Accept-Encoding')
+                return cached
+        
+        if not record or not record['data']:
+            entry = None
+        elif columnar:
+            entry = render_plot_series(opponent, record, max_points)
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Could not create plot'
-            })
+            entry = render_plot(opponent, record, max_points, season)
+        
+        if entry:
+            return add_cache_headers(figure_response(entry, encoding), etag, last_modified)
+        else:
+            return error_response('Could not create plot')
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        })
+        return error_response(str(e), 'exception')
+
+@app.route('/api/plot-template')
+def plot_template():
+    """API endpoint to get the static layout for client-assembled game plots"""
+    try:
+        encoding = choose_encoding()
+        entry = render_plot_template(request_season())
+        
+        # The template only changes when the app is redeployed
+        etag = variant_etag(make_etag('plot-template', hashlib.sha1(entry['body']).hexdigest()), encoding)
+        cached = not_modified(etag, None)
+        if cached:
+            cached.vary.add('Accept-Encoding')
+            return cached
+        
+        return add_cache_headers(figure_response(entry, encoding), etag, None, max_age=PLOT_TEMPLATE_MAX_AGE)
+    except Exception as e:
+        return error_response(str(e), 'exception')
+
+@app.route('/api/games/batch')
+def games_batch():
+    """API endpoint to get drive data, summaries and plot series for several games
+
+    opponents is a comma-separated list of opponent names, or "all" for
+    every game in the index. max_points caps each game's plot series.
+    """
+    try:
+        season = request_season()
+        requested = request.args.get('opponents', '').strip()
+        max_points = request.args.get('max_points', type=int)
+        if max_points is not None:
+            max_points = max(MIN_PLOT_POINTS, max_points)
+        index_record = load_games_index_record(season)
+        
+        if requested.lower() == 'all':
+            games_list = index_record['data'].get('games', []) if index_record else []
+            opponents = [game['opponent'] for game in games_list]
+        else:
+            opponents = list(dict.fromkeys(
+                canonical_opponent(name.strip(), season) for name in requested.split(',') if name.strip()
+            ))
+        
+        if not opponents:
+            return error_response('No opponents requested', games=[])
+        
+        games = list(zip(opponents, load_game_records(opponents, season)))
+        found = [record for _, record in games if record]
+        
+        encoding = choose_encoding()
+        etag = variant_etag(make_etag(
+            'batch',
+            season,
+            *(f"{name}:{record['version'] if record else ''}" for name, record in games),
+            *budget_key(max_points)
+        ), encoding)
+        last_modified = last_modified_from(*found) if found else None
+        cached = not_modified(etag, last_modified)
+        if cached:
+            cached.vary.add('Accept-Encoding')
+            return cached
+        
+        entry = render_batch(games, max_points)
+        return add_cache_headers(figure_response(entry, encoding), etag, last_modified)
+    except Exception as e:
+        return error_response(str(e), 'exception', games=[])
+
+@app.route('/api/drives/query')
+def drives_query():
+    """API endpoint to filter, aggregate and page drives across all games
+
+    Requires DRIVE_STORE, which holds the default season. Filters:
+    opponent, team (mercyhurst, opponent or a team name), result, quarter,
+    min_elapsed, max_elapsed. group_by (opponent, team, result, quarter)
+    returns counts instead of drives; otherwise limit/offset page through
+    the matching drives.
+    """
+    try:
+        if not DRIVE_STORE:
+            return error_response('Drive store not configured (set DRIVE_STORE)')
+        if request_season() != DEFAULT_SEASON:
+            return error_response(f'The drive store only holds the {DEFAULT_SEASON} season')
+        
+        args = request.args
+        opponent = args.get('opponent', '').strip()
+        if opponent:
+            # Accept the same names, aliases and boxscore IDs as the other routes
+            game = resolve_game(opponent)
+            if game is None:
+                return error_response(f'Unknown opponent {opponent}')
+            opponent = game['opponent']
+        
+        result = drive_store.query_drives(
+            get_drive_store(),
+            opponent=opponent or None,
+            team=args.get('team'),
+            result=args.get('result'),
+            quarter=request_int('quarter'),
+            min_elapsed=request_int('min_elapsed'),
+            max_elapsed=request_int('max_elapsed'),
+            group_by=args.get('group_by'),
+            limit=request_int('limit', 100),
+            offset=request_int('offset', 0)
+        )
+        result['success'] = True
+        return jsonify(result)
+    except ValueError as e:
+        return error_response(str(e))
+    except Exception as e:
+        return error_response(str(e), 'exception')
+
+def drive_filter(team=None, result=None, quarter=None, min_elapsed=None, max_elapsed=None):
+    """
+    Build a predicate over (series, index, opponent) for the drive filters
+
+    team may be "mercyhurst", "opponent" or an exact team name, matching
+    /api/drives/query.
+    """
+    def matches(series, i, opponent_name):
+        if team:
+            team_name = category_name(series.team_codes[i])
+            if team.lower() == 'mercyhurst':
+                if team_name != 'Mercyhurst':
+                    return False
+            elif team.lower() == 'opponent':
+                if team_name != opponent_name:
+                    return False
+            elif team_name != team:
+                return False
+        if result and category_name(series.result_codes[i]) != result:
+            return False
+        if quarter is not None and series.quarter[i] != quarter:
+            return False
+        if min_elapsed is not None and series.elapsed_seconds[i] < min_elapsed:
+            return False
+        if max_elapsed is not None and series.elapsed_seconds[i] > max_elapsed:
+            return False
+        return True
+    
+    return matches
+
+def stream_drives(opponents, matches, season=None):
+    """
+    Yield one NDJSON line per matching drive, one game in memory at a time
+    """
+    for opponent_name in opponents:
+        record = load_game_record(opponent_name, cache=False, season=season)
+        if not record:
+            continue
+        series = record['data']
+        for i in range(len(series)):
+            if matches(series, i, opponent_name):
+                drive = series[i].to_dict()
+                drive['opponent'] = opponent_name
+                yield json.dumps(drive, separators=(',', ':')) + '\n'
+
+@app.route('/api/drives/stream')
+def drives_stream():
+    """API endpoint to stream every drive of the season as NDJSON
+
+    Optional filters: opponents (comma-separated), team, result, quarter,
+    min_elapsed, max_elapsed. Each line is one drive with its opponent.
+    """
+    try:
+        season = request_season()
+        args = request.args
+        requested = args.get('opponents', '').strip()
+        if requested:
+            opponents = list(dict.fromkeys(
+                canonical_opponent(name.strip(), season) for name in requested.split(',') if name.strip()
+            ))
+        else:
+            games_index = load_games_index(season)
+            opponents = [game['opponent'] for game in games_index.get('games', [])]
+        
+        matches = drive_filter(
+            team=args.get('team'),
+            result=args.get('result'),
+            quarter=request_int('quarter'),
+            min_elapsed=request_int('min_elapsed'),
+            max_elapsed=request_int('max_elapsed')
+        )
+        return Response(
+            stream_with_context(stream_drives(opponents, matches, season)),
+            mimetype='application/x-ndjson'
+        )
+    except ValueError as e:
+        return error_response(str(e))
+    except Exception as e:
+        return error_response(str(e), 'exception')
+
+@app.route('/api/live')
+def live_game():
+    """API endpoint streaming Server-Sent Events as a game's data changes
+
+    Sends a snapshot event on connect, then drives/summary events with only
+    newly appended scoring plays, or a reset event if earlier drives changed.
+    Each connection holds a worker thread, so gunicorn must run threaded
+    workers (Procfile and railway.json use --worker-class gthread).
+    """
+    try:
+        season = request_season()
+    except ValueError as e:
+        return error_response(str(e))
+    opponent = canonical_opponent(request.args.get('opponent') or default_opponent(season), season)
+    if resolve_game(opponent, season) is None:
+        return error_response(f'Unknown opponent {opponent}')
+    
+    feed = get_live_feed(opponent, season)
+    subscriber = feed.subscribe()
+    
+    def generate():
+        try:
+            while True:
+                try:
+                    yield subscriber.get(timeout=LIVE_HEARTBEAT)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+        finally:
+            feed.unsubscribe(subscriber)
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 @app.route('/api/comparison-plot')
 def comparison_plot():
     """API endpoint to get comparison plots for all games"""
     try:
-        games_index = load_games_index()
-        games_list = games_index.get('games', [])
+        season = request_season()
+        index_record = load_games_index_record(season)
+        games_list = index_record['data'].get('games', []) if index_record else []
         
         if not games_list:
-            return jsonify({
-                'success': False,
-                'error': 'No games found'
-            })
+            return error_response('No games found')
         
         # Load data for all games
-        games_data = []
-        for game in games_list:
-            opponent_name = game['opponent']
-            data = load_game_data(opponent_name)
-            if data:  # Only include games with data
-                games_data.append({
-                    'opponent': opponent_name,
-                    'data': data
-                })
+        season_records = load_season_records(season)
         
-        if not games_data:
-            return jsonify({
-                'success': False,
-                'error': 'No game data found'
-            })
+        if not season_records:
+            return error_response('No game data found')
         
-        fig = create_comparison_plots(games_data)
+        encoding = choose_encoding()
+        etag = variant_etag(make_etag(
+            'comparison',
+            season,
+            index_version(index_record),
+            *(f"{name}:{record['version']}" for name, record in season_records)
+        ), encoding)
+        last_modified = last_modified_from(index_record, *(record for _, record in season_records))
+        cached = not_modified(etag, last_modified)
+        if cached:
+            cached.vary.add('Accept-Encoding')
+            return cached
         
-        if fig:
-            graph_json = plotly.utils.PlotlyJSONEncoder().encode(fig)
-            return jsonify({
-                'success': True,
-                'plot': graph_json,
-                'games_count': len(games_data)
-            })
+        entry = render_comparison_plot(season_records, season)
+        
+        if entry:
+            return add_cache_headers(figure_response(entry, encoding), etag, last_modified)
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Could not create comparison plot'
-            })
+            return error_response('Could not create comparison plot')
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        })
+        return error_response(str(e), 'exception')
+
+@app.route('/api/comparison-grid')
+def comparison_grid():
+    """API endpoint to get SVG sparklines of every game for the comparison grid"""
+    try:
+        season = request_season()
+        index_record = load_games_index_record(season)
+        games_list = index_record['data'].get('games', []) if index_record else []
+        
+        if not games_list:
+            return error_response('No games found')
+        
+        season_records = load_season_records(season)
+        
+        if not season_records:
+            return error_response('No game data found')
+        
+        encoding = choose_encoding()
+        etag = variant_etag(make_etag(
+            'comparison-grid',
+            season,
+            index_version(index_record),
+            *(f"{name}:{record['version']}" for name, record in season_records)
+        ), encoding)
+        last_modified = last_modified_from(index_record, *(record for _, record in season_records))
+        cached = not_modified(etag, last_modified)
+        if cached:
+            cached.vary.add('Accept-Encoding')
+            return cached
+        
+        entry = render_comparison_grid(season_records)
+        
+        if entry:
+            return add_cache_headers(figure_response(entry, encoding), etag, last_modified)
+        else:
+            return error_response('Could not create comparison grid')
+    except Exception as e:
+        return error_response(str(e), 'exception')
+
+if os.environ.get('WARM_FIGURE_CACHE', '').lower() in ('1', 'true', 'yes'):
+    warm_figure_cache()
+
+def profile_startup():
+    """
+    Report import-time hot spots and time to first served request
+
+    Both measurements run in fresh interpreters so they reflect what a
+    newly (re)started gunicorn worker pays.
+    """
+    import subprocess
+    
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # Per-module import cost, as reported by python -X importtime
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=base_dir, capture_output=True, text=True
+    )
+    # Output is post-order: a module's imports are listed just before it
+    imports = []
+    pending = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        pending.append((int(cumulative_us), name, depth))
+        if depth == 0:
+            if name == 'app':
+                imports = [(us, mod) for us, mod, d in pending if d <= 1]
+            pending = []
+    
+    print("Import time for app.py and its direct imports (cumulative):")
+    for cumulative_us, name in sorted(imports, reverse=True):
+        print(f"  {cumulative_us / 1000:9.1f} ms  {name}")
+    
+    # Wall time from process spawn to the first responses a worker serves
+    probe = (
+        "import time, json\n"
+        "t0 = time.perf_counter()\n"
+        "import app\n"
+        "t1 = time.perf_counter()\n"
+        "client = app.app.test_client()\n"
+        "client.get('/api/games')\n"
+        "t2 = time.perf_counter()\n"
+        "client.get('/api/plot')\n"
+        "t3 = time.perf_counter()\n"
+        "print(json.dumps({'import_app': t1 - t0, 'first_request': t2 - t1, 'first_plot': t3 - t2}))\n"
+    )
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', probe], cwd=base_dir, capture_output=True, text=True)
+    total = time.perf_counter() - start
+    if result.returncode != 0:
+        print(result.stderr)
+        return
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    
+    print("\nStartup to first served request:")
+    print(f"  {timings['import_app'] * 1000:9.1f} ms  import app")
+    print(f"  {timings['first_request'] * 1000:9.1f} ms  first /api/games")
+    print(f"  {timings['first_plot'] * 1000:9.1f} ms  first /api/plot (loads plotly)")
+    print(f"  {total * 1000:9.1f} ms  total, including interpreter start")
 
 if __name__ == '__main__':
+    if '--profile-startup' in sys.argv:
+        profile_startup()
+        sys.exit(0)
+    
     port = int(os.environ.get('PORT', 5001))
     app.run(debug=False, host='0.0.0.0', port=port)
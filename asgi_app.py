@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+ASGI serving path for the Mercyhurst drive API
+
+Serves the dashboard and the read-only routes of app.py (/api/seasons,
+/api/games, /api/drive-data, /api/plot, /api/plot-template,
+/api/games/batch, /api/comparison-plot and /api/comparison-grid), including
+their season parameter, from an asyncio event loop, so slow clients and file
+I/O no longer tie up a whole worker. Responses match app.py, including
+ETags, 304s and precompressed bodies, because they are built from the same
+caches. File access runs on the default executor. CPU-heavy figure building
+and encoding run on a bounded thread pool (ASGI_FIGURE_WORKERS).
+
+Run with:
+    uvicorn asgi_app:app --host 0.0.0.0 --port $PORT
+"""
+
+import os
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from werkzeug.datastructures import Accept
+from werkzeug.http import http_date, parse_accept_header, parse_date, parse_etags
+
+import app as drive_app
+
+ASGI_FIGURE_WORKERS = int(os.environ.get('ASGI_FIGURE_WORKERS', 4))
+_figure_executor = ThreadPoolExecutor(max_workers=ASGI_FIGURE_WORKERS, thread_name_prefix='figure')
+
+class Request:
+    """
+    The parts of an ASGI HTTP request the API routes need
+    """
+
+    def __init__(self, scope):
+        self.path = scope['path']
+        self.method = scope['method']
+        self.args = {
+            key: values[0]
+            for key, values in parse_qs(scope.get('query_string', b'').decode('latin-1')).items()
+        }
+        self.headers = {
+            name.decode('latin-1').lower(): value.decode('latin-1')
+            for name, value in scope.get('headers', [])
+        }
+
+    def int_arg(self, name):
+        """
+        Return a query parameter as an int, or None if missing or invalid
+        """
+        try:
+            return int(self.args[name])
+        except (KeyError, ValueError):
+            return None
+
+    def season(self):
+        """
+        Return the requested season like app.request_season()
+        """
+        return drive_app.resolve_season(self.args.get('season'))
+
+    def choose_encoding(self):
+        """
+        Pick the best precompressed content coding the client accepts, if any
+        """
+        offered = ['br', 'gzip'] if drive_app.brotli is not None else ['gzip']
+        accepted = parse_accept_header(self.headers.get('accept-encoding'), Accept)
+        encoding = accepted.best_match(offered)
+        return encoding if encoding in offered else None
+
+    def is_not_modified(self, etag, last_modified):
+        """
+        Check If-None-Match / If-Modified-Since like app.not_modified()
+        """
+        if 'if-none-match' in self.headers:
+            return parse_etags(self.headers['if-none-match']).contains(etag)
+        since = parse_date(self.headers.get('if-modified-since'))
+        return bool(since and last_modified and last_modified <= since)
+
+def cache_headers(etag, last_modified, max_age=None):
+    """
+    ETag, Last-Modified and Cache-Control headers, matching app.add_cache_headers()
+    """
+    max_age = drive_app.API_CACHE_MAX_AGE if max_age is None else max_age
+    headers = [
+        ('etag', f'"{etag}"'),
+        ('cache-control', f'public, max-age={max_age}, must-revalidate')
+    ]
+    if last_modified:
+        headers.append(('last-modified', http_date(last_modified)))
+    return headers
+
+def json_response(payload, headers=()):
+    # Same compact, key-sorted encoding as Flask's jsonify
+    body = json.dumps(payload, separators=(',', ':'), sort_keys=True).encode('utf-8') + b'\n'
+    return 200, [('content-type', 'application/json')] + list(headers), body
+
+def not_modified_response(etag, last_modified, max_age=None, vary=False):
+    headers = cache_headers(etag, last_modified, max_age)
+    if vary:
+        headers.append(('vary', 'Accept-Encoding'))
+    return 304, headers, b''
+
+def figure_response(entry, encoding, etag, last_modified, max_age=None):
+    """
+    Serve a cached figure entry's stored bytes, compressed variant if chosen
+    """
+    headers = [('content-type', 'application/json'), ('vary', 'Accept-Encoding')]
+    if encoding:
+        headers.append(('content-encoding', encoding))
+        body = bytes(entry['encoded'][encoding])
+    else:
+        body = bytes(entry['body'])
+    return 200, headers + cache_headers(etag, last_modified, max_age), body
+
+async def run_io(func, *args):
+    """
+    Run blocking file access on the event loop's default executor
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+async def run_cpu(func, *args):
+    """
+    Run figure building or encoding on the bounded figure pool
+    """
+    return await asyncio.get_running_loop().run_in_executor(_figure_executor, func, *args)
+
+def _resolve_and_load(name, season):
+    # Defaults to the season's first game (Wheeling University in 2024)
+    opponent = drive_app.canonical_opponent(name or drive_app.default_opponent(season), season)
+    return opponent, drive_app.load_game_record(opponent, season=season)
+
+async def index(request):
+    """Main page"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    def read_page():
+        with open(os.path.join(base_dir, 'templates', 'index.html'), 'rb') as f:
+            return f.read()
+
+    return 200, [('content-type', 'text/html; charset=utf-8')], await run_io(read_page)
+
+async def get_seasons(request):
+    """Seasons with game data, newest first"""
+    seasons = await run_io(drive_app.available_seasons)
+    return json_response({'success': True, 'seasons': seasons, 'default': drive_app.DEFAULT_SEASON})
+
+async def get_games(request):
+    """List of all available games in a season"""
+    season = await run_io(request.season)
+    index_record = await run_io(drive_app.load_games_index_record, season)
+    if not index_record:
+        return json_response({'success': True, 'games': []})
+
+    etag = drive_app.make_etag('games', season, drive_app.index_version(index_record))
+    last_modified = drive_app.last_modified_from(index_record)
+    if request.is_not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return json_response(
+        {'success': True, 'games': index_record['data'].get('games', [])},
+        cache_headers(etag, last_modified)
+    )
+
+async def drive_data(request):
+    """Drive data and summary for one game"""
+    season = await run_io(request.season)
+    opponent, record = await run_io(_resolve_and_load, request.args.get('opponent'), season)
+    if record:
+        etag = drive_app.make_etag('drive-data', season, opponent, record['version'])
+        last_modified = drive_app.last_modified_from(record)
+        if request.is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+    def build():
+        data = record['data'] if record else []
+        return {
+            'success': True,
+            'data': data.to_records() if record else [],
+            'summary': drive_app.get_game_summary(data, opponent),
+            'total_drives': len(data),
+            'opponent': opponent
+        }
+
+    payload = await run_cpu(build)
+    return json_response(payload, cache_headers(etag, last_modified) if record else ())
+
+async def plot(request):
+    """Full Plotly figure, or per-game arrays with format=columnar"""
+    season = await run_io(request.season)
+    opponent, record = await run_io(_resolve_and_load, request.args.get('opponent'), season)
+    if not record or not record['data']:
+        return json_response({'success': False, 'error': 'Could not create plot'})
+
+    columnar = request.args.get('format') == 'columnar'
+    max_points = drive_app.plot_budget(record, request.int_arg('max_points'))
+    encoding = request.choose_encoding()
+    variant = 'plot-columnar' if columnar else 'plot'
+    etag = drive_app.variant_etag(drive_app.make_etag(
+        variant, season, opponent, record['version'], *drive_app.budget_key(max_points)
+    ), encoding)
+    last_modified = drive_app.last_modified_from(record)
+    if request.is_not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified, vary=True)
+
+    if columnar:
+        entry = await run_cpu(drive_app.render_plot_series, opponent, record, max_points)
+    else:
+        entry = await run_cpu(drive_app.render_plot, opponent, record, max_points, season)
+    if not entry:
+        return json_response({'success': False, 'error': 'Could not create plot'})
+    return figure_response(entry, encoding, etag, last_modified)
+
+async def plot_template(request):
+    """Static layout for client-assembled game plots"""
+    encoding = request.choose_encoding()
+    season = await run_io(request.season)
+    entry = await run_cpu(drive_app.render_plot_template, season)
+    etag = drive_app.variant_etag(
+        drive_app.make_etag('plot-template', drive_app.hashlib.sha1(entry['body']).hexdigest()), encoding
+    )
+    max_age = drive_app.PLOT_TEMPLATE_MAX_AGE
+    if request.is_not_modified(etag, None):
+        return not_modified_response(etag, None, max_age, vary=True)
+    return figure_response(entry, encoding, etag, None, max_age)
+
+async def games_batch(request):
+    """Drive data, summaries and plot series for several games"""
+    season = await run_io(request.season)
+    requested = request.args.get('opponents', '').strip()
+    max_points = request.int_arg('max_points')
+    if max_points is not None:
+        max_points = max(drive_app.MIN_PLOT_POINTS, max_points)
+
+    def load():
+        index_record = drive_app.load_games_index_record(season)
+        if requested.lower() == 'all':
+            games_list = index_record['data'].get('games', []) if index_record else []
+            opponents = [game['opponent'] for game in games_list]
+        else:
+            opponents = list(dict.fromkeys(
+                drive_app.canonical_opponent(name.strip(), season) for name in requested.split(',') if name.strip()
+            ))
+        return list(zip(opponents, drive_app.load_game_records(opponents, season)))
+
+    games = await run_io(load)
+    if not games:
+        return json_response({'success': False, 'error': 'No opponents requested', 'games': []})
+
+    found = [record for _, record in games if record]
+    encoding = request.choose_encoding()
+    etag = drive_app.variant_etag(drive_app.make_etag(
+        'batch',
+        season,
+        *(f"{name}:{record['version'] if record else ''}" for name, record in games),
+        *drive_app.budget_key(max_points)
+    ), encoding)
+    last_modified = drive_app.last_modified_from(*found) if found else None
+    if request.is_not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified, vary=True)
+
+    entry = await run_cpu(drive_app.render_batch, games, max_points)
+    return figure_response(entry, encoding, etag, last_modified)
+
+async def season_figure(request, variant, render, description):
+    """
+    Serve a season-wide figure (comparison plot or grid) for all games
+    """
+    season = await run_io(request.season)
+
+    def load():
+        return drive_app.load_games_index_record(season), drive_app.load_season_records(season)
+
+    index_record, season_records = await run_io(load)
+    if not index_record or not index_record['data'].get('games'):
+        return json_response({'success': False, 'error': 'No games found'})
+    if not season_records:
+        return json_response({'success': False, 'error': 'No game data found'})
+
+    encoding = request.choose_encoding()
+    etag = drive_app.variant_etag(drive_app.make_etag(
+        variant,
+        season,
+        drive_app.index_version(index_record),
+        *(f"{name}:{record['version']}" for name, record in season_records)
+    ), encoding)
+    last_modified = drive_app.last_modified_from(index_record, *(record for _, record in season_records))
+    if request.is_not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified, vary=True)
+
+    entry = await run_cpu(render, season_records, season)
+    if not entry:
+        return json_response({'success': False, 'error': f'Could not create {description}'})
+    return figure_response(entry, encoding, etag, last_modified)
+
+async def comparison_plot(request):
+    """Comparison plots for all games"""
+    return await season_figure(request, 'comparison', drive_app.render_comparison_plot, 'comparison plot')
+
+async def comparison_grid(request):
+    """SVG sparklines of every game for the comparison grid"""
+    # Sparklines carry no season title, so the grid is cached by content alone
+    def render(season_records, season):
+        return drive_app.render_comparison_grid(season_records)
+
+    return await season_figure(request, 'comparison-grid', render, 'comparison grid')
+
+ROUTES = {
+    '/': index,
+    '/api/seasons': get_seasons,
+    '/api/games': get_games,
+    '/api/drive-data': drive_data,
+    '/api/plot': plot,
+    '/api/plot-template': plot_template,
+    '/api/games/batch': games_batch,
+    '/api/comparison-plot': comparison_plot,
+    '/api/comparison-grid': comparison_grid
+}
+
+async def app(scope, receive, send):
+    """
+    ASGI entry point
+    """
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                _figure_executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    if scope['type'] != 'http':
+        return
+
+    request = Request(scope)
+    handler = ROUTES.get(request.path)
+    if handler is None:
+        status, headers, body = 404, [('content-type', 'text/plain')], b'Not Found'
+    elif request.method not in ('GET', 'HEAD'):
+        status, headers, body = 405, [('content-type', 'text/plain'), ('allow', 'GET, HEAD')], b'Method Not Allowed'
+    else:
+        try:
+            status, headers, body = await handler(request)
+        except Exception as e:
+            status, headers, body = json_response({'success': False, 'error': str(e)})
+
+    headers.append(('content-length', str(len(body))))
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(name.encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+    })
+    await send({'type': 'http.response.body', 'body': b'' if request.method == 'HEAD' else body})
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the app.py hot paths
+
+Times the core functions (load_game_data, get_game_summary,
+create_score_differential_plot, create_comparison_plots) and every GET
+route through the Flask test client. It runs on the real games_data/ and on
+seasons of 10, 100 and 1000 games from synthetic_data.py. Each dataset is
+measured in a fresh interpreter with DATA_DIR pointing at it, so caches
+and memory don't leak between datasets.
+
+Each case reports latency percentiles, the peak memory allocated during
+one call (tracemalloc) and, for routes, the response body size. Routes
+are measured warm (caches kept between requests) and cold (game and figure
+caches cleared before every request). /api/drives/query runs against a
+drive store built for each dataset. A case that fails is reported under
+failures and left out of the timings, so reports and comparisons only
+cover successful calls.
+
+Usage:
+    python benchmark.py run [--datasets real,10,100,1000] [--data-dir DIR]
+                            [--iterations 20] [--max-seconds 5]
+                            [--output benchmark_results.json] [--baseline FILE]
+    python benchmark.py compare BASELINE CURRENT [--threshold 10]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import contextlib
+import itertools
+import subprocess
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+import drive_store
+import synthetic_data
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATASETS = 'real,10,100,1000'
+DEFAULT_OUTPUT = 'benchmark_results.json'
+
+# Query strings benchmarked per route; {opponent} is filled in per request
+# and routes not listed here are requested without a query
+ROUTE_QUERIES = {
+    '/api/drive-data': ['opponent={opponent}'],
+    '/api/plot': ['opponent={opponent}', 'opponent={opponent}&format=columnar', 'opponent={opponent}&max_points=50'],
+    '/api/games/batch': ['opponents={opponent}', 'opponents=all'],
+    '/api/drives/query': ['group_by=result'],
+    '/api/drives/stream': ['opponents={opponent}', '']
+}
+# Server-sent event streams never finish, so they can't be timed this way
+SKIPPED_ROUTES = ('/api/live',)
+PERCENTILES = (50, 90, 95, 99)
+
+# p50 changes smaller than this are treated as noise when comparing
+NOISE_FLOOR_MS = 0.05
+
+class RouteFailed(Exception):
+    """
+    A benchmarked route returned an error status or a success: false body
+    """
+
+def percentile(ordered, p):
+    """
+    Nearest-rank percentile of an ascending list
+    """
+    return ordered[min(len(ordered) - 1, max(0, -(-len(ordered) * p // 100) - 1))]
+
+def measure(run, setup=None, warmup=0, iterations=20, max_seconds=5.0):
+    """
+    Time run() up to iterations times (at least once, at most max_seconds)
+
+    run() is first called warmup times untimed. setup() runs untimed before
+    every timed call. run() may return the response body size in bytes.
+    Returns the case's statistics.
+    """
+    for _ in range(warmup):
+        run()
+
+    timings = []
+    sizes = []
+    deadline = time.perf_counter() + max_seconds
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        size = run()
+        timings.append((time.perf_counter() - start) * 1000)
+        if size is not None:
+            sizes.append(size)
+        if time.perf_counter() > deadline:
+            break
+
+    # One more call under tracemalloc for the peak allocation
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(timings)
+    result = {
+        'runs': len(timings),
+        'mean_ms': round(sum(timings) / len(timings), 4),
+        'min_ms': round(ordered[0], 4),
+        'max_ms': round(ordered[-1], 4),
+        'peak_memory_kb': round(peak / 1024, 1)
+    }
+    for p in PERCENTILES:
+        result[f'p{p}_ms'] = round(percentile(ordered, p), 4)
+    if sizes:
+        result['response_bytes'] = round(sum(sizes) / len(sizes))
+    return result
+
+def benchmark_dataset(iterations, max_seconds):
+    """
+    Measure every case against the dataset app.py is configured for
+
+    Runs inside the per-dataset interpreter started by run_dataset().
+    """
+    import app
+
+    opponents = [game['opponent'] for game in app.load_games_index().get('games', [])]
+    if not opponents:
+        raise RuntimeError(f"No games indexed in {app.data_dir()}")
+    games = [{'opponent': name, 'data': app.load_game_data(name)} for name in opponents]
+
+    def rotating(items):
+        cycle = itertools.cycle(items)
+        return lambda: next(cycle)
+
+    def clear_caches():
+        app.clear_game_cache()
+        app.clear_figure_cache()
+
+    cases = {}
+    failures = {}
+
+    def first_line(text):
+        return str(text).strip().split('\n', 1)[0]
+
+    def add_case(name, run, **kwargs):
+        try:
+            cases[name] = measure(run, iterations=iterations, max_seconds=max_seconds, **kwargs)
+        except RouteFailed as e:
+            failures[name] = str(e)
+        except Exception as e:
+            failures[name] = f"{type(e).__name__}: {first_line(e)}"
+
+    next_name = rotating(opponents)
+    next_game = rotating(games)
+
+    def load():
+        app.load_game_data(next_name())
+
+    def summarize():
+        game = next_game()
+        app.get_game_summary(game['data'], game['opponent'])
+
+    def plot():
+        game = next_game()
+        app.create_score_differential_plot(game['data'], game['opponent'])
+
+    def compare():
+        app.create_comparison_plots(games)
+
+    add_case('load_game_data', load, setup=app.clear_game_cache)
+    # One untimed call first, so the plotly import isn't counted
+    add_case('get_game_summary', summarize, warmup=1)
+    add_case('create_score_differential_plot', plot, warmup=1)
+    add_case('create_comparison_plots', compare, warmup=1)
+
+    # Routes rotate through as many games as there are timed requests, so
+    # the warm runs can fill the caches for exactly those games first
+    sample = opponents[:iterations]
+    client = app.app.test_client()
+    headers = {'Accept-Encoding': 'gzip, br'}
+    rules = sorted(
+        rule.rule for rule in app.app.url_map.iter_rules()
+        if 'GET' in rule.methods and rule.endpoint != 'static'
+        and not rule.arguments and rule.rule not in SKIPPED_ROUTES
+    )
+    for path in rules:
+        for query in ROUTE_QUERIES.get(path, ['']):
+            name = f"{path}?{query}" if query else path
+            next_name = rotating(sample)
+
+            def request_route():
+                url = f"{path}?{query.format(opponent=quote(next_name()))}" if query else path
+                response = client.get(url, headers=headers)
+                body = response.get_data()
+                if response.status_code >= 400:
+                    raise RouteFailed(f"HTTP {response.status_code}")
+                if response.is_json and 'Content-Encoding' not in response.headers:
+                    payload = json.loads(body)
+                    if isinstance(payload, dict) and payload.get('success') is False:
+                        raise RouteFailed(first_line(payload.get('error', 'success: false')))
+                return len(body)
+
+            add_case(f"GET {name}", request_route, warmup=len(sample))
+            add_case(f"GET {name} (cold)", request_route, setup=clear_caches)
+
+    import resource
+    return {
+        'data_dir': app.data_dir(),
+        'games': len(opponents),
+        'drives': sum(len(game['data']) for game in games),
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'failures': failures,
+        'cases': cases
+    }
+
+def run_dataset(data_dir, iterations, max_seconds):
+    """
+    Benchmark one dataset in a fresh interpreter and return its results
+    """
+    env = dict(os.environ, DATA_DIR=data_dir)
+    # Benchmarks measure the JSON-file path with in-process caches only
+    for name in ('SEASON_BUNDLE', 'SEASON_SNAPSHOT', 'DRIVE_STORE_READS', 'METRICS',
+                 'PROFILE_SECRET', 'PROFILE_SAMPLE_RATE'):
+        env.pop(name, None)
+
+    with tempfile.TemporaryDirectory(prefix='benchmark-store-') as store_dir, \
+            tempfile.NamedTemporaryFile(suffix='.json') as result_file:
+        # /api/drives/query needs a drive store of the dataset being measured
+        env['DRIVE_STORE'] = os.path.join(store_dir, drive_store.DEFAULT_STORE_NAME)
+        with contextlib.redirect_stdout(io.StringIO()):
+            drive_store.populate_store(env['DRIVE_STORE'], data_dir)
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), 'measure', '--result-file', result_file.name,
+             '--iterations', str(iterations), '--max-seconds', str(max_seconds)],
+            cwd=BASE_DIR, env=env, check=True, stdout=subprocess.DEVNULL
+        )
+        with open(result_file.name, 'r') as f:
+            return json.load(f)
+
+def run_benchmarks(datasets, data_dir, iterations, max_seconds):
+    """
+    Benchmark each named dataset: "real" (or data_dir) and synthetic sizes
+    """
+    results = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'iterations': iterations,
+        'max_seconds': max_seconds,
+        'datasets': {}
+    }
+    for dataset in datasets:
+        start = time.perf_counter()
+        if dataset == 'real':
+            result = run_dataset(data_dir or BASE_DIR, iterations, max_seconds)
+        else:
+            with tempfile.TemporaryDirectory(prefix='benchmark-season-') as season_dir:
+                synthetic_data.generate(season_dir, games=int(dataset))
+                result = run_dataset(season_dir, iterations, max_seconds)
+            dataset = f"synthetic-{dataset}"
+        results['datasets'][dataset] = result
+        print(f"{dataset}: {result['games']} games, {len(result['cases'])} cases in {time.perf_counter() - start:.1f}s")
+        for name, error in result['failures'].items():
+            print(f"  {name} failed: {error}")
+    return results
+
+def print_results(results):
+    for dataset, result in results['datasets'].items():
+        print(f"\n{dataset} ({result['games']} games, {result['drives']} drives, max RSS {result['max_rss_kb'] / 1024:.0f} MB)")
+        print(f"  {'case':<60} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak KB':>9} {'bytes':>9}")
+        for name, case in result['cases'].items():
+            print(
+                f"  {name:<60} {case['p50_ms']:>9.3f} {case['p95_ms']:>9.3f} {case['p99_ms']:>9.3f} "
+                f"{case['peak_memory_kb']:>9.0f} {case.get('response_bytes', ''):>9}"
+            )
+
+def compare_results(baseline, current, threshold):
+    """
+    Print p50/p95 changes per case and return the number of regressions
+
+    A case regresses when its p50 grows by more than threshold percent and
+    by more than NOISE_FLOOR_MS. Changed response sizes are reported too.
+    """
+    if baseline.get('iterations') != current.get('iterations'):
+        # Routes rotate through one game per iteration, so sizes differ too
+        print(f"Note: baseline ran {baseline.get('iterations')} iterations per case, this run {current.get('iterations')}")
+    regressions = 0
+    for dataset, result in current['datasets'].items():
+        base = baseline['datasets'].get(dataset)
+        if base is None:
+            print(f"\n{dataset}: not in baseline")
+            continue
+        print(f"\n{dataset}")
+        print(f"  {'case':<60} {'p50 base':>9} {'p50 now':>9} {'change':>8} {'p95 change':>11}")
+        for name in base['cases']:
+            if name not in result['cases']:
+                print(f"  {name:<60} {'':>9} {'':>9}   (failed: {result['failures'].get(name, 'not run')})")
+        for name, case in result['cases'].items():
+            base_case = base['cases'].get(name)
+            if base_case is None:
+                print(f"  {name:<60} {'':>9} {case['p50_ms']:>9.3f}   (new)")
+                continue
+            p50_change = (case['p50_ms'] - base_case['p50_ms']) / base_case['p50_ms'] * 100 if base_case['p50_ms'] else 0.0
+            p95_change = (case['p95_ms'] - base_case['p95_ms']) / base_case['p95_ms'] * 100 if base_case['p95_ms'] else 0.0
+            flags = []
+            if p50_change > threshold and case['p50_ms'] - base_case['p50_ms'] > NOISE_FLOOR_MS:
+                flags.append('REGRESSION')
+                regressions += 1
+            if case.get('response_bytes') != base_case.get('response_bytes'):
+                flags.append(f"bytes {base_case.get('response_bytes')} -> {case.get('response_bytes')}")
+            print(
+                f"  {name:<60} {base_case['p50_ms']:>9.3f} {case['p50_ms']:>9.3f} "
+                f"{p50_change:>+7.1f}% {p95_change:>+10.1f}%  {' '.join(flags)}"
+            )
+    print(f"\n{regressions} regression(s) above {threshold:g}%")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the app.py hot paths and routes')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run the benchmarks and write a JSON report')
+    run_parser.add_argument('--datasets', default=DEFAULT_DATASETS,
+                            help=f'comma-separated "real" and synthetic season sizes (default: {DEFAULT_DATASETS})')
+    run_parser.add_argument('--data-dir', help='directory benchmarked as "real" (default: this directory)')
+    run_parser.add_argument('--iterations', type=int, default=20, help='calls per case')
+    run_parser.add_argument('--max-seconds', type=float, default=5.0, help='time limit per case')
+    run_parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'JSON report path (default: {DEFAULT_OUTPUT})')
+    run_parser.add_argument('--baseline', help='compare against this earlier report')
+    run_parser.add_argument('--threshold', type=float, default=10.0, help='p50 regression threshold in percent')
+
+    compare_parser = subparsers.add_parser('compare', help='compare two JSON reports')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=10.0, help='p50 regression threshold in percent')
+
+    # Internal: measures one dataset in a fresh interpreter (see run_dataset)
+    measure_parser = subparsers.add_parser('measure')
+    measure_parser.add_argument('--result-file', required=True)
+    measure_parser.add_argument('--iterations', type=int, default=20)
+    measure_parser.add_argument('--max-seconds', type=float, default=5.0)
+
+    args = parser.parse_args()
+
+    if args.command == 'measure':
+        sys.path.insert(0, BASE_DIR)
+        result = benchmark_dataset(args.iterations, args.max_seconds)
+        with open(args.result_file, 'w') as f:
+            json.dump(result, f)
+        return 0
+
+    if args.command == 'compare':
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        with open(args.current, 'r') as f:
+            current = json.load(f)
+        return 1 if compare_results(baseline, current, args.threshold) else 0
+
+    datasets = [dataset.strip() for dataset in args.datasets.split(',') if dataset.strip()]
+    data_dir = os.path.abspath(args.data_dir) if args.data_dir else None
+    results = run_benchmarks(datasets, data_dir, args.iterations, args.max_seconds)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print_results(results)
+    print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        return 1 if compare_results(baseline, results, args.threshold) else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
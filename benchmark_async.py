@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Side-by-side throughput benchmark: sync gunicorn app vs async uvicorn app
+
+Starts `gunicorn app:app` and `uvicorn asgi_app:app` on free local ports with
+the same number of workers. Each server then gets the same request mix at
+increasing concurrency levels. Reports requests/s, p50/p99 latency and
+errors per level.
+
+Usage:
+    python benchmark_async.py [--workers 2] [--concurrency 16,64,256] [--duration 10]
+"""
+
+import os
+import sys
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+from urllib.parse import quote
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def request_mix():
+    """
+    Paths requested in rotation: the calls index.html makes for one game
+    """
+    sys.path.insert(0, BASE_DIR)
+    import app as drive_app
+
+    index_record = drive_app.load_games_index_record()
+    opponents = [game['opponent'] for game in index_record['data'].get('games', [])] if index_record else []
+    paths = ['/api/games', '/api/plot-template']
+    for opponent in opponents:
+        name = quote(opponent)
+        paths += [f'/api/drive-data?opponent={name}', f'/api/plot?opponent={name}&format=columnar']
+    paths.append('/api/comparison-plot')
+    return paths
+
+def start_server(kind, port, workers):
+    if kind == 'sync':
+        command = [
+            sys.executable, '-m', 'gunicorn', 'app:app',
+            '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--log-level', 'warning'
+        ]
+    else:
+        command = [
+            sys.executable, '-m', 'uvicorn', 'asgi_app:app',
+            '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers),
+            '--log-level', 'warning', '--no-access-log'
+        ]
+    process = subprocess.Popen(command, cwd=BASE_DIR)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{kind} server did not start on port {port}")
+
+async def fetch(port, path):
+    """
+    Issue one GET over a fresh connection; return (status, response bytes)
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        writer.write(
+            f'GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nAccept-Encoding: gzip\r\n'
+            f'Connection: close\r\n\r\n'.encode('latin-1')
+        )
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    status = int(response.split(b' ', 2)[1]) if response.startswith(b'HTTP/') else 0
+    return status, len(response)
+
+async def run_level(port, paths, concurrency, duration):
+    latencies = []
+    errors = 0
+    received = 0
+    next_path = 0
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        nonlocal errors, received, next_path
+        while time.perf_counter() < deadline:
+            path = paths[next_path % len(paths)]
+            next_path += 1
+            start = time.perf_counter()
+            try:
+                status, size = await fetch(port, path)
+            except OSError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            received += size
+            if status != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(0.50),
+        'p99_ms': percentile(0.99),
+        'errors': errors,
+        'mb': received / 1e6
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare sync (gunicorn) and async (uvicorn) serving')
+    parser.add_argument('--workers', type=int, default=2, help='worker processes per server')
+    parser.add_argument('--concurrency', default='16,64,256', help='comma-separated client counts')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per concurrency level')
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(',')]
+    paths = request_mix()
+
+    print(f"{'server':<8} {'conc':>6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7} {'MB':>8}")
+    for kind in ('sync', 'async'):
+        port = free_port()
+        process = start_server(kind, port, args.workers)
+        try:
+            # Warm each worker's caches before measuring
+            asyncio.run(run_level(port, paths, args.workers * 4, 2))
+            for concurrency in levels:
+                result = asyncio.run(run_level(port, paths, concurrency, args.duration))
+                print(
+                    f"{kind:<8} {concurrency:>6} {result['rps']:>9.1f} {result['p50_ms']:>9.1f} "
+                    f"{result['p99_ms']:>9.1f} {result['errors']:>7} {result['mb']:>8.1f}"
+                )
+        finally:
+            process.terminate()
+            process.wait()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
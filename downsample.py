@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Largest-Triangle-Three-Buckets downsampling for plot series
+
+LTTB keeps the points that best preserve a line's visual shape: each bucket
+contributes the point forming the largest triangle with the previously kept
+point and the average of the next bucket. Callers can also pin points that
+must survive, such as scoring changes. The series is split at those points,
+and the remaining budget is shared between the segments in between.
+"""
+
+def lttb_indices(xs, ys, threshold):
+    """
+    Return the indices of at most threshold points chosen by LTTB
+
+    The first and last points are always kept.
+    """
+    n = len(xs)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1]
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket (or the last point for the final bucket)
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, n)
+        if next_start >= next_end:
+            next_start, next_end = n - 1, n
+        count = next_end - next_start
+        average_x = sum(xs[next_start:next_end]) / count
+        average_y = sum(ys[next_start:next_end]) / count
+
+        previous_x = xs[previous]
+        previous_y = ys[previous]
+        best_area = -1
+        best = start
+        for i in range(start, end):
+            area = abs(
+                (previous_x - average_x) * (ys[i] - previous_y)
+                - (previous_x - xs[i]) * (average_y - previous_y)
+            )
+            if area > best_area:
+                best_area = area
+                best = i
+
+        selected.append(best)
+        previous = best
+
+    selected.append(n - 1)
+    return selected
+
+def downsample_indices(xs, ys, max_points, must_include=()):
+    """
+    Return sorted indices of about max_points points, keeping must_include
+
+    The first and last points and every index in must_include are always
+    kept, even if that exceeds max_points. Any budget left over is spread
+    over the gaps between those points in proportion to their length, and
+    each gap is filled by LTTB.
+    """
+    n = len(xs)
+    if max_points is None or n <= max_points:
+        return list(range(n))
+
+    anchors = sorted(set(must_include) | {0, n - 1})
+    budget = max_points - len(anchors)
+    interior = n - len(anchors)
+    if budget <= 0 or interior <= 0:
+        return anchors
+
+    # Largest-remainder split of the budget over the gaps between anchors
+    gaps = [(a, b, b - a - 1) for a, b in zip(anchors, anchors[1:]) if b - a > 1]
+    shares = [budget * size / interior for _, _, size in gaps]
+    counts = [int(share) for share in shares]
+    by_remainder = sorted(range(len(gaps)), key=lambda i: shares[i] - counts[i], reverse=True)
+    for i in by_remainder[:budget - sum(counts)]:
+        counts[i] += 1
+
+    selected = list(anchors)
+    for (a, b, size), count in zip(gaps, counts):
+        if count <= 0:
+            continue
+        if count >= size:
+            selected.extend(range(a + 1, b))
+            continue
+        # LTTB over the gap including both anchors; keep only its interior picks
+        picks = lttb_indices(xs[a:b + 1], ys[a:b + 1], count + 2)
+        selected.extend(a + i for i in picks[1:-1])
+
+    return sorted(selected)
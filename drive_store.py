@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Optional SQLite storage backend for drive data
+
+Mirrors games_data/*.json into a single indexed database so cross-game
+questions ("all opponent touchdowns in the 4th quarter") become one indexed
+query instead of a scan over every game file. The app can also read
+individual games through the store (see DRIVE_STORE in app.py).
+
+Usage:
+    python drive_store.py build [--db PATH]
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+
+from game_series import game_slug
+from seasons import DEFAULT_SEASON, season_dir
+
+DEFAULT_STORE_NAME = 'drives.sqlite3'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    opponent TEXT NOT NULL UNIQUE,
+    slug TEXT NOT NULL UNIQUE,
+    url TEXT,
+    version TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    drive_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS drives (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    quarter INTEGER NOT NULL,
+    time TEXT NOT NULL,
+    elapsed_seconds INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    result TEXT NOT NULL,
+    play_description TEXT NOT NULL,
+    mercyhurst_score INTEGER NOT NULL,
+    opponent_score INTEGER NOT NULL,
+    score_differential INTEGER NOT NULL,
+    is_mercyhurst INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_drives_team ON drives (team);
+CREATE INDEX IF NOT EXISTS idx_drives_result ON drives (result);
+CREATE INDEX IF NOT EXISTS idx_drives_quarter ON drives (quarter);
+CREATE INDEX IF NOT EXISTS idx_drives_elapsed ON drives (elapsed_seconds);
+"""
+
+DRIVE_FIELDS = (
+    'quarter',
+    'time',
+    'elapsed_seconds',
+    'team',
+    'result',
+    'play_description',
+    'mercyhurst_score',
+    'opponent_score',
+    'score_differential'
+)
+
+# Columns a query may group by, mapped to their SQL expressions
+GROUP_COLUMNS = {
+    'opponent': 'g.opponent',
+    'team': 'd.team',
+    'result': 'd.result',
+    'quarter': 'd.quarter'
+}
+
+MAX_PAGE_SIZE = 1000
+
+def connect(db_path, readonly=False):
+    """
+    Open a connection to the drive store, creating the schema if writable
+    """
+    if readonly:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(db_path)
+        conn.execute('PRAGMA foreign_keys = ON')
+        conn.executescript(SCHEMA)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def populate_store(db_path, base_dir):
+    """
+    Sync every indexed game under base_dir into the store
+
+    Games whose file content hash is unchanged are skipped; games no longer
+    in games_index.json are removed. Returns (updated, unchanged) counts.
+    """
+    with open(os.path.join(base_dir, 'games_index.json'), 'r') as f:
+        games_index = json.load(f)
+
+    conn = connect(db_path)
+    updated = unchanged = 0
+    seen = []
+    try:
+        with conn:
+            for game in games_index.get('games', []):
+                opponent_name = game['opponent']
+                slug = game_slug(opponent_name)
+                filepath = os.path.join(base_dir, 'games_data', f"game_{slug}.json")
+                try:
+                    with open(filepath, 'rb') as f:
+                        raw = f.read()
+                    mtime_ns = os.stat(filepath).st_mtime_ns
+                except FileNotFoundError:
+                    print(f"Skipping {opponent_name}: {filepath} not found")
+                    continue
+
+                seen.append(slug)
+                version = hashlib.sha1(raw).hexdigest()
+                row = conn.execute('SELECT id, version FROM games WHERE slug = ?', (slug,)).fetchone()
+                if row is not None and row['version'] == version:
+                    unchanged += 1
+                    continue
+
+                drives = json.loads(raw)
+                if row is not None:
+                    conn.execute('DELETE FROM games WHERE id = ?', (row['id'],))
+                game_id = conn.execute(
+                    'INSERT INTO games (opponent, slug, url, version, mtime_ns, drive_count) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (opponent_name, slug, game.get('url'), version, mtime_ns, len(drives))
+                ).lastrowid
+                conn.executemany(
+                    'INSERT INTO drives (game_id, seq, quarter, time, elapsed_seconds, team, result, '
+                    'play_description, mercyhurst_score, opponent_score, score_differential, is_mercyhurst) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [
+                        (
+                            game_id, seq, drive['quarter'], drive['time'], drive['elapsed_seconds'],
+                            drive['team'], drive['result'], drive.get('play_description', ''),
+                            drive['mercyhurst_score'], drive['opponent_score'], drive['score_differential'],
+                            int(drive['team'] == 'Mercyhurst')
+                        )
+                        for seq, drive in enumerate(drives)
+                    ]
+                )
+                updated += 1
+
+            placeholders = ','.join('?' * len(seen))
+            conn.execute(f'DELETE FROM games WHERE slug NOT IN ({placeholders})', seen)
+    finally:
+        conn.close()
+
+    return updated, unchanged
+
+def load_game(conn, opponent_name):
+    """
+    Return (version, mtime_ns, drives) for one game, or None if absent
+    """
+    game = conn.execute(
+        'SELECT id, version, mtime_ns FROM games WHERE slug = ?', (game_slug(opponent_name),)
+    ).fetchone()
+    if game is None:
+        return None
+    rows = conn.execute(
+        f"SELECT {', '.join(DRIVE_FIELDS)} FROM drives WHERE game_id = ? ORDER BY seq", (game['id'],)
+    ).fetchall()
+    return game['version'], game['mtime_ns'], [dict(row) for row in rows]
+
+def game_version(conn, opponent_name):
+    """
+    Return (version, mtime_ns) for one game without reading its drives
+    """
+    game = conn.execute(
+        'SELECT version, mtime_ns FROM games WHERE slug = ?', (game_slug(opponent_name),)
+    ).fetchone()
+    return (game['version'], game['mtime_ns']) if game else None
+
+def query_drives(conn, opponent=None, team=None, result=None, quarter=None,
+                 min_elapsed=None, max_elapsed=None, group_by=None, limit=100, offset=0):
+    """
+    Filter drives across all games, either paging rows or aggregating them
+
+    team may be "mercyhurst", "opponent" or an exact team name. group_by is
+    one of GROUP_COLUMNS; grouped queries return drive counts per group.
+    """
+    clauses = []
+    params = []
+    if opponent:
+        clauses.append('g.slug = ?')
+        params.append(game_slug(opponent))
+    if team:
+        if team.lower() == 'mercyhurst':
+            clauses.append('d.is_mercyhurst = 1')
+        elif team.lower() == 'opponent':
+            clauses.append('d.team = g.opponent')
+        else:
+            clauses.append('d.team = ?')
+            params.append(team)
+    if result:
+        clauses.append('d.result = ?')
+        params.append(result)
+    if quarter is not None:
+        clauses.append('d.quarter = ?')
+        params.append(quarter)
+    if min_elapsed is not None:
+        clauses.append('d.elapsed_seconds >= ?')
+        params.append(min_elapsed)
+    if max_elapsed is not None:
+        clauses.append('d.elapsed_seconds <= ?')
+        params.append(max_elapsed)
+
+    source = 'FROM drives d JOIN games g ON g.id = d.game_id'
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(0, offset)
+
+    if group_by:
+        if group_by not in GROUP_COLUMNS:
+            raise ValueError(f"group_by must be one of {', '.join(GROUP_COLUMNS)}")
+        column = GROUP_COLUMNS[group_by]
+        rows = conn.execute(
+            f"SELECT {column} AS value, COUNT(*) AS drives, COUNT(DISTINCT d.game_id) AS games "
+            f"{source}{where} GROUP BY {column} ORDER BY drives DESC, value",
+            params
+        ).fetchall()
+        return {'group_by': group_by, 'groups': [dict(row) for row in rows]}
+
+    total = conn.execute(f"SELECT COUNT(*) {source}{where}", params).fetchone()[0]
+    columns = ', '.join(f'd.{field}' for field in DRIVE_FIELDS)
+    rows = conn.execute(
+        f"SELECT g.opponent AS opponent, {columns} {source}{where} "
+        f"ORDER BY g.id, d.seq LIMIT ? OFFSET ?",
+        params + [limit, offset]
+    ).fetchall()
+    return {'total': total, 'limit': limit, 'offset': offset, 'drives': [dict(row) for row in rows]}
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync games_data/ into the SQLite drive store')
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--db', help=f'database path (default: {DEFAULT_STORE_NAME})')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    db_path = args.db or os.path.join(base_dir, DEFAULT_STORE_NAME)
+
+    # Bundles and the store hold the default season (see seasons.py)
+    updated, unchanged = populate_store(db_path, season_dir(base_dir, DEFAULT_SEASON))
+    print(f"Drive store {db_path}: {updated} games updated, {unchanged} unchanged")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Compact columnar representation of a game's drive data
+
+A game is stored as one array per numeric field plus small integer codes for
+the team and result strings, instead of a list of dicts with repeated keys.
+Individual drives are exposed as lightweight read-only views that still
+support dict-style access, so code written against the JSON records keeps
+working unchanged.
+"""
+
+import sys
+import threading
+from array import array
+
+FIELDS = (
+    'quarter',
+    'time',
+    'elapsed_seconds',
+    'team',
+    'result',
+    'play_description',
+    'mercyhurst_score',
+    'opponent_score',
+    'score_differential'
+)
+
+# Marker rows added by the scrapers around the real scoring events
+MARKER_LABELS = ('Game Start', 'Game End')
+
+# Process-wide category table shared by every GameSeries. Team names and
+# results repeat across games, so each distinct string is stored only once.
+_categories = []
+_category_codes = {}
+_category_lock = threading.Lock()
+
+def game_slug(opponent_name):
+    """
+    Normalize an opponent name the same way game file names are built
+    """
+    return opponent_name.lower().replace(' ', '_')
+
+def category_code(value):
+    """
+    Return the interned integer code for a team or result string
+    """
+    code = _category_codes.get(value)
+    if code is None:
+        with _category_lock:
+            code = _category_codes.get(value)
+            if code is None:
+                code = len(_categories)
+                _categories.append(sys.intern(value))
+                _category_codes[value] = code
+    return code
+
+def category_name(code):
+    """
+    Return the string for an interned category code
+    """
+    return _categories[code]
+
+def category_table():
+    """
+    Return a snapshot of the category table, indexed by code
+    """
+    return list(_categories)
+
+def _numeric_column(values):
+    """
+    Pack numbers into an int array, falling back to doubles for fractions
+    """
+    if all(isinstance(value, int) for value in values):
+        return array('i', values)
+    return array('d', values)
+
+class Drive:
+    """
+    Read-only view of a single drive inside a GameSeries
+    """
+    __slots__ = ('_series', '_index')
+
+    def __init__(self, series, index):
+        self._series = series
+        self._index = index
+
+    @property
+    def quarter(self):
+        return self._series.quarter[self._index]
+
+    @property
+    def time(self):
+        return self._series.time[self._index]
+
+    @property
+    def elapsed_seconds(self):
+        return self._series.elapsed_seconds[self._index]
+
+    @property
+    def team(self):
+        return _categories[self._series.team_codes[self._index]]
+
+    @property
+    def result(self):
+        return _categories[self._series.result_codes[self._index]]
+
+    @property
+    def play_description(self):
+        return self._series.play_description[self._index]
+
+    @property
+    def mercyhurst_score(self):
+        return self._series.mercyhurst_score[self._index]
+
+    @property
+    def opponent_score(self):
+        return self._series.opponent_score[self._index]
+
+    @property
+    def score_differential(self):
+        return self._series.score_differential[self._index]
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in FIELDS:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        return FIELDS
+
+    def to_dict(self):
+        """
+        Return the drive as a plain dict in the games_data JSON layout
+        """
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __repr__(self):
+        return f"Drive({self.to_dict()!r})"
+
+class GameSeries:
+    """
+    Columnar, immutable drive data for one game
+
+    Behaves as a read-only sequence of Drive views. Hot paths should use the
+    column attributes directly rather than iterating drives.
+    """
+    __slots__ = (
+        'quarter',
+        'time',
+        'elapsed_seconds',
+        'team_codes',
+        'result_codes',
+        'play_description',
+        'mercyhurst_score',
+        'opponent_score',
+        'score_differential',
+        '_plot_indices'
+    )
+
+    def __init__(self, quarter, time, elapsed_seconds, team_codes, result_codes,
+                 play_description, mercyhurst_score, opponent_score, score_differential):
+        self.quarter = quarter
+        self.time = time
+        self.elapsed_seconds = elapsed_seconds
+        self.team_codes = team_codes
+        self.result_codes = result_codes
+        self.play_description = play_description
+        self.mercyhurst_score = mercyhurst_score
+        self.opponent_score = opponent_score
+        self.score_differential = score_differential
+        self._plot_indices = None
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a GameSeries from a list of drive dicts as stored in games_data
+        """
+        return cls(
+            quarter=array('b', [record['quarter'] for record in records]),
+            time=[sys.intern(record['time']) for record in records],
+            elapsed_seconds=_numeric_column([record['elapsed_seconds'] for record in records]),
+            team_codes=array('H', [category_code(record['team']) for record in records]),
+            result_codes=array('H', [category_code(record['result']) for record in records]),
+            play_description=[record.get('play_description', '') for record in records],
+            mercyhurst_score=array('i', [record['mercyhurst_score'] for record in records]),
+            opponent_score=array('i', [record['opponent_score'] for record in records]),
+            score_differential=array('i', [record['score_differential'] for record in records])
+        )
+
+    def __len__(self):
+        return len(self.team_codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Drive(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('drive index out of range')
+        return Drive(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield Drive(self, index)
+
+    def to_records(self):
+        """
+        Return the drives as a list of plain dicts in the games_data layout
+        """
+        teams = [_categories[code] for code in self.team_codes]
+        results = [_categories[code] for code in self.result_codes]
+        return [
+            dict(zip(FIELDS, row))
+            for row in zip(
+                self.quarter,
+                self.time,
+                self.elapsed_seconds,
+                teams,
+                results,
+                self.play_description,
+                self.mercyhurst_score,
+                self.opponent_score,
+                self.score_differential
+            )
+        ]
+
+    def plot_indices(self):
+        """
+        Return the indices of real scoring drives, skipping marker rows
+
+        Mirrors the filtering done for the score differential plots: drops
+        Game Start / Game End rows and rows without a play description.
+        """
+        if self._plot_indices is None:
+            markers = {category_code(label) for label in MARKER_LABELS}
+            self._plot_indices = tuple(
+                index
+                for index, (team, result, description) in enumerate(
+                    zip(self.team_codes, self.result_codes, self.play_description)
+                )
+                if team not in markers and result not in markers and description.strip()
+            )
+        return self._plot_indices
@@ -0,0 +1,20 @@
+"""
+Gunicorn settings, picked up automatically by `gunicorn app:app`
+
+With SEASON_SNAPSHOT set, the master publishes a fresh season snapshot
+before any worker starts and preloads the app. Workers then share the
+imported modules copy-on-write and map the same snapshot files, rather than
+each loading and rendering the season on its own.
+"""
+
+import os
+import sys
+import subprocess
+
+if os.environ.get('SEASON_SNAPSHOT'):
+    preload_app = True
+
+    def on_starting(server):
+        # Rendered in a child process so Plotly never loads into the master
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        subprocess.run([sys.executable, 'season_snapshot.py', 'build'], cwd=base_dir, check=True)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Local load test: simulated dashboard viewers against a gunicorn config
+
+Each viewer replays dashboard sessions in a loop. The default "dashboard"
+profile makes the requests templates/index.html makes: /api/seasons, then
+/api/games, then the first game (/api/plot-template and
+/api/games/batch?opponents=<game>), a few more games (/api/games/batch), and
+sometimes the comparison grid (/api/comparison-grid). Live updates are not
+replayed; an open stream holds a worker thread but sends no requests. The
+"legacy" profile replays the page before /api/games/batch:
+/api/drive-data and /api/plot per game, and /api/comparison-plot. Viewers
+pause for a think time between requests. Concurrency ramps through the given
+viewer counts. Each level reports throughput, p50/p95/p99 latency and error rate per route. A request
+is an error if the connection fails, it times out, it returns a status other
+than 200, or its body is success: false.
+
+By default the script starts `gunicorn app:app` on a free local port, with
+gunicorn.conf.py and any --gunicorn-args, so configs can be compared. Use
+--url to test a server that is already running instead.
+
+Usage:
+    python loadtest.py [--concurrency 1,4,16,64] [--duration 20]
+                       [--gunicorn-args "--workers 4 --threads 4"]
+                       [--data-dir DIR] [--season 2024] [--profile dashboard]
+                       [--games-per-session 1-3] [--comparison-rate 0.2]
+                       [--think 0.5-2] [--timeout 30] [--max-error-rate 0.01]
+                       [--max-p99 MS] [--seed 0] [--output results.json]
+    python loadtest.py --url http://127.0.0.1:5000 [...]
+"""
+
+import os
+import sys
+import json
+import time
+import shlex
+import random
+import socket
+import asyncio
+import argparse
+import subprocess
+from collections import defaultdict
+from urllib.parse import urlencode, urlsplit
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILES = {
+    'dashboard': ('/api/seasons', '/api/games', '/api/plot-template', '/api/games/batch', '/api/comparison-grid'),
+    'legacy': ('/api/games', '/api/drive-data', '/api/plot', '/api/comparison-plot')
+}
+ROUTES = tuple(dict.fromkeys(route for routes in PROFILES.values() for route in routes))
+PERCENTILES = (50, 95, 99)
+
+def parse_range(text):
+    """
+    Parse "N" or "MIN-MAX" into an inclusive (min, max) pair of floats
+    """
+    low, _, high = text.partition('-')
+    return float(low), float(high or low)
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(port, gunicorn_args, data_dir=None):
+    """
+    Start `gunicorn app:app` on a local port and wait until it accepts connections
+    """
+    command = [
+        sys.executable, '-m', 'gunicorn', 'app:app',
+        '--bind', f'127.0.0.1:{port}', '--log-level', 'warning'
+    ] + shlex.split(gunicorn_args)
+    env = dict(os.environ)
+    if data_dir:
+        env['DATA_DIR'] = os.path.abspath(data_dir)
+    process = subprocess.Popen(command, cwd=BASE_DIR, env=env)
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"gunicorn did not start on port {port}")
+
+async def fetch(host, port, path, timeout):
+    """
+    GET path over a fresh connection like a browser would
+
+    Returns (status, headers, body). Error responses are small uncompressed
+    JSON, so bodies are never decompressed here.
+    """
+    async def exchange():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(
+                f'GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nAccept-Encoding: gzip, br\r\n'
+                f'Connection: close\r\n\r\n'.encode('latin-1')
+            )
+            await writer.drain()
+            return await reader.read()
+        finally:
+            writer.close()
+
+    response = await asyncio.wait_for(exchange(), timeout)
+    head, _, body = response.partition(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1]) if lines[0].startswith('HTTP/') else 0
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+def is_error(status, headers, body):
+    if status != 200:
+        return True
+    # Routes report failures as {"error": ..., "success": false} with status 200
+    return 'content-encoding' not in headers and body.rstrip().endswith(b'"success":false}')
+
+class LevelStats:
+    """
+    Per-route latencies and errors for one concurrency level
+    """
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.bytes = defaultdict(int)
+        self.sessions = 0
+
+    def record(self, route, latency, error, size=0):
+        self.latencies[route].append(latency)
+        self.bytes[route] += size
+        if error:
+            self.errors[route] += 1
+
+    def summary(self, elapsed):
+        """
+        Return {route: results} plus an 'all' row over every route
+        """
+        routes = [route for route in ROUTES if self.latencies[route]]
+        rows = {route: (self.latencies[route], self.errors[route], self.bytes[route]) for route in routes}
+        rows['all'] = (
+            [latency for route in routes for latency in self.latencies[route]],
+            sum(self.errors[route] for route in routes),
+            sum(self.bytes[route] for route in routes)
+        )
+
+        results = {}
+        for route, (latencies, errors, size) in rows.items():
+            latencies = sorted(latencies)
+            result = {
+                'requests': len(latencies),
+                'rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+                'errors': errors,
+                'error_rate': round(errors / len(latencies), 4) if latencies else 0.0,
+                'mb': round(size / 1e6, 3)
+            }
+            for p in PERCENTILES:
+                value = latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] if latencies else 0.0
+                result[f'p{p}_ms'] = round(value * 1000, 2)
+            results[route] = result
+        return results
+
+async def run_level(host, port, opponents, viewers, duration, options, rng):
+    """
+    Run viewers concurrent dashboard sessions for duration seconds
+    """
+    stats = LevelStats()
+    deadline = time.perf_counter() + duration
+    season = {'season': options.season} if options.season else {}
+
+    async def get(route, params=None, in_season=True):
+        query = urlencode({**(season if in_season else {}), **(params or {})})
+        path = f'{route}?{query}' if query else route
+        start = time.perf_counter()
+        try:
+            status, headers, body = await fetch(host, port, path, options.timeout)
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+            stats.record(route, time.perf_counter() - start, True)
+            return
+        stats.record(route, time.perf_counter() - start, is_error(status, headers, body), len(body))
+
+    async def think():
+        await asyncio.sleep(rng.uniform(*options.think))
+
+    async def dashboard_session():
+        # Page load: the seasons, then the season's games, then the first
+        # game's data together with the plot template
+        await get('/api/seasons', in_season=False)
+        await get('/api/games')
+        for game in range(rng.randint(*options.games_per_session)):
+            if time.perf_counter() >= deadline:
+                break
+            params = {'opponents': rng.choice(opponents)}
+            if game == 0:
+                await asyncio.gather(get('/api/plot-template'), get('/api/games/batch', params))
+            else:
+                await think()
+                await get('/api/games/batch', params)
+        if time.perf_counter() < deadline and rng.random() < options.comparison_rate:
+            await think()
+            await get('/api/comparison-grid')
+
+    async def legacy_session():
+        await get('/api/games')
+        for _ in range(rng.randint(*options.games_per_session)):
+            if time.perf_counter() >= deadline:
+                break
+            await think()
+            params = {'opponent': rng.choice(opponents)}
+            # The old page loaded the table and chart of a game together
+            await asyncio.gather(get('/api/drive-data', params), get('/api/plot', params))
+        if time.perf_counter() < deadline and rng.random() < options.comparison_rate:
+            await think()
+            await get('/api/comparison-plot')
+
+    session = dashboard_session if options.profile == 'dashboard' else legacy_session
+
+    async def viewer():
+        # Stagger arrivals so a level doesn't start with one burst
+        await asyncio.sleep(rng.uniform(0, options.think[1]))
+        while time.perf_counter() < deadline:
+            await session()
+            stats.sessions += 1
+            await think()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(viewer() for _ in range(viewers)))
+    return stats, time.perf_counter() - start
+
+def get_json(host, port, path, timeout):
+    status, headers, body = asyncio.run(fetch(host, port, path, timeout))
+    if status != 200 or 'content-encoding' in headers:
+        raise RuntimeError(f"GET {path} returned status {status}")
+    result = json.loads(body)
+    if not result.get('success'):
+        raise RuntimeError(f"GET {path} failed: {result.get('error')}")
+    return result
+
+def load_default_season(host, port, timeout):
+    """
+    Return the season the dashboard opens, which it then names in every request
+    """
+    return get_json(host, port, '/api/seasons', timeout)['default']
+
+def load_opponents(host, port, season, timeout):
+    """
+    Return the opponents the server lists, the pool sessions pick games from
+    """
+    path = '/api/games' + ('?' + urlencode({'season': season}) if season else '')
+    return [game['opponent'] for game in get_json(host, port, path, timeout)['games']]
+
+def print_level(viewers, sessions, results):
+    print(f"\n{viewers} viewers, {sessions} sessions")
+    print(f"  {'route':<22} {'requests':>9} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    for route, result in results.items():
+        print(
+            f"  {route:<22} {result['requests']:>9} {result['rps']:>8.1f} {result['p50_ms']:>9.1f} "
+            f"{result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f} {result['error_rate']:>7.1%}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description='Ramp simulated dashboard viewers against a local server')
+    parser.add_argument('--url', help='test a running server (default: start gunicorn app:app locally)')
+    parser.add_argument('--gunicorn-args', default='--workers 2', help='extra gunicorn options for the started server')
+    parser.add_argument('--data-dir', help='DATA_DIR for the started server, e.g. from synthetic_data.py')
+    parser.add_argument('--season', help='season to request (default: the server\'s default season)')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='dashboard',
+                        help='requests a session makes: the current dashboard page (default) or the '
+                             'pre-batch page')
+    parser.add_argument('--concurrency', default='1,4,16,64', help='comma-separated viewer counts, run in order')
+    parser.add_argument('--duration', type=float, default=20, help='seconds per concurrency level')
+    parser.add_argument('--warmup', type=float, default=5, help='seconds of unmeasured load before the ramp')
+    parser.add_argument('--games-per-session', default='1-3', help='games opened per session, N or MIN-MAX')
+    parser.add_argument('--comparison-rate', type=float, default=0.2,
+                        help='fraction of sessions that open the comparison view')
+    parser.add_argument('--think', default='0.5-2', help='seconds between a viewer\'s requests, N or MIN-MAX')
+    parser.add_argument('--timeout', type=float, default=30, help='seconds before a request counts as failed')
+    parser.add_argument('--max-error-rate', type=float, default=0.01,
+                        help='stop the ramp once a level\'s error rate exceeds this')
+    parser.add_argument('--max-p99', type=float, help='also stop once a level\'s overall p99 exceeds this many ms')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    low, high = parse_range(args.games_per_session)
+    args.games_per_session = (int(low), int(high))
+    args.think = parse_range(args.think)
+    levels = [int(level) for level in args.concurrency.split(',')]
+    rng = random.Random(args.seed)
+
+    process = None
+    if args.url:
+        target = urlsplit(args.url)
+        host, port = target.hostname, target.port or 80
+    else:
+        host, port = '127.0.0.1', free_port()
+        print(f"Starting gunicorn app:app {args.gunicorn_args} on port {port}")
+        process = start_server(port, args.gunicorn_args, args.data_dir)
+
+    try:
+        if args.profile == 'dashboard' and not args.season:
+            args.season = load_default_season(host, port, args.timeout)
+        opponents = load_opponents(host, port, args.season, args.timeout)
+        if not opponents:
+            print("The server lists no games")
+            return 1
+
+        if args.warmup > 0:
+            asyncio.run(run_level(host, port, opponents, levels[0], args.warmup, args, rng))
+
+        report = {
+            'target': f'{host}:{port}',
+            'gunicorn_args': None if args.url else args.gunicorn_args,
+            'profile': args.profile,
+            'levels': []
+        }
+        survived = None
+        for viewers in levels:
+            stats, elapsed = asyncio.run(run_level(host, port, opponents, viewers, args.duration, args, rng))
+            results = stats.summary(elapsed)
+            print_level(viewers, stats.sessions, results)
+            report['levels'].append({'viewers': viewers, 'sessions': stats.sessions, 'routes': results})
+
+            overall = results['all']
+            if overall['error_rate'] > args.max_error_rate:
+                print(f"  error rate {overall['error_rate']:.1%} is over {args.max_error_rate:.1%}; stopping")
+                break
+            if args.max_p99 is not None and overall['p99_ms'] > args.max_p99:
+                print(f"  p99 {overall['p99_ms']:.1f} ms is over {args.max_p99:.1f} ms; stopping")
+                break
+            survived = viewers
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    report['max_viewers'] = survived
+    print(f"\nHighest level within limits: {survived if survived is not None else 'none'} viewers")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Minimal in-process metrics exposed in the Prometheus text format
+
+Counters and histograms are plain dicts of floats guarded by a lock, so
+recording a sample costs a dict lookup and an addition. Request handling
+code marks its phases (load, summarize, figure_build, encode) with phase()
+or @timed(). Time spent in a phase is attributed to the route being served.
+Phases don't nest: a phase entered inside another one is counted as part of
+the outer phase, so per-route phase totals never exceed the request time.
+
+Outside a request (scripts, worker threads, the ASGI app) phase() does
+nothing.
+"""
+
+import time
+import bisect
+import threading
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow builds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_request_state = ContextVar('metrics_request_state', default=None)
+
+def _escape(value):
+    """
+    Escape a label value for the text exposition format
+    """
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(labelnames, labelvalues, extra=()):
+    pairs = list(zip(labelnames, labelvalues)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class Counter:
+    """
+    Monotonic counter, optionally split by labels
+    """
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount=1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labelvalues, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+class Histogram:
+    """
+    Cumulative histogram of observed values, optionally split by labels
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labelvalues -> [per-bucket counts..., +Inf count, sum]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labelvalues):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labelvalues)
+            if counts is None:
+                counts = self._values[labelvalues] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            values = sorted((labelvalues, list(counts)) for labelvalues, counts in self._values.items())
+        for labelvalues, counts in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, labelvalues, [('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class Registry:
+    """
+    Collection of metrics rendered together for a /metrics scrape
+
+    Collectors are callables that return extra metrics (for example counters
+    rebuilt from existing cache statistics) at scrape time.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        self._collectors.append(collector)
+        return collector
+
+    def render(self):
+        metrics = list(self._metrics)
+        for collector in self._collectors:
+            metrics.extend(collector())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = Registry()
+
+PHASE_SECONDS = REGISTRY.register(Histogram(
+    'drive_api_request_phase_seconds',
+    'Time spent in each phase of a request, by route',
+    ('route', 'phase')
+))
+
+def start_request(route):
+    """
+    Attribute phases recorded in this context to route until end_request()
+    """
+    return _request_state.set({'route': route, 'phase': None})
+
+def end_request(token):
+    _request_state.reset(token)
+
+@contextmanager
+def phase(name):
+    """
+    Time the enclosed block as one phase of the current request
+    """
+    state = _request_state.get()
+    if state is None or state['phase'] is not None:
+        yield
+        return
+    state['phase'] = name
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_SECONDS.observe(time.perf_counter() - start, state['route'], name)
+        state['phase'] = None
+
+def timed(name):
+    """
+    Decorator form of phase()
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _request_state.get() is None:
+                return func(*args, **kwargs)
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
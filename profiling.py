@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Opt-in per-request profiling
+
+A profiled request runs under either cProfile, which writes a .prof file
+for pstats/snakeviz, or a lightweight stack sampler, which writes a
+.collapsed file of "frame;frame;frame count" lines for flamegraph tools.
+Each profile is also logged as one JSON line in index.jsonl in the
+profile directory, shared by all workers, so recent profiles and their
+wall times can be listed per route.
+
+Requests opt in with a signed, expiring token (see sign()) or are sampled.
+
+Usage:
+    python profiling.py sign /api/comparison-plot [--ttl 3600]
+"""
+
+import os
+import sys
+import hmac
+import json
+import time
+import hashlib
+import argparse
+import threading
+import cProfile
+from collections import Counter
+from datetime import datetime, timezone
+
+INDEX_NAME = 'index.jsonl'
+FORMATS = ('prof', 'collapsed')
+
+# One profile at a time per process: since Python 3.12 cProfile hooks are
+# process-wide, so a second enable() raises and profiles would mix requests
+_active_lock = threading.Lock()
+
+def sign(secret, path, expires):
+    """
+    Return a profile token for path that is valid until the expires timestamp
+    """
+    digest = hmac.new(secret.encode('utf-8'), f"{expires}:{path}".encode('utf-8'), hashlib.sha256).hexdigest()
+    return f"{expires}.{digest}"
+
+def verify(secret, path, token, now=None):
+    """
+    Check a profile token for path: correct signature and not yet expired
+    """
+    try:
+        expires, _ = token.split('.', 1)
+        expires = int(expires)
+    except (AttributeError, ValueError):
+        return False
+    if expires < (now if now is not None else time.time()):
+        return False
+    return hmac.compare_digest(sign(secret, path, expires), token)
+
+class StackSampler:
+    """
+    Sample one thread's Python stack at a fixed interval
+
+    Runs in a daemon thread, so the profiled thread only pays for the GIL
+    handoffs. Stacks are recorded root first, in collapsed-stack form.
+    """
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def write(self, path):
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+class RequestProfiler:
+    """
+    Profile the current thread between start() and finish()
+
+    Only one profiler runs per process. start() returns None instead of
+    waiting when another request is being profiled; a started profiler
+    must end with finish() or cancel().
+    """
+
+    def __init__(self, profile_format='prof'):
+        if profile_format not in FORMATS:
+            raise ValueError(f"profile format must be one of {', '.join(FORMATS)}")
+        self.format = profile_format
+        self._profiler = None
+        self._sampler = None
+        self._start = None
+
+    def start(self):
+        if not _active_lock.acquire(blocking=False):
+            return None
+        try:
+            self._start = time.perf_counter()
+            if self.format == 'prof':
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            else:
+                self._sampler = StackSampler(threading.get_ident())
+                self._sampler.start()
+        except BaseException:
+            _active_lock.release()
+            raise
+        return self
+
+    def _stop(self):
+        try:
+            if self._profiler is not None:
+                self._profiler.disable()
+            else:
+                self._sampler.stop()
+        finally:
+            _active_lock.release()
+
+    def cancel(self):
+        """
+        Stop profiling without writing anything
+        """
+        self._stop()
+
+    def finish(self, profile_dir, route, path, status, trigger):
+        """
+        Stop profiling, write the profile and log it; returns the index entry
+        """
+        self._stop()
+        wall = time.perf_counter() - self._start
+
+        created = datetime.now(timezone.utc)
+        route_slug = route.strip('/').replace('/', '_') or 'index'
+        filename = f"{created.strftime('%Y%m%dT%H%M%S%f')}-{route_slug}-{os.getpid()}.{self.format}"
+        os.makedirs(profile_dir, exist_ok=True)
+        if self._profiler is not None:
+            self._profiler.dump_stats(os.path.join(profile_dir, filename))
+        else:
+            self._sampler.write(os.path.join(profile_dir, filename))
+
+        entry = {
+            'file': filename,
+            'route': route,
+            'path': path,
+            'status': status,
+            'wall_ms': round(wall * 1000, 3),
+            'format': self.format,
+            'trigger': trigger,
+            'created': created.isoformat(),
+            'pid': os.getpid()
+        }
+        # One short append per profile; safe to share between workers
+        with open(os.path.join(profile_dir, INDEX_NAME), 'a') as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        return entry
+
+def recent_profiles(profile_dir, limit=50):
+    """
+    Return the newest logged profiles whose files still exist, newest first
+    """
+    try:
+        with open(os.path.join(profile_dir, INDEX_NAME), 'r') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+
+    profiles = []
+    for line in reversed(lines):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if os.path.exists(os.path.join(profile_dir, entry['file'])):
+            profiles.append(entry)
+            if len(profiles) >= limit:
+                break
+    return profiles
+
+def prune_profiles(profile_dir, keep):
+    """
+    Delete all but the newest keep profile files and drop them from the index
+    """
+    files = sorted(
+        name for name in os.listdir(profile_dir)
+        if name.endswith(tuple(f'.{profile_format}' for profile_format in FORMATS))
+    )
+    removed = files[:-keep] if keep > 0 else files
+    if not removed:
+        return
+    for name in removed:
+        try:
+            os.remove(os.path.join(profile_dir, name))
+        except FileNotFoundError:
+            pass  # Another worker pruned it first
+
+    index_path = os.path.join(profile_dir, INDEX_NAME)
+    try:
+        with open(index_path, 'r') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return
+    kept = []
+    for line in lines:
+        try:
+            name = json.loads(line)['file']
+        except (ValueError, KeyError, TypeError):
+            continue
+        if os.path.exists(os.path.join(profile_dir, name)):
+            kept.append(line)
+    # Written aside and swapped in, so readers never see a partial index
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        f.writelines(kept)
+    os.replace(temp_path, index_path)
+
+def main():
+    parser = argparse.ArgumentParser(description='Sign a URL path for an on-demand request profile')
+    parser.add_argument('command', choices=['sign'])
+    parser.add_argument('path', help='request path, e.g. /api/comparison-plot')
+    parser.add_argument('--ttl', type=int, default=3600, help='seconds the token stays valid')
+    args = parser.parse_args()
+
+    secret = os.environ.get('PROFILE_SECRET')
+    if not secret:
+        print("PROFILE_SECRET is not set")
+        return 1
+    # Only the path is signed, so the token works with any query string
+    path, _, query = args.path.partition('?')
+    token = sign(secret, path, int(time.time()) + args.ttl)
+    print(f"{path}?{query + '&' if query else ''}profile={token}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
-Script to scrape scoring data from all Mercyhurst 2024 football games
+Script to scrape scoring data from all Mercyhurst football games of a season
+
+Usage:
+    python scrape_all_games.py [--season 2024]
 """
 
 import requests
@@ -8,15 +11,22 @@ from bs4 import BeautifulSoup
 import json
 import re
 import os
+import sys
+import argparse
+import subprocess
 from datetime import datetime
 import time
 
-def load_games_list():
+from seasons import DEFAULT_SEASON, is_season, season_dir
+
+PROJECT_DIR = '/workspaces/Mercyhurst_football_drives'
+
+def load_games_list(output_dir=PROJECT_DIR):
     """
-    Load the list of games from games_list.json
+    Load the list of games from a season's games_list.json
     """
     try:
-        with open('/workspaces/Mercyhurst_football_drives/games_list.json', 'r') as f:
+        with open(os.path.join(output_dir, 'games_list.json'), 'r') as f:
             return json.load(f)
     except FileNotFoundError:
         print("games_list.json not found. Run scrape_schedule.py first.")
@@ -205,16 +215,24 @@ def main():
     """
     Main function to scrape all games
     """
-    print("=== Scraping All Mercyhurst 2024 Football Games ===")
+    parser = argparse.ArgumentParser(description='Scrape scoring data for every game in games_list.json')
+    parser.add_argument('--season', default=DEFAULT_SEASON, help=f'season year (default: {DEFAULT_SEASON})')
+    args = parser.parse_args()
+    if not is_season(args.season):
+        parser.error(f"season must be a four-digit year, not {args.season}")
+    
+    print(f"=== Scraping All Mercyhurst {args.season} Football Games ===")
     
-    games = load_games_list()
+    # Seasons other than the default live in seasons/<season>/ (see seasons.py)
+    output_dir = season_dir(PROJECT_DIR, args.season)
+    games = load_games_list(output_dir)
     
     if not games:
         print("No games found. Make sure games_list.json exists.")
         return
     
     # Create directory for all games data
-    games_dir = '/workspaces/Mercyhurst_football_drives/games_data'
+    games_dir = os.path.join(output_dir, 'games_data')
     os.makedirs(games_dir, exist_ok=True)
     
     all_games_data = {}
@@ -258,14 +276,32 @@ def main():
         'last_updated': datetime.now().isoformat()
     }
     
-    with open('/workspaces/Mercyhurst_football_drives/games_index.json', 'w') as f:
+    with open(os.path.join(output_dir, 'games_index.json'), 'w') as f:
         json.dump(games_index, f, indent=2)
     
+    # The drive store, season bundle and snapshot hold the default season only
+    if args.season == DEFAULT_SEASON:
+        # Keep the optional SQLite drive store in sync with the new game files
+        if os.environ.get('DRIVE_STORE'):
+            from drive_store import populate_store
+            updated, unchanged = populate_store(os.environ['DRIVE_STORE'], output_dir)
+            print(f"Drive store updated: {updated} games changed, {unchanged} unchanged")
+        
+        # The app serves the bundle instead of the game files while it is set
+        if os.environ.get('SEASON_BUNDLE'):
+            from season_bundle import build_bundle
+            bundle_path = os.path.join(PROJECT_DIR, os.environ['SEASON_BUNDLE'])
+            game_count, drive_count = build_bundle(output_dir, bundle_path)
+            print(f"Season bundle rebuilt: {game_count} games ({drive_count} drives) in {bundle_path}")
+        
+        if os.environ.get('SEASON_SNAPSHOT'):
+            subprocess.run([sys.executable, 'season_snapshot.py', 'build'], cwd=PROJECT_DIR, check=True)
+    
     print(f"\n=== Summary ===")
     print(f"Total games attempted: {len(games)}")
     print(f"Successfully scraped: {len(successful_games)}")
     print(f"Games data saved to: {games_dir}/")
-    print(f"Master index saved to: games_index.json")
+    print(f"Master index saved to: {os.path.join(output_dir, 'games_index.json')}")
     
     # Show summary of each game
     print(f"\n=== Game Results Summary ===")
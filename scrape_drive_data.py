@@ -7,7 +7,6 @@ This script will be run once to collect the data and save it to a JSON file
 import requests
 from bs4 import BeautifulSoup
 import json
-import pandas as pd
 from datetime import datetime
 
 def scrape_drive_data():
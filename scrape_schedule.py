@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
-Script to scrape all Mercyhurst 2024 football games from the schedule page
+Script to scrape all Mercyhurst football games of a season from the schedule page
+
+Usage:
+    python scrape_schedule.py [--season 2024]
 """
 
 import requests
@@ -8,13 +11,18 @@ from bs4 import BeautifulSoup
 import json
 import re
 import os
+import argparse
 from datetime import datetime
 
-def scrape_schedule():
+from seasons import DEFAULT_SEASON, is_season, season_dir
+
+PROJECT_DIR = '/workspaces/Mercyhurst_football_drives'
+
+def scrape_schedule(season=DEFAULT_SEASON):
     """
-    Scrape the 2024 schedule page to get all game URLs
+    Scrape a season's schedule page to get all game URLs
     """
-    schedule_url = "https://hurstathletics.com/sports/football/schedule/2024"
+    schedule_url = f"https://hurstathletics.com/sports/football/schedule/{season}"
     
     try:
         headers = {
@@ -26,7 +34,7 @@ def scrape_schedule():
         soup = BeautifulSoup(response.content, 'html.parser')
         
         # Save the schedule page for analysis
-        with open('/workspaces/Mercyhurst_football_drives/schedule_source.html', 'w', encoding='utf-8') as f:
+        with open(os.path.join(PROJECT_DIR, 'schedule_source.html'), 'w', encoding='utf-8') as f:
             f.write(str(soup))
         
         print(f"Schedule page title: {soup.title.string if soup.title else 'No title'}")
@@ -106,19 +114,19 @@ def extract_opponent_and_date(url):
     Extract opponent name and date from the boxscore URL
     """
     try:
-        # URL pattern: .../stats/2024/opponent-name/boxscore/id
+        # URL pattern: .../stats/<season>/opponent-name/boxscore/id
         parts = url.split('/')
         
         opponent = "Unknown"
         date = "Unknown"
         
         for i, part in enumerate(parts):
-            if part == "2024" and i + 1 < len(parts):
-                opponent_part = parts[i + 1]
+            if part == "stats" and i + 2 < len(parts) and is_season(parts[i + 1]):
+                opponent_part = parts[i + 2]
                 # Convert URL format to readable name
                 opponent = opponent_part.replace('-', ' ').title()
                 break
-        
+
         return opponent, date
         
     except Exception as e:
@@ -129,9 +137,15 @@ def main():
     """
     Main function to scrape the schedule and analyze game links
     """
-    print("=== Mercyhurst 2024 Football Schedule Scraper ===")
+    parser = argparse.ArgumentParser(description='Scrape the Mercyhurst football schedule for game URLs')
+    parser.add_argument('--season', default=DEFAULT_SEASON, help=f'season year (default: {DEFAULT_SEASON})')
+    args = parser.parse_args()
+    if not is_season(args.season):
+        parser.error(f"season must be a four-digit year, not {args.season}")
+    
+    print(f"=== Mercyhurst {args.season} Football Schedule Scraper ===")
     
-    games = scrape_schedule()
+    games = scrape_schedule(args.season)
     
     if games:
         # Clean up and organize games
@@ -157,11 +171,13 @@ def main():
             print(f"{i+1:2d}. {game['display_name']}")
             print(f"     URL: {game['url']}")
         
-        # Save the game list
-        with open('/workspaces/Mercyhurst_football_drives/games_list.json', 'w') as f:
+        # Save the game list; seasons other than the default go in seasons/<season>/
+        output_dir = season_dir(PROJECT_DIR, args.season)
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, 'games_list.json'), 'w') as f:
             json.dump(unique_games, f, indent=2)
         
-        print(f"\nSaved {len(unique_games)} games to games_list.json")
+        print(f"\nSaved {len(unique_games)} games to {os.path.join(output_dir, 'games_list.json')}")
         
     else:
         print("No games found. Check the schedule page structure.")
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Binary columnar bundle of a whole season's drive data
+
+The export step packs every game listed in games_index.json into a single
+file. The app can open that file with mmap and read any game as a
+GameSeries. The numeric columns are memoryview slices of the mapping, so
+nothing is parsed or copied.
+
+Layout (little-endian):
+
+    header        magic, format version, game/drive/string counts and
+                  byte offsets of the sections below
+    string table  uint32 offsets[string_count + 1], then UTF-8 bytes
+    game index    per game: opponent string id, first drive, drive count,
+                  source file mtime (ns), SHA-1 of the source JSON file
+    columns       one fixed-width 4-byte column per field, drive_count long
+
+Usage:
+    python season_bundle.py build [--output PATH]
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import argparse
+from array import array
+
+from game_series import GameSeries, category_code, game_slug
+from seasons import DEFAULT_SEASON, season_dir
+
+MAGIC = b'MFDBNDL1'
+FORMAT_VERSION = 1
+DEFAULT_BUNDLE_NAME = 'season.bundle'
+
+# magic, version, games, drives, strings, string/index/column offsets
+HEADER = struct.Struct('<8sIIIIQQQ')
+# opponent string id, first drive, drive count, source mtime ns, sha1 digest
+GAME_ENTRY = struct.Struct('<IIIQ20s')
+
+# (field, typecode) in on-disk order. 'I' columns hold string table ids.
+COLUMNS = (
+    ('quarter', 'i'),
+    ('time', 'I'),
+    ('elapsed_seconds', 'i'),
+    ('team', 'I'),
+    ('result', 'I'),
+    ('play_description', 'I'),
+    ('mercyhurst_score', 'i'),
+    ('opponent_score', 'i'),
+    ('score_differential', 'i')
+)
+STRING_FIELDS = {'time', 'team', 'result', 'play_description'}
+
+def _align(offset):
+    """
+    Round a byte offset up to the next multiple of 8
+    """
+    return (offset + 7) & ~7
+
+def build_bundle(base_dir, output_path):
+    """
+    Pack every indexed game under base_dir into a bundle at output_path
+    """
+    with open(os.path.join(base_dir, 'games_index.json'), 'r') as f:
+        games_index = json.load(f)
+
+    strings = []
+    string_ids = {}
+
+    def string_id(value):
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    columns = {field: array(typecode) for field, typecode in COLUMNS}
+    games = []
+
+    for game in games_index.get('games', []):
+        opponent_name = game['opponent']
+        filepath = os.path.join(base_dir, 'games_data', f"game_{game_slug(opponent_name)}.json")
+        try:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            mtime_ns = os.stat(filepath).st_mtime_ns
+        except FileNotFoundError:
+            print(f"Skipping {opponent_name}: {filepath} not found")
+            continue
+
+        drives = json.loads(raw)
+        first_drive = len(columns['quarter'])
+        for drive in drives:
+            for field, _ in COLUMNS:
+                value = drive.get(field, '') if field == 'play_description' else drive[field]
+                if field in STRING_FIELDS:
+                    value = string_id(value)
+                elif not isinstance(value, int):
+                    raise ValueError(f"{opponent_name}: {field} must be an integer, got {value!r}")
+                columns[field].append(value)
+
+        games.append((string_id(opponent_name), first_drive, len(drives), mtime_ns, hashlib.sha1(raw).digest()))
+
+    encoded = [value.encode('utf-8') for value in strings]
+    string_offsets = array('I', [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+
+    drive_count = len(columns['quarter'])
+    strings_offset = _align(HEADER.size)
+    index_offset = _align(strings_offset + string_offsets.itemsize * len(string_offsets) + string_offsets[-1])
+    columns_offset = _align(index_offset + GAME_ENTRY.size * len(games))
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, len(games), drive_count, len(strings),
+            strings_offset, index_offset, columns_offset
+        ))
+        f.write(b'\0' * (strings_offset - f.tell()))
+        string_offsets.tofile(f)
+        f.write(b''.join(encoded))
+        f.write(b'\0' * (index_offset - f.tell()))
+        for entry in games:
+            f.write(GAME_ENTRY.pack(*entry))
+        f.write(b'\0' * (columns_offset - f.tell()))
+        for field, _ in COLUMNS:
+            columns[field].tofile(f)
+    os.replace(tmp_path, output_path)
+
+    return len(games), drive_count
+
+class _StringColumn:
+    """
+    Sequence of strings decoded on access from a column of string table ids
+    """
+    __slots__ = ('_bundle', '_ids')
+
+    def __init__(self, bundle, ids):
+        self._bundle = bundle
+        self._ids = ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        return self._bundle.string(self._ids[index])
+
+    def __iter__(self):
+        string = self._bundle.string
+        for string_id in self._ids:
+            yield string(string_id)
+
+class SeasonBundle:
+    """
+    Read-only, memory-mapped view of a season bundle file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        (magic, version, game_count, drive_count, string_count,
+         strings_offset, index_offset, columns_offset) = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} season bundle")
+
+        offsets_end = strings_offset + 4 * (string_count + 1)
+        self._string_offsets = self._view[strings_offset:offsets_end].cast('I')
+        self._string_data = offsets_end
+        self._strings = [None] * string_count
+
+        self._columns = {}
+        position = columns_offset
+        for field, typecode in COLUMNS:
+            self._columns[field] = self._view[position:position + 4 * drive_count].cast(typecode)
+            position += 4 * drive_count
+
+        self._games = {}
+        for i in range(game_count):
+            name_id, first_drive, count, mtime_ns, digest = GAME_ENTRY.unpack_from(
+                self._view, index_offset + i * GAME_ENTRY.size
+            )
+            opponent_name = self.string(name_id)
+            self._games[game_slug(opponent_name)] = (opponent_name, first_drive, count, mtime_ns, digest.hex())
+
+    def string(self, string_id):
+        """
+        Return a string from the string table, decoding it on first use
+        """
+        value = self._strings[string_id]
+        if value is None:
+            start = self._string_data + self._string_offsets[string_id]
+            end = self._string_data + self._string_offsets[string_id + 1]
+            value = str(self._view[start:end], 'utf-8')
+            self._strings[string_id] = value
+        return value
+
+    def opponents(self):
+        """
+        Return the opponent names stored in the bundle, in index order
+        """
+        return [entry[0] for entry in self._games.values()]
+
+    def game_record(self, opponent_name):
+        """
+        Return a game as a load_game_record-style dict, or None if absent
+
+        Numeric columns are zero-copy slices of the mapping. Team and result
+        ids are remapped to the shared category codes used by GameSeries.
+        """
+        entry = self._games.get(game_slug(opponent_name))
+        if entry is None:
+            return None
+        _, first_drive, count, mtime_ns, version = entry
+        end = first_drive + count
+
+        def column(field):
+            return self._columns[field][first_drive:end]
+
+        def categories(field):
+            return array('H', [category_code(self.string(i)) for i in column(field)])
+
+        series = GameSeries(
+            quarter=column('quarter'),
+            time=_StringColumn(self, column('time')),
+            elapsed_seconds=column('elapsed_seconds'),
+            team_codes=categories('team'),
+            result_codes=categories('result'),
+            play_description=_StringColumn(self, column('play_description')),
+            mercyhurst_score=column('mercyhurst_score'),
+            opponent_score=column('opponent_score'),
+            score_differential=column('score_differential')
+        )
+        return {'stamp': (mtime_ns, count), 'version': version, 'data': series}
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack games_data/ into a binary season bundle')
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--output', help=f'bundle path (default: games_data/{DEFAULT_BUNDLE_NAME})')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    output_path = args.output or os.path.join(base_dir, 'games_data', DEFAULT_BUNDLE_NAME)
+
+    # Bundles and the store hold the default season (see seasons.py)
+    game_count, drive_count = build_bundle(season_dir(base_dir, DEFAULT_SEASON), output_path)
+    print(f"Wrote {game_count} games ({drive_count} drives) to {output_path}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Shared, read-only season snapshot for multi-worker deployments
+
+A snapshot generation is a season bundle plus one file of pre-rendered
+figure responses (plain, gzip and brotli bodies). Every gunicorn worker
+memory-maps the same files, so game data and figure bytes live once in the
+OS page cache rather than once per worker. Workers don't fill their own
+caches for anything in the snapshot.
+
+Generations are published by atomically replacing the CURRENT file, which
+holds the generation number. Workers stat it on each lookup and switch to a
+new generation as a whole. A request never sees figures from one
+generation mixed with game data from another.
+
+Layout of a figure file (little-endian):
+
+    header   magic, format version, generation, index offset and length
+    bodies   response bodies back to back
+    index    UTF-8 JSON: bundle file name and, per figure key, the
+             (offset, length) of each stored variant
+
+Usage:
+    python season_snapshot.py build [--dir PATH]
+    python season_snapshot.py info [--dir PATH]
+"""
+
+import os
+import sys
+import json
+import mmap
+import glob
+import struct
+import argparse
+
+from season_bundle import SeasonBundle
+
+MAGIC = b'MFDSNAP1'
+FORMAT_VERSION = 1
+DEFAULT_SNAPSHOT_DIR = 'snapshot'
+CURRENT_NAME = 'CURRENT'
+
+# magic, version, generation, index offset, index length
+HEADER = struct.Struct('<8sIIQQ')
+
+def snapshot_key(key):
+    """
+    Serialize a figure cache key (a tuple of strings and tuples) to a string
+    """
+    return json.dumps(key, separators=(',', ':'))
+
+def figures_name(generation):
+    return f"figures-{generation:06d}.bin"
+
+def bundle_name(generation):
+    return f"season-{generation:06d}.bundle"
+
+def current_generation(snapshot_dir):
+    """
+    Return the published generation number, or 0 if none has been published
+    """
+    try:
+        with open(os.path.join(snapshot_dir, CURRENT_NAME), 'r') as f:
+            return int(f.read().strip())
+    except FileNotFoundError:
+        return 0
+
+def write_snapshot(snapshot_dir, generation, figures):
+    """
+    Write the figure file for a generation and publish it as CURRENT
+
+    figures maps snapshot_key() strings to figure cache entries. The
+    generation's season bundle must already exist. Generations older than
+    the previous one are deleted; workers still mapping them keep their
+    pages until they switch.
+    """
+    index = {'bundle': bundle_name(generation), 'figures': {}}
+    path = os.path.join(snapshot_dir, figures_name(generation))
+
+    # 'xb' fails if another builder already claimed this generation
+    with open(path, 'xb') as f:
+        f.write(b'\0' * HEADER.size)
+        for key, entry in figures.items():
+            variants = {'body': entry['body'], **entry['encoded']}
+            index['figures'][key] = {}
+            for variant, body in variants.items():
+                index['figures'][key][variant] = (f.tell(), len(body))
+                f.write(body)
+        index_offset = f.tell()
+        encoded_index = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        f.write(encoded_index)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, generation, index_offset, len(encoded_index)))
+
+    tmp_path = os.path.join(snapshot_dir, CURRENT_NAME + '.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(f"{generation}\n")
+    os.replace(tmp_path, os.path.join(snapshot_dir, CURRENT_NAME))
+
+    keep = {figures_name(generation), bundle_name(generation),
+            figures_name(generation - 1), bundle_name(generation - 1)}
+    for stale in glob.glob(os.path.join(snapshot_dir, 'figures-*.bin')) + \
+            glob.glob(os.path.join(snapshot_dir, 'season-*.bundle')):
+        if os.path.basename(stale) not in keep:
+            os.remove(stale)
+
+class SeasonSnapshot:
+    """
+    Read-only, memory-mapped view of the current snapshot generation
+    """
+
+    def __init__(self, snapshot_dir):
+        self.generation = current_generation(snapshot_dir)
+        if not self.generation:
+            raise FileNotFoundError(f"No snapshot has been published in {snapshot_dir}")
+
+        path = os.path.join(snapshot_dir, figures_name(self.generation))
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, generation, index_offset, index_length = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or generation != self.generation:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} snapshot for generation {self.generation}")
+
+        index = json.loads(str(self._view[index_offset:index_offset + index_length], 'utf-8'))
+        self._figures = index['figures']
+        self.bundle = SeasonBundle(os.path.join(snapshot_dir, index['bundle']))
+
+    def __len__(self):
+        return len(self._figures)
+
+    def figure(self, key):
+        """
+        Return a figure cache entry whose bodies are slices of the mapping
+
+        key is a snapshot_key() string. Returns None if the snapshot does not
+        hold that figure.
+        """
+        variants = self._figures.get(key)
+        if variants is None:
+            return None
+        views = {
+            variant: self._view[offset:offset + length]
+            for variant, (offset, length) in variants.items()
+        }
+        body = views.pop('body')
+        return {'body': body, 'encoded': views}
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or inspect the shared season snapshot')
+    parser.add_argument('command', choices=['build', 'info'])
+    parser.add_argument('--dir', help=f'snapshot directory (default: $SEASON_SNAPSHOT or {DEFAULT_SNAPSHOT_DIR})')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    snapshot_dir = os.path.join(base_dir, args.dir or os.environ.get('SEASON_SNAPSHOT') or DEFAULT_SNAPSHOT_DIR)
+
+    if args.command == 'build':
+        # Rendering reuses the app's figure builders; imported here so that
+        # reading a snapshot never pulls in the web app. The builder must
+        # render from the new bundle, not serve from the published snapshot.
+        os.environ.pop('SEASON_SNAPSHOT', None)
+        import app
+        os.makedirs(snapshot_dir, exist_ok=True)
+        generation, figure_count = app.build_season_snapshot(snapshot_dir)
+        print(f"Published snapshot generation {generation} ({figure_count} figures) in {snapshot_dir}")
+    else:
+        snapshot = SeasonSnapshot(snapshot_dir)
+        print(f"Generation {snapshot.generation}: {len(snapshot.bundle.opponents())} games, "
+              f"{len(snapshot)} figures")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
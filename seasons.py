@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Season-partitioned layout of the game data
+
+Each season lives in <data dir>/seasons/<season>/, laid out like a
+single-season data directory: games_index.json plus games_data/. The
+top-level games_index.json and games_data/ are served as the default
+season unless seasons/<default season>/ exists, so single-season checkouts
+keep working unchanged.
+"""
+
+import os
+import re
+
+# The season served when a request does not name one
+DEFAULT_SEASON = os.environ.get('DEFAULT_SEASON', '2024')
+SEASONS_DIR = 'seasons'
+
+_SEASON_PATTERN = re.compile(r'\d{4}')
+
+def is_season(value):
+    """
+    Check that a season name is a four-digit year (and so safe in a path)
+    """
+    return bool(value) and _SEASON_PATTERN.fullmatch(str(value)) is not None
+
+def season_dir(data_dir, season):
+    """
+    Return the directory holding a season's games_index.json and games_data/
+    """
+    partition = os.path.join(data_dir, SEASONS_DIR, str(season))
+    if str(season) == DEFAULT_SEASON and not os.path.isdir(partition):
+        return data_dir
+    return partition
+
+def list_seasons(data_dir):
+    """
+    Return every season with a games index under data_dir, newest first
+    """
+    seasons = set()
+    try:
+        names = os.listdir(os.path.join(data_dir, SEASONS_DIR))
+    except FileNotFoundError:
+        names = []
+    for name in names:
+        if is_season(name) and os.path.isfile(os.path.join(data_dir, SEASONS_DIR, name, 'games_index.json')):
+            seasons.add(name)
+    if os.path.isfile(os.path.join(season_dir(data_dir, DEFAULT_SEASON), 'games_index.json')):
+        seasons.add(DEFAULT_SEASON)
+    return sorted(seasons, reverse=True)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Dependency-free SVG sparklines of a game's score differential
+
+Renders a small step chart: the differential holds its value until the
+next score changes it. It is meant for thumbnail grids where a full Plotly
+figure per game would be far too heavy. Only the standard library is used.
+"""
+
+from html import escape
+
+SPARKLINE_WIDTH = 240
+SPARKLINE_HEIGHT = 80
+GAME_MINUTES = 60
+
+LINE_COLOR = '#003366'
+ZERO_LINE_COLOR = '#808080'
+QUARTER_LINE_COLOR = '#d0d7e2'
+
+def _format(value):
+    """
+    Format a coordinate compactly (one decimal, no trailing .0)
+    """
+    text = f"{value:.1f}"
+    return text[:-2] if text.endswith('.0') else text
+
+def step_path(points, y_range, width=SPARKLINE_WIDTH, height=SPARKLINE_HEIGHT):
+    """
+    Return SVG path data for (minutes, differential) points as a step chart
+    """
+    y_min, y_max = y_range
+    x_scale = width / GAME_MINUTES
+    y_scale = height / ((y_max - y_min) or 1)
+
+    def x(minutes):
+        return _format(min(max(minutes, 0), GAME_MINUTES) * x_scale)
+
+    def y(differential):
+        return _format((y_max - differential) * y_scale)
+
+    first_minutes, first_differential = points[0]
+    commands = [f"M{x(first_minutes)} {y(first_differential)}"]
+    previous = first_differential
+    for minutes, differential in points[1:]:
+        commands.append(f"H{x(minutes)}")
+        if differential != previous:
+            commands.append(f"V{y(differential)}")
+            previous = differential
+    return ''.join(commands)
+
+def render_sparkline(points, y_range, title='', width=SPARKLINE_WIDTH, height=SPARKLINE_HEIGHT):
+    """
+    Render (minutes, differential) points as a standalone SVG document string
+
+    y_range is the [min, max] differential shown, so thumbnails sharing a
+    range are directly comparable. A dashed line marks a tied score and
+    faint vertical lines mark the quarters.
+    """
+    y_min, y_max = y_range
+    zero_y = _format((y_max - 0) * height / ((y_max - y_min) or 1))
+    label = escape(title)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}" height="{height}" role="img" aria-label="{label}">',
+        f'<title>{label}</title>'
+    ]
+    for quarter in (15, 30, 45):
+        quarter_x = _format(quarter * width / GAME_MINUTES)
+        parts.append(
+            f'<line x1="{quarter_x}" y1="0" x2="{quarter_x}" y2="{height}" '
+            f'stroke="{QUARTER_LINE_COLOR}" stroke-width="1"/>'
+        )
+    if y_min <= 0 <= y_max:
+        parts.append(
+            f'<line x1="0" y1="{zero_y}" x2="{width}" y2="{zero_y}" stroke="{ZERO_LINE_COLOR}" '
+            f'stroke-opacity="0.5" stroke-dasharray="4 3" stroke-width="1"/>'
+        )
+    if points:
+        parts.append(
+            f'<path d="{step_path(points, y_range, width, height)}" fill="none" '
+            f'stroke="{LINE_COLOR}" stroke-width="1.5" stroke-linejoin="round"/>'
+        )
+    parts.append('</svg>')
+    return ''.join(parts)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Pre-render the whole dashboard into a directory of static files
+
+Every API response the dashboard reads for finished games is rendered
+through the Flask app and written under a content-fingerprinted name, so a
+static host or CDN can cache it forever:
+
+    /api/games, /api/plot-template, /api/comparison-plot, /api/comparison-grid
+    /api/drive-data, /api/plot and /api/games/batch for each indexed game
+
+Games render in parallel on a process pool. index.html is written last, with
+the map from API routes to fingerprinted files embedded, so the page fetches
+those files instead of calling the app. Only live updates still need Flask.
+
+Usage:
+    python static_export.py [--output DIR] [--workers N] [--precompress]
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
+
+import app
+from game_series import game_slug
+
+DEFAULT_OUTPUT_DIR = 'static_site'
+
+# Routes rendered once per game, with the query parameter naming the game
+GAME_ROUTES = (
+    ('/api/drive-data', 'opponent'),
+    ('/api/plot', 'opponent'),
+    ('/api/games/batch', 'opponents')
+)
+SEASON_ROUTES = ('/api/games', '/api/plot-template', '/api/comparison-plot', '/api/comparison-grid')
+
+# The line in index.html that the route map replaces
+STATIC_ROUTES_PLACEHOLDER = 'const STATIC_ROUTES = null;'
+
+def fetch(url):
+    """
+    Render one API response through the app, without any HTTP server
+    """
+    response = app.app.test_client().get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f"{url} returned {response.status_code}")
+    return response.get_data()
+
+def render_game(opponent_name):
+    """
+    Render every per-game route for one game (runs in a worker process)
+    """
+    return opponent_name, {
+        path: fetch(f"{path}?{param}={quote(opponent_name)}")
+        for path, param in GAME_ROUTES
+    }
+
+def render_season_route(path):
+    """
+    Render one season-wide route (runs in a worker process)
+    """
+    return path, fetch(path)
+
+def write_fingerprinted(output_dir, path, name, body, precompress):
+    """
+    Write a response body as <path>/<name>.<hash>.json and return its URL
+    """
+    fingerprint = hashlib.sha1(body).hexdigest()[:12]
+    url = f"{path.lstrip('/')}/{name}.{fingerprint}.json"
+    filepath = os.path.join(output_dir, *url.split('/'))
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    if not os.path.exists(filepath):
+        with open(filepath, 'wb') as f:
+            f.write(body)
+        if precompress:
+            for encoding, encoded in app.compress_body(body).items():
+                suffix = '.gz' if encoding == 'gzip' else '.br'
+                with open(filepath + suffix, 'wb') as f:
+                    f.write(encoded)
+    return url
+
+def remove_stale_files(output_dir, routes):
+    """
+    Delete fingerprinted files under api/ that the new route map no longer uses
+    """
+    current = set()
+    for value in routes.values():
+        urls = value.values() if isinstance(value, dict) else [value]
+        current.update(os.path.join(output_dir, *url.split('/')) for url in urls)
+
+    removed = 0
+    for dirpath, _, filenames in os.walk(os.path.join(output_dir, 'api')):
+        for filename in filenames:
+            filepath = os.path.join(dirpath, filename)
+            if filepath.rsplit('.json', 1)[0] + '.json' not in current:
+                os.remove(filepath)
+                removed += 1
+    return removed
+
+def export_site(output_dir, workers=None, precompress=False):
+    """
+    Render the season into output_dir and return the route map
+    """
+    games_list = app.load_games_index().get('games', [])
+    opponents = [game['opponent'] for game in games_list]
+    routes = {path: {} for path, _ in GAME_ROUTES}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        season = pool.map(render_season_route, SEASON_ROUTES)
+        for opponent_name, bodies in pool.map(render_game, opponents):
+            for path, body in bodies.items():
+                routes[path][opponent_name] = write_fingerprinted(
+                    output_dir, path, game_slug(opponent_name), body, precompress
+                )
+        for path, body in season:
+            routes[path] = write_fingerprinted(output_dir, path, 'season', body, precompress)
+
+    page = fetch('/').decode('utf-8')
+    if STATIC_ROUTES_PLACEHOLDER not in page:
+        raise RuntimeError('templates/index.html has no STATIC_ROUTES placeholder')
+    page = page.replace(
+        STATIC_ROUTES_PLACEHOLDER,
+        f"const STATIC_ROUTES = {json.dumps(routes, separators=(',', ':'))};"
+    )
+    # index.html keeps its name; it is the one file hosts must revalidate
+    with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(page)
+
+    removed = remove_stale_files(output_dir, routes)
+    return routes, removed
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-render the dashboard into static files')
+    parser.add_argument('--output', help=f'output directory (default: {DEFAULT_OUTPUT_DIR})')
+    parser.add_argument('--workers', type=int, help='render processes (default: one per CPU)')
+    parser.add_argument('--precompress', action='store_true', help='also write .gz and .br files')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    output_dir = os.path.join(base_dir, args.output or DEFAULT_OUTPUT_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+
+    routes, removed = export_site(output_dir, args.workers, args.precompress)
+    game_count = len(routes['/api/plot'])
+    print(f"Exported {game_count} games to {output_dir} ({removed} stale files removed)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic game data for scale testing
+
+Writes games in the scraped games_data schema, plus a matching
+games_index.json, so DATA_DIR can point the app, benchmark.py or a load
+test at them. Each game draws from its own random generator seeded by
+(seed, season, game number). The output is therefore identical whatever the
+worker count, and games are generated on a process pool.
+
+The default season alone is written in this repository's layout
+(games_index.json and games_data/). Otherwise each season is written as
+seasons/<season>/ with that same layout, where the app serves it under
+?season= (see seasons.py).
+
+Usage:
+    python synthetic_data.py OUTPUT [--games 11] [--seasons 2024 | 2015-2024]
+                             [--drives 6-14] [--scoring-rate 1.0]
+                             [--results "Touchdown:7:0.85,Field Goal:3:0.15"]
+                             [--mercyhurst-share 0.5] [--share-spread 0.15]
+                             [--seed 0] [--workers N] [--indent 2]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import bisect
+import itertools
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from game_series import game_slug
+from seasons import DEFAULT_SEASON, SEASONS_DIR
+
+DEFAULT_RESULTS = 'Touchdown:7:0.85,Field Goal:3:0.15'
+NON_SCORING_RESULTS = ('Punt', 'Interception', 'Fumble', 'Downs', 'Missed FG')
+GAMES_PER_TASK = 256
+
+PLACES = (
+    'Allegheny', 'Ashland', 'Bluefield', 'Brockport', 'Calumet', 'Canisius', 'Cedar Valley',
+    'Chadron', 'Clarion', 'Concord', 'Davenport', 'Edinboro', 'Fairmont', 'Findlay', 'Glenville',
+    'Grove City', 'Harding', 'Hillsdale', 'Kutztown', 'Lakeland', 'Lock Haven', 'Malone',
+    'Mansfield', 'Millersville', 'Northwood', 'Ohio Valley', 'Quincy', 'Seton Hill', 'Shepherd',
+    'Slippery Rock', 'Tiffin', 'Urbana', 'Walsh', 'Waynesburg', 'West Liberty', 'Westminster'
+)
+KINDS = ('University', 'State University', 'College', 'Tech')
+FIRST_NAMES = ('Aiden', 'Brock', 'Caleb', 'Dante', 'Eli', 'Jalen', 'Marcus', 'Noah', 'Owen', 'Tyler')
+LAST_NAMES = ('Brooks', 'Carter', 'Diaz', 'Ellis', 'Foster', 'Greene', 'Hayes', 'Jordan', 'Keller', 'Morgan')
+
+def parse_range(text):
+    """
+    Parse "N" or "MIN-MAX" into an inclusive (min, max) pair
+    """
+    low, _, high = text.partition('-')
+    return int(low), int(high or low)
+
+def parse_seasons(text):
+    """
+    Parse "2024", "2015-2024" or "2019,2021,2023" into a list of seasons
+    """
+    seasons = []
+    for part in text.split(','):
+        low, high = parse_range(part.strip())
+        seasons.extend(range(low, high + 1))
+    return list(dict.fromkeys(seasons))
+
+def parse_results(text):
+    """
+    Parse "Result:points:weight,..." into (results, points, weights) tuples
+    """
+    results, points, weights = [], [], []
+    for part in text.split(','):
+        name, value, weight = part.rsplit(':', 2)
+        results.append(name.strip())
+        points.append(int(value))
+        weights.append(float(weight))
+    return tuple(results), tuple(points), tuple(weights)
+
+def opponent_names(seed, season, games):
+    """
+    Return games distinct opponent names for a season, in schedule order
+    """
+    names = [f"{place} {kind}" for place in PLACES for kind in KINDS]
+    random.Random(f"{seed}:{season}:opponents").shuffle(names)
+    # Seasons larger than the name pool reuse it with a numeric suffix
+    return [
+        names[i % len(names)] if i < len(names) else f"{names[i % len(names)]} {i // len(names) + 1}"
+        for i in range(games)
+    ]
+
+def clock(elapsed):
+    """
+    Return (quarter, "MM:SS" left in the quarter) for elapsed game seconds
+    """
+    quarter = min(elapsed // 900 + 1, 4)
+    remaining = quarter * 900 - elapsed
+    return quarter, f"{remaining // 60:02d}:{remaining % 60:02d}"
+
+def generate_game(rng, opponent_name, config):
+    """
+    Return one game's drive list: Game Start, the drives and Game End
+    """
+    abbreviations = {'Mercyhurst': 'MER', opponent_name: opponent_name.replace(' ', '')[:3].upper()}
+    results, points, weights = config['results']
+    cumulative = list(itertools.accumulate(weights))
+    random_value = rng.random
+
+    def between(low, high):
+        # Equivalent to rng.randint for these small ranges, at a fraction of the cost
+        return low + int(random_value() * (high - low + 1))
+
+    def pick(options):
+        return options[int(random_value() * len(options))]
+
+    # Each game gets its own balance between the teams, so margins vary
+    share = min(max(rng.gauss(config['mercyhurst_share'], config['share_spread']), 0.05), 0.95)
+
+    drives = [{
+        'quarter': 1, 'time': '15:00', 'elapsed_seconds': 0,
+        'team': 'Game Start', 'result': 'Game Start',
+        'play_description': f"Game Start - Mercyhurst vs {opponent_name}",
+        'mercyhurst_score': 0, 'opponent_score': 0, 'score_differential': 0
+    }]
+    mercyhurst_score = opponent_score = 0
+    drive_count = between(*config['drives'])
+    for elapsed in sorted(between(1, 3599) for _ in range(drive_count)):
+        team = 'Mercyhurst' if random_value() < share else opponent_name
+        player = f"{pick(LAST_NAMES)},{pick(FIRST_NAMES)}"
+        plays = between(3, 15)
+        yards = between(10, 95)
+        possession = between(60, 480)
+        summary = f"{plays} plays, {yards} yards, TOP {possession // 60:02d}:{possession % 60:02d}"
+
+        if random_value() < config['scoring_rate']:
+            index = min(bisect.bisect(cumulative, random_value() * cumulative[-1]), len(results) - 1)
+            result = results[index]
+            if team == 'Mercyhurst':
+                mercyhurst_score += points[index]
+            else:
+                opponent_score += points[index]
+            if result == 'Touchdown':
+                description = f"{abbreviations[team]} - {player} {between(1, 75)} yd run, {summary}"
+            elif result == 'Field Goal':
+                description = f"{abbreviations[team]} - {player} {between(18, 52)} yd field goal {summary}"
+            else:
+                description = f"{abbreviations[team]} - {result}, {summary}"
+        else:
+            result = pick(NON_SCORING_RESULTS)
+            description = f"{abbreviations[team]} - {result}, {summary}"
+
+        quarter, time_left = clock(elapsed)
+        drives.append({
+            'quarter': quarter,
+            'time': time_left,
+            'elapsed_seconds': elapsed,
+            'team': team,
+            'result': result,
+            'play_description': description,
+            'mercyhurst_score': mercyhurst_score,
+            'opponent_score': opponent_score,
+            'score_differential': mercyhurst_score - opponent_score
+        })
+
+    drives.append({
+        'quarter': 4, 'time': '00:00', 'elapsed_seconds': 3600,
+        'team': 'Game End', 'result': 'Game End',
+        'play_description': f"Final Score - Mercyhurst {mercyhurst_score}, {opponent_name} {opponent_score}",
+        'mercyhurst_score': mercyhurst_score,
+        'opponent_score': opponent_score,
+        'score_differential': mercyhurst_score - opponent_score
+    })
+    return drives
+
+def write_games(season_dir, season, start, opponents, config):
+    """
+    Generate and write one batch of a season's games (runs in a worker process)
+
+    Returns the batch's games_index entries and its drive count.
+    """
+    entries = []
+    drive_total = 0
+    for number, opponent_name in enumerate(opponents, start + 1):
+        rng = random.Random(f"{config['seed']}:{season}:{number}")
+        drives = generate_game(rng, opponent_name, config)
+        drive_total += len(drives)
+
+        # json.dumps encodes compact output in C; json.dump would not
+        with open(os.path.join(season_dir, 'games_data', f"game_{game_slug(opponent_name)}.json"), 'w') as f:
+            f.write(json.dumps(drives, indent=config['indent']))
+
+        url_slug = opponent_name.lower().replace(' ', '-')
+        entries.append({
+            'url': f"https://hurstathletics.com/sports/football/stats/{season}/{url_slug}/boxscore/{season % 100:02d}{number:05d}",
+            'opponent': opponent_name,
+            'date': 'Unknown',
+            'display_name': f"vs {opponent_name}"
+        })
+    return entries, drive_total
+
+def generate(output_dir, games=11, seasons=(int(DEFAULT_SEASON),), drives=(6, 14), scoring_rate=1.0,
+             results=DEFAULT_RESULTS, mercyhurst_share=0.5, share_spread=0.15, seed=0,
+             workers=None, indent=None):
+    """
+    Write games seasons of synthetic games under output_dir
+
+    Returns (games written, drives written). The default season alone is
+    written directly into output_dir, anything else into
+    output_dir/seasons/<season>/.
+    """
+    config = {
+        'drives': drives,
+        'scoring_rate': scoring_rate,
+        'results': parse_results(results),
+        'mercyhurst_share': mercyhurst_share,
+        'share_spread': share_spread,
+        'seed': seed,
+        'indent': indent
+    }
+    flat = [str(season) for season in seasons] == [DEFAULT_SEASON]
+    season_dirs = {
+        season: output_dir if flat else os.path.join(output_dir, SEASONS_DIR, str(season))
+        for season in seasons
+    }
+
+    tasks = []
+    for season, season_dir in season_dirs.items():
+        os.makedirs(os.path.join(season_dir, 'games_data'), exist_ok=True)
+        opponents = opponent_names(seed, season, games)
+        for start in range(0, games, GAMES_PER_TASK):
+            tasks.append((season, start, opponents[start:start + GAMES_PER_TASK]))
+
+    season_entries = {season: [] for season in seasons}
+    drive_total = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (season, pool.submit(write_games, season_dirs[season], season, start, opponents, config))
+            for season, start, opponents in tasks
+        ]
+        # Futures are collected in submission order, so each index keeps schedule order
+        for season, future in futures:
+            entries, drive_count = future.result()
+            season_entries[season].extend(entries)
+            drive_total += drive_count
+
+    for season, entries in season_entries.items():
+        with open(os.path.join(season_dirs[season], 'games_index.json'), 'w') as f:
+            json.dump({'total_games': len(entries), 'successful_games': len(entries), 'games': entries}, f, indent=2)
+
+    return games * len(seasons), drive_total
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate seeded synthetic games_data for scale testing')
+    parser.add_argument('output', help='output directory (usable as DATA_DIR)')
+    parser.add_argument('--games', type=int, default=11, help='games per season')
+    parser.add_argument('--seasons', default=DEFAULT_SEASON, help='e.g. 2024, 2015-2024 or 2019,2021')
+    parser.add_argument('--drives', default='6-14', help='drives per game, N or MIN-MAX')
+    parser.add_argument('--scoring-rate', type=float, default=1.0,
+                        help='fraction of drives that score (scraped games list scoring drives only)')
+    parser.add_argument('--results', default=DEFAULT_RESULTS, help='scoring results as Result:points:weight,...')
+    parser.add_argument('--mercyhurst-share', type=float, default=0.5, help='mean share of drives that are Mercyhurst\'s')
+    parser.add_argument('--share-spread', type=float, default=0.15, help='game-to-game spread of that share')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, help='generator processes (default: one per CPU)')
+    parser.add_argument('--indent', type=int, help='indent game files like the scraper (default: compact)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    games, drive_total = generate(
+        args.output,
+        games=args.games,
+        seasons=parse_seasons(args.seasons),
+        drives=parse_range(args.drives),
+        scoring_rate=args.scoring_rate,
+        results=args.results,
+        mercyhurst_share=args.mercyhurst_share,
+        share_spread=args.share_spread,
+        seed=args.seed,
+        workers=args.workers,
+        indent=args.indent
+    )
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {games} games, {drive_total} drives to {args.output} in {elapsed:.1f}s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,573 @@
+"""
+Tests for the drive API, run against a small season written to a
+temporary directory
+
+Run with:
+    python -m pytest test_drive_api.py
+"""
+
+import json
+import os
+
+import pytest
+from flask import g
+
+import app
+import drive_store
+import metrics
+import seasons
+import sparkline
+from downsample import downsample_indices, lttb_indices
+from season_bundle import SeasonBundle, build_bundle
+
+def drive(quarter, elapsed, team, result, mercyhurst_score, opponent_score, description='x'):
+    remaining = quarter * 900 - elapsed
+    return {
+        'quarter': quarter,
+        'time': f"{remaining // 60:02d}:{remaining % 60:02d}",
+        'elapsed_seconds': elapsed,
+        'team': team,
+        'result': result,
+        'play_description': description,
+        'mercyhurst_score': mercyhurst_score,
+        'opponent_score': opponent_score,
+        'score_differential': mercyhurst_score - opponent_score
+    }
+
+def scraped_game(opponent_name, scoring):
+    """
+    Build a game the way scrape_all_games.py writes it: Game Start, the
+    scoring drives, then Game End with the final score
+    """
+    final = scoring[-1] if scoring else drive(4, 3600, 'Game End', 'Game End', 0, 0)
+    return (
+        [drive(1, 0, 'Game Start', 'Game Start', 0, 0, f"Game Start - Mercyhurst vs {opponent_name}")]
+        + scoring
+        + [drive(4, 3600, 'Game End', 'Game End', final['mercyhurst_score'], final['opponent_score'],
+                 f"Final Score - Mercyhurst {final['mercyhurst_score']}, {opponent_name} {final['opponent_score']}")]
+    )
+
+WHEELING = scraped_game('Wheeling University', [
+    drive(1, 300, 'Mercyhurst', 'Touchdown', 7, 0),
+    drive(2, 1200, 'Wheeling University', 'Field Goal', 7, 3),
+    drive(3, 2000, 'Mercyhurst', 'Touchdown', 14, 3),
+    drive(4, 3000, 'Wheeling University', 'Touchdown', 14, 10)
+])
+GANNON = scraped_game('Gannon University', [
+    drive(1, 500, 'Gannon University', 'Touchdown', 0, 7),
+    drive(4, 3500, 'Mercyhurst', 'Field Goal', 3, 7)
+])
+
+INDEX = {
+    'total_games': 2,
+    'successful_games': 2,
+    'games': [
+        {
+            'url': 'https://hurstathletics.com/sports/football/stats/2024/wheeling-university/boxscore/14044',
+            'opponent': 'Wheeling University',
+            'date': 'Unknown',
+            'display_name': 'vs Wheeling University',
+            'aliases': ['Wheeling']
+        },
+        {
+            'url': 'https://hurstathletics.com/sports/football/stats/2024/gannon-university/boxscore/14050',
+            'opponent': 'Gannon University',
+            'date': 'Unknown',
+            'display_name': 'vs Gannon University'
+        }
+    ]
+}
+
+def write_game(data_dir, opponent_name, drives):
+    path = os.path.join(data_dir, 'games_data', f"game_{app.game_slug(opponent_name)}.json")
+    with open(path, 'w') as f:
+        json.dump(drives, f, indent=2)
+    return path
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """
+    A two-game default season, served by the app with every cache empty
+    """
+    os.makedirs(tmp_path / 'games_data')
+    with open(tmp_path / 'games_index.json', 'w') as f:
+        json.dump(INDEX, f)
+    write_game(str(tmp_path), 'Wheeling University', WHEELING)
+    write_game(str(tmp_path), 'Gannon University', GANNON)
+
+    monkeypatch.setattr(app, 'DATA_DIR', str(tmp_path))
+    app._games_index_cache.clear()
+    app._game_cache.clear()
+    app.clear_figure_cache()
+    yield str(tmp_path)
+    app._games_index_cache.clear()
+    app._game_cache.clear()
+    app.clear_figure_cache()
+
+# Downsampling
+
+@pytest.mark.parametrize('n', [3, 10, 101, 1000])
+@pytest.mark.parametrize('max_points', [3, 4, 10, 50])
+def test_downsample_bounds_and_endpoints(n, max_points):
+    xs = list(range(n))
+    ys = [(i * 7919) % 31 for i in range(n)]
+    indices = downsample_indices(xs, ys, max_points)
+
+    assert indices[0] == 0
+    assert indices[-1] == n - 1
+    assert indices == sorted(set(indices))
+    assert len(indices) == min(n, max_points)
+
+def test_downsample_keeps_everything_within_budget():
+    assert downsample_indices([0, 1, 2], [0, 5, 0], 10) == [0, 1, 2]
+    assert downsample_indices([0, 1, 2], [0, 5, 0], None) == [0, 1, 2]
+
+def test_downsample_keeps_pinned_points_over_budget():
+    xs = list(range(100))
+    ys = [0] * 100
+    pinned = [10, 20, 30, 40, 50]
+    indices = downsample_indices(xs, ys, 4, must_include=pinned)
+    assert set(pinned) <= set(indices)
+    assert indices[0] == 0 and indices[-1] == 99
+
+def test_lttb_keeps_spike():
+    ys = [0] * 50
+    ys[25] = 100
+    assert 25 in lttb_indices(list(range(50)), ys, 5)
+
+def test_lttb_small_threshold_keeps_endpoints():
+    assert lttb_indices(list(range(10)), [0] * 10, 2) == [0, 9]
+
+def test_plot_budget(data_dir):
+    record = app.load_game_record('Wheeling University')  # 4 scoring drives plus start and end
+    assert app.plot_budget(record, None) is None
+    assert app.plot_budget(record, 6) is None  # already fits, shares the full figure
+    assert app.plot_budget(record, 5) == 5
+    assert app.plot_budget(record, 1) == app.MIN_PLOT_POINTS
+
+def test_downsample_plot_points_keeps_score_changes():
+    # A drive every minute, with a field goal at minutes 20 and 40
+    plot_data = []
+    for minute in range(61):
+        mercyhurst = 3 * (minute >= 20) + 3 * (minute >= 40)
+        plot_data.append((minute, mercyhurst, mercyhurst, 0, 'Mercyhurst', 'Punt'))
+
+    kept = app.downsample_plot_points(plot_data, 8)
+    minutes = [point[0] for point in kept]
+    assert len(kept) <= 8
+    assert {0, 19, 20, 39, 40, 60} <= set(minutes)
+    assert minutes == sorted(minutes)
+    assert app.downsample_plot_points(plot_data, None) is plot_data
+
+def test_plot_route_downsamples(data_dir):
+    client = app.app.test_client()
+    headers = {'Accept-Encoding': 'identity'}
+    full = client.get('/api/plot?opponent=Wheeling University', headers=headers)
+    fits = client.get('/api/plot?opponent=Wheeling University&max_points=50', headers=headers)
+    assert fits.get_data() == full.get_data()
+
+    # Every Wheeling point changes the score, so none can be dropped
+    reduced = client.get('/api/plot?opponent=Wheeling University&max_points=3', headers=headers).get_json()
+    assert reduced['success']
+    assert len(json.loads(reduced['plot'])['data'][0]['x']) == 6
+
+# Game cache
+
+def test_game_cache_hits_until_the_file_changes(data_dir):
+    app.clear_game_cache()
+    first = app.load_game_record('Wheeling University')
+    assert app.load_game_record('Wheeling University') is first
+    assert app.get_game_cache_stats()['hits'] == 1
+
+    write_game(data_dir, 'Wheeling University', WHEELING[:-2] + WHEELING[-1:])
+    changed = app.load_game_record('Wheeling University')
+    assert changed is not first
+    assert len(changed['data']) == len(WHEELING) - 1
+    assert app.get_game_cache_stats()['misses'] == 2
+
+def test_game_cache_evicts_least_recently_used(data_dir, monkeypatch):
+    monkeypatch.setattr(app, 'GAME_CACHE_SIZE', 1)
+    app.clear_game_cache()
+    app.load_game_record('Wheeling University')
+    app.load_game_record('Gannon University')
+    stats = app.get_game_cache_stats()
+    assert (stats['size'], stats['evictions']) == (1, 1)
+
+    # Only Gannon is still cached
+    app.load_game_record('Gannon University')
+    assert app.get_game_cache_stats()['hits'] == 1
+
+def test_uncached_load_does_not_fill_the_cache(data_dir):
+    app.clear_game_cache()
+    app.load_game_record('Wheeling University', cache=False)
+    assert app.get_game_cache_stats()['size'] == 0
+
+# Figure cache
+
+def test_figure_cache_keyed_by_game_version(data_dir):
+    client = app.app.test_client()
+    url = '/api/plot?opponent=Wheeling University'
+    first = client.get(url).get_data()
+    assert client.get(url).get_data() == first
+    stats = app.get_figure_cache_stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+
+    write_game(data_dir, 'Wheeling University', WHEELING[:-2] + WHEELING[-1:])
+    assert client.get(url).get_data() != first
+    assert app.get_figure_cache_stats()['misses'] == 2
+
+def test_figure_cache_evicts_least_recently_used(data_dir, monkeypatch):
+    monkeypatch.setattr(app, 'FIGURE_CACHE_SIZE', 1)
+    client = app.app.test_client()
+    client.get('/api/plot?opponent=Wheeling University')
+    client.get('/api/plot?opponent=Gannon University')
+    stats = app.get_figure_cache_stats()
+    assert (stats['size'], stats['evictions']) == (1, 1)
+
+# ETags and 304s
+
+def test_etag_not_modified(data_dir):
+    client = app.app.test_client()
+    url = '/api/drive-data?opponent=Wheeling University'
+    response = client.get(url)
+    etag = response.headers['ETag']
+    assert response.status_code == 200 and etag
+
+    cached = client.get(url, headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.get_data() == b''
+    assert cached.headers['ETag'] == etag
+
+    # Aliases share the canonical game's ETag
+    assert client.get('/api/drive-data?opponent=14044', headers={'If-None-Match': etag}).status_code == 304
+
+    write_game(data_dir, 'Wheeling University', WHEELING[:-2] + WHEELING[-1:])
+    changed = client.get(url, headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+
+def test_etag_varies_by_encoding(data_dir):
+    client = app.app.test_client()
+    plain = client.get('/api/plot?opponent=Gannon University', headers={'Accept-Encoding': 'identity'})
+    gzipped = client.get('/api/plot?opponent=Gannon University', headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.headers['Content-Encoding'] == 'gzip'
+    assert plain.headers['ETag'] != gzipped.headers['ETag']
+    assert client.get(
+        '/api/plot?opponent=Gannon University',
+        headers={'Accept-Encoding': 'gzip', 'If-None-Match': gzipped.headers['ETag']}
+    ).status_code == 304
+
+# Season bundle
+
+def test_bundle_round_trip(data_dir, tmp_path):
+    bundle_path = str(tmp_path / 'season.bundle')
+    games, drives = build_bundle(data_dir, bundle_path)
+    assert (games, drives) == (2, len(WHEELING) + len(GANNON))
+
+    bundle = SeasonBundle(bundle_path)
+    for opponent_name, expected in (('Wheeling University', WHEELING), ('Gannon University', GANNON)):
+        record = bundle.game_record(opponent_name)
+        assert record['data'].to_records() == expected
+        assert record['version'] == app.load_game_record(opponent_name)['version']
+    assert bundle.game_record('Nobody') is None
+
+def test_stale_bundle_falls_back_to_json(data_dir, tmp_path, monkeypatch):
+    bundle_path = str(tmp_path / 'season.bundle')
+    build_bundle(data_dir, bundle_path)
+    monkeypatch.setattr(app, 'SEASON_BUNDLE', bundle_path)
+    monkeypatch.setattr(app, '_bundle_state', {})
+    assert isinstance(app.load_game_record('Wheeling University')['data'].elapsed_seconds, memoryview)
+
+    # A re-scrape rewrites the game files, then games_index.json
+    write_game(data_dir, 'Wheeling University', WHEELING[:-2] + WHEELING[-1:])
+    bundle_mtime = os.stat(bundle_path).st_mtime_ns
+    index_path = os.path.join(data_dir, 'games_index.json')
+    os.utime(index_path, ns=(bundle_mtime + 10**9, bundle_mtime + 10**9))
+    record = app.load_game_record('Wheeling University')
+    assert len(record['data']) == len(WHEELING) - 1
+    assert not isinstance(record['data'].elapsed_seconds, memoryview)
+
+    # Rebuilding the bundle makes it current again
+    build_bundle(data_dir, bundle_path)
+    os.utime(bundle_path, ns=(bundle_mtime + 2 * 10**9, bundle_mtime + 2 * 10**9))
+    record = app.load_game_record('Wheeling University')
+    assert len(record['data']) == len(WHEELING) - 1
+    assert isinstance(record['data'].elapsed_seconds, memoryview)
+
+# Drive store queries
+
+@pytest.fixture
+def store(data_dir, tmp_path):
+    db_path = str(tmp_path / 'drives.sqlite3')
+    assert drive_store.populate_store(db_path, data_dir) == (2, 0)
+    assert drive_store.populate_store(db_path, data_dir) == (0, 2)
+    conn = drive_store.connect(db_path, readonly=True)
+    yield conn
+    conn.close()
+
+def test_query_drives_filters(store):
+    assert drive_store.query_drives(store)['total'] == len(WHEELING) + len(GANNON)
+    assert drive_store.query_drives(store, opponent='Gannon University')['total'] == len(GANNON)
+
+    mercyhurst = drive_store.query_drives(store, team='mercyhurst')
+    assert mercyhurst['total'] == 3
+    assert all(row['team'] == 'Mercyhurst' for row in mercyhurst['drives'])
+
+    opponents = drive_store.query_drives(store, team='opponent', result='Touchdown')
+    assert [(row['opponent'], row['elapsed_seconds']) for row in opponents['drives']] == [
+        ('Wheeling University', 3000), ('Gannon University', 500)
+    ]
+
+    assert drive_store.query_drives(store, quarter=4, result='Field Goal')['total'] == 1
+    assert drive_store.query_drives(store, min_elapsed=1000, max_elapsed=2000)['total'] == 2
+
+def test_query_drives_paging_and_groups(store):
+    page = drive_store.query_drives(store, limit=2, offset=1)
+    assert (page['limit'], page['offset'], len(page['drives'])) == (2, 1, 2)
+    assert page['drives'][0]['elapsed_seconds'] == 300
+
+    groups = drive_store.query_drives(store, result='Touchdown', group_by='team')['groups']
+    assert {group['value']: group['drives'] for group in groups} == {
+        'Mercyhurst': 2, 'Wheeling University': 1, 'Gannon University': 1
+    }
+    with pytest.raises(ValueError):
+        drive_store.query_drives(store, group_by='play_description')
+
+@pytest.fixture
+def query_client(store, tmp_path, monkeypatch):
+    """
+    A test client whose /api/drives/query reads the store fixture's database
+    """
+    monkeypatch.setattr(app, 'DRIVE_STORE', str(tmp_path / 'drives.sqlite3'))
+    monkeypatch.setattr(app._drive_store_local, 'conn', None, raising=False)
+    return app.app.test_client()
+
+# Game registry
+
+def test_registry_accepts_every_spelling():
+    registry = app.build_game_registry(INDEX)
+    for name in ('Wheeling University', 'vs Wheeling University', 'wheeling_university',
+                 'wheeling-university', '14044', 'Wheeling', 'WHEELING UNIVERSITY'):
+        assert registry[name.lower()]['opponent'] == 'Wheeling University'
+    assert registry['14050']['opponent'] == 'Gannon University'
+    assert 'nobody' not in registry
+
+def test_resolve_game(data_dir):
+    assert app.resolve_game(' 14044 ')['filename'] == 'game_wheeling_university.json'
+    assert app.canonical_opponent('gannon-university') == 'Gannon University'
+    assert app.resolve_game('../games_index') is None
+    assert app.load_game_record('Nobody') is None
+
+def test_drives_query_resolves_opponent(query_client):
+    result = query_client.get('/api/drives/query?opponent=14044').get_json()
+    assert result['success'] and result['total'] == len(WHEELING)
+    unknown = query_client.get('/api/drives/query?opponent=Nobody').get_json()
+    assert not unknown['success']
+
+# Drive filters
+
+def stream_lines(client, query):
+    response = client.get(f'/api/drives/stream?{query}')
+    assert response.mimetype == 'application/x-ndjson'
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+def test_drive_stream_filters(data_dir):
+    client = app.app.test_client()
+    assert len(stream_lines(client, '')) == len(WHEELING) + len(GANNON)
+
+    fourth = stream_lines(client, 'quarter=4&result=Touchdown')
+    assert [(row['opponent'], row['elapsed_seconds']) for row in fourth] == [('Wheeling University', 3000)]
+
+    gannon = stream_lines(client, 'opponents=14050&team=mercyhurst')
+    assert [row['result'] for row in gannon] == ['Field Goal']
+    assert all(row['opponent'] == 'Gannon University' for row in gannon)
+
+    window = stream_lines(client, 'min_elapsed=1000&max_elapsed=2000')
+    assert [row['elapsed_seconds'] for row in window] == [1200, 2000]
+
+@pytest.mark.parametrize('query', ['quarter=abc', 'min_elapsed=1.5', 'max_elapsed=late'])
+def test_invalid_drive_filters_are_rejected(data_dir, query_client, query):
+    stream = app.app.test_client().get(f'/api/drives/stream?{query}').get_json()
+    assert not stream['success']
+    assert query.split('=')[0] in stream['error']
+
+    result = query_client.get(f'/api/drives/query?{query}').get_json()
+    assert not result['success']
+    assert query.split('=')[0] in result['error']
+
+# Live game diff
+
+def sse_events(messages):
+    events = []
+    for message in messages:
+        event, data = message.strip().split('\n')
+        events.append((event[len('event: '):], json.loads(data[len('data: '):])))
+    return events
+
+def rescrape(data_dir, scoring):
+    """
+    Rewrite Wheeling's file like a scraper re-run and return the new record
+    """
+    write_game(data_dir, 'Wheeling University', scraped_game('Wheeling University', scoring))
+    return app.load_game_record('Wheeling University')
+
+def test_live_diff_appends_new_scoring_drives(data_dir):
+    previous = app.load_game_record('Wheeling University')
+    new_drive = drive(4, 3300, 'Mercyhurst', 'Field Goal', 17, 10)
+    record = rescrape(data_dir, WHEELING[1:-1] + [new_drive])
+
+    events = sse_events(app.LiveGameFeed('Wheeling University').diff(previous, record))
+    assert [event for event, _ in events] == ['drives', 'summary']
+
+    update = events[0][1]
+    assert update['base_version'] == previous['version']
+    assert update['version'] == record['version']
+    assert update['drives'] == [new_drive]
+    assert update['points']['elapsed_seconds'] == [3300]
+    assert update['points']['differential'] == [7]
+    assert update['end_drive']['team'] == 'Game End'
+    assert (update['end_drive']['mercyhurst_score'], update['end_drive']['opponent_score']) == (17, 10)
+    assert update['end_point'] == {'elapsed_seconds': 3600, 'differential': 7, 'mercyhurst_score': 17, 'opponent_score': 10}
+
+def test_live_diff_resets_when_earlier_drives_change(data_dir):
+    previous = app.load_game_record('Wheeling University')
+    edited = [dict(WHEELING[1], elapsed_seconds=301)] + WHEELING[2:-1]
+    record = rescrape(data_dir, edited)
+
+    events = sse_events(app.LiveGameFeed('Wheeling University').diff(previous, record))
+    assert events == [('reset', {'version': record['version']})]
+
+def test_live_subscribe_reloads_stale_record(data_dir, monkeypatch):
+    monkeypatch.setattr(app, 'LIVE_POLL_INTERVAL', 0.01)
+    feed = app.LiveGameFeed('Wheeling University')
+    feed.record = app.load_game_record('Wheeling University')  # left over from an earlier poller
+    current = rescrape(data_dir, WHEELING[1:-1] + [drive(4, 3300, 'Mercyhurst', 'Field Goal', 17, 10)])
+
+    subscriber = feed.subscribe()
+    poller = feed.thread
+    try:
+        (event, snapshot), = sse_events([subscriber.get(timeout=1)])
+        assert event == 'snapshot'
+        assert snapshot['version'] == current['version']
+        assert snapshot['total_drives'] == len(current['data'])
+    finally:
+        feed.unsubscribe(subscriber)
+        poller.join(timeout=1)
+
+# Comparison grid
+
+def test_sparkline_step_path():
+    # 240x80 box over -10..10: y = (10 - differential) * 4
+    assert sparkline.step_path([(0, 0), (15, 7), (30, 7), (60, -2)], [-10, 10]) == 'M0 40H60V12H120H240V48'
+
+def test_render_sparkline_escapes_title():
+    svg = sparkline.render_sparkline([(0, 0), (60, 3)], [-10, 10], title='vs A&M <Aggies>')
+    assert svg.startswith('<svg ') and svg.endswith('</svg>')
+    assert '<title>vs A&amp;M &lt;Aggies&gt;</title>' in svg
+    assert 'stroke-dasharray' in svg  # tied-score line
+
+def test_comparison_grid_shares_y_range(data_dir):
+    result = app.app.test_client().get('/api/comparison-grid', headers={'Accept-Encoding': 'identity'}).get_json()
+    assert result['success']
+    # Differentials run from -7 (Gannon) to 11 (Wheeling), padded by 2
+    assert result['y_range'] == [-9, 13]
+    assert [(game['opponent'], game['final_differential']) for game in result['games']] == [
+        ('Wheeling University', 4), ('Gannon University', -4)
+    ]
+    assert all(game['svg'].startswith('<svg ') for game in result['games'])
+
+# Metrics
+
+def test_metrics_render():
+    counter = metrics.Counter('test_requests_total', 'Requests', ('route',))
+    counter.inc('/a')
+    counter.inc('/a', amount=2)
+    counter.inc('/b "quoted"')
+    histogram = metrics.Histogram('test_seconds', 'Latency', buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    registry = metrics.Registry()
+    registry.register(counter)
+    registry.register(histogram)
+    lines = registry.render().splitlines()
+    assert 'test_requests_total{route="/a"} 3' in lines
+    assert 'test_requests_total{route="/b \\"quoted\\""} 1' in lines
+    assert [line for line in lines if line.startswith('test_seconds_bucket')] == [
+        'test_seconds_bucket{le="0.1"} 1', 'test_seconds_bucket{le="1"} 2', 'test_seconds_bucket{le="+Inf"} 3'
+    ]
+    assert 'test_seconds_count 3' in lines
+
+def test_phases_do_not_nest():
+    token = metrics.start_request('/test/phases')
+    try:
+        with metrics.phase('load'):
+            with metrics.phase('encode'):
+                pass
+    finally:
+        metrics.end_request(token)
+    lines = metrics.PHASE_SECONDS.render()
+    assert 'drive_api_request_phase_seconds_count{route="/test/phases",phase="load"} 1' in lines
+    assert not any('route="/test/phases",phase="encode"' in line for line in lines)
+
+def test_error_response_counts_long_errors():
+    message = 'x' * 2000
+    with app.app.test_request_context('/api/plot'):
+        g.metrics = ('/test/errors', 0, None)
+        response = app.error_response(message)
+        app.error_response('boom', 'exception', data=[])
+    assert response.get_json() == {'success': False, 'error': message}
+    lines = app.REQUEST_ERRORS.render()
+    assert 'drive_api_request_errors_total{route="/test/errors",reason="failed"} 1' in lines
+    assert 'drive_api_request_errors_total{route="/test/errors",reason="exception"} 1' in lines
+
+# Seasons
+
+@pytest.fixture
+def two_seasons(data_dir):
+    """
+    The default season plus an earlier one under seasons/<season>/
+    """
+    season = str(int(app.DEFAULT_SEASON) - 1)
+    partition = os.path.join(data_dir, 'seasons', season)
+    os.makedirs(os.path.join(partition, 'games_data'))
+    with open(os.path.join(partition, 'games_index.json'), 'w') as f:
+        json.dump({'total_games': 1, 'successful_games': 1, 'games': [INDEX['games'][1]]}, f)
+    write_game(partition, 'Gannon University', scraped_game('Gannon University', [
+        drive(2, 1500, 'Mercyhurst', 'Touchdown', 7, 0)
+    ]))
+    return season
+
+def test_seasons_are_listed_newest_first(two_seasons):
+    result = app.app.test_client().get('/api/seasons').get_json()
+    assert result['seasons'] == [app.DEFAULT_SEASON, two_seasons]
+    assert result['default'] == app.DEFAULT_SEASON
+
+def test_season_parameter_selects_the_partition(two_seasons):
+    client = app.app.test_client()
+    games = client.get(f'/api/games?season={two_seasons}').get_json()['games']
+    assert [game['opponent'] for game in games] == ['Gannon University']
+
+    url = '/api/drive-data?opponent=Gannon University'
+    earlier = client.get(f'{url}&season={two_seasons}')
+    current = client.get(url)
+    assert earlier.get_json()['summary'] != current.get_json()['summary']
+    assert earlier.headers['ETag'] != current.headers['ETag']
+    assert client.get(f'{url}&season={app.DEFAULT_SEASON}').get_data() == current.get_data()
+
+    # Games only exist in the seasons that list them
+    assert not client.get(f'/api/drive-data?opponent=14044&season={two_seasons}').get_json()['data']
+
+@pytest.mark.parametrize('season', ['1999', '../games_data', 'latest'])
+def test_unknown_season_is_rejected(two_seasons, season):
+    result = app.app.test_client().get(f'/api/games?season={season}').get_json()
+    assert not result['success']
+    assert result['error'] == f'Unknown season {season}'
+
+def test_default_season_partition_replaces_top_level(tmp_path):
+    assert seasons.season_dir(str(tmp_path), seasons.DEFAULT_SEASON) == str(tmp_path)
+    partition = tmp_path / 'seasons' / seasons.DEFAULT_SEASON
+    os.makedirs(partition)
+    assert seasons.season_dir(str(tmp_path), seasons.DEFAULT_SEASON) == str(partition)
+    assert seasons.season_dir(str(tmp_path), '1999') == str(tmp_path / 'seasons' / '1999')